@@ -22,7 +22,7 @@ def _get_env_var_as_int(name: str, default: str) -> int:
     """安全地从环境变量获取整数值，移除行内注释。"""
     value_str = os.getenv(name, default)
     # 移除注释和两边的空格
-    cleaned_value = value_str.split("#")[0].strip()
+    cleaned_value = value_str.partition("#")[0].strip()
     return int(cleaned_value)
 
 
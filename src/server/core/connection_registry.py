@@ -6,6 +6,7 @@
 from typing import Dict, Any, Optional
 import threading
 import logging
+import time
 
 from ...config.settings import get_settings
 from .connections import (
@@ -18,6 +19,9 @@ from .connections import (
 
 logger = logging.getLogger(__name__)
 
+# 健康检查最小间隔（秒）：间隔内复用上次检查结果，避免每次获取客户端都发起探测请求
+HEALTH_CHECK_INTERVAL = 60
+
 
 class ConnectionRegistry:
     """
@@ -50,6 +54,10 @@ class ConnectionRegistry:
 
         self._connections: Dict[str, DataSourceConnection] = {}
         self._config = get_settings()
+        # 各连接最近一次健康检查通过的时间（time.monotonic）
+        self._last_healthy_at: Dict[str, float] = {}
+        # 串行化连接初始化，避免并发请求重复建连
+        self._init_lock = threading.RLock()
         self._initialized = True
 
         logger.info("✅ ConnectionRegistry 初始化完成")
@@ -92,16 +100,12 @@ class ConnectionRegistry:
             ConnectionError: 连接失败时抛出
         """
         if "tushare" not in self._connections:
-            if not self._init_tushare():
-                raise ConnectionError("Tushare 连接初始化失败")
+            with self._init_lock:
+                if not self._init_tushare():
+                    raise ConnectionError("Tushare 连接初始化失败")
 
         conn = self._connections["tushare"]
-
-        # 健康检查
-        if not conn.is_healthy():
-            logger.warning("⚠️ Tushare 连接不健康，尝试重连")
-            if not conn.reconnect():
-                raise ConnectionError("Tushare 重连失败")
+        self._ensure_healthy("tushare", "Tushare", conn)
 
         return conn.get_client()
 
@@ -146,16 +150,12 @@ class ConnectionRegistry:
             ConnectionError: 连接失败时抛出
         """
         if "tdx" not in self._connections:
-            if not self._init_tdx():
-                raise ConnectionError("TDX 连接初始化失败")
+            with self._init_lock:
+                if not self._init_tdx():
+                    raise ConnectionError("TDX 连接初始化失败")
 
         conn = self._connections["tdx"]
-
-        # 健康检查
-        if not conn.is_healthy():
-            logger.warning("⚠️ TDX 连接不健康，尝试重连")
-            if not conn.reconnect():
-                raise ConnectionError("TDX 重连失败")
+        self._ensure_healthy("tdx", "TDX", conn)
 
         return conn.get_client()
 
@@ -206,16 +206,12 @@ class ConnectionRegistry:
             ConnectionError: 连接失败时抛出
         """
         if "mysql" not in self._connections:
-            if not self._init_mysql():
-                raise ConnectionError("MySQL 连接初始化失败")
+            with self._init_lock:
+                if not self._init_mysql():
+                    raise ConnectionError("MySQL 连接初始化失败")
 
         conn = self._connections["mysql"]
-
-        # 健康检查
-        if not conn.is_healthy():
-            logger.warning("⚠️ MySQL 连接不健康，尝试重连")
-            if not conn.reconnect():
-                raise ConnectionError("MySQL 重连失败")
+        self._ensure_healthy("mysql", "MySQL", conn)
 
         return conn
 
@@ -265,21 +261,36 @@ class ConnectionRegistry:
             ConnectionError: 连接失败时抛出
         """
         if "redis" not in self._connections:
-            if not self._init_redis():
-                raise ConnectionError("Redis 连接初始化失败")
+            with self._init_lock:
+                if not self._init_redis():
+                    raise ConnectionError("Redis 连接初始化失败")
 
         conn = self._connections["redis"]
-
-        # 健康检查
-        if not conn.is_healthy():
-            logger.warning("⚠️ Redis 连接不健康，尝试重连")
-            if not conn.reconnect():
-                raise ConnectionError("Redis 重连失败")
+        self._ensure_healthy("redis", "Redis", conn)
 
         return conn
 
     # ==================== 通用方法 ====================
 
+    def _ensure_healthy(self, name: str, label: str, conn: DataSourceConnection):
+        """
+        按 HEALTH_CHECK_INTERVAL 节流的健康检查，不健康时尝试重连
+
+        Raises:
+            ConnectionError: 重连失败时抛出
+        """
+        now = time.monotonic()
+        if now - self._last_healthy_at.get(name, float("-inf")) < HEALTH_CHECK_INTERVAL:
+            return
+
+        if not conn.is_healthy():
+            logger.warning(f"⚠️ {label} 连接不健康，尝试重连")
+            if not conn.reconnect():
+                self._last_healthy_at.pop(name, None)
+                raise ConnectionError(f"{label} 重连失败")
+
+        self._last_healthy_at[name] = now
+
     def get_connection(self, source: str) -> Optional[DataSourceConnection]:
         """
         获取指定数据源连接
@@ -349,6 +360,7 @@ class ConnectionRegistry:
                 logger.error(f"❌ {name} 关闭失败: {e}")
 
         self._connections.clear()
+        self._last_healthy_at.clear()
         logger.info("✅ 所有连接已关闭")
 
     def get_stats(self) -> Dict[str, Any]:
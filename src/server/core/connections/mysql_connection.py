@@ -256,10 +256,8 @@ class MySQLConnection(DataSourceConnection):
                 f"INSERT INTO {table_name} ({columns_str}) " f"VALUES ({placeholders})"
             )
 
-            # 转换 DataFrame 为数据列表
-            data_list = []
-            for _, row in df.iterrows():
-                data_list.append(tuple(row.values))
+            # 转换 DataFrame 为数据列表（一次性按列取出，避免逐行构造Series）
+            data_list = list(df.itertuples(index=False, name=None))
 
             # 批量插入
             self._batch_insert(insert_sql, data_list)
@@ -14,6 +14,12 @@ except ImportError:
     redis = None
     ConnectionPool = None
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import DataSourceConnection
 
 logger = logging.getLogger(__name__)
@@ -185,7 +191,7 @@ class RedisConnection(DataSourceConnection):
         try:
             value = self._client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value) if orjson else json.loads(value)
             return None
         except Exception as e:
             logger.error(f"❌ Redis GET JSON 失败: {e}")
@@ -204,7 +210,12 @@ class RedisConnection(DataSourceConnection):
             bool: 是否设置成功
         """
         try:
-            json_value = json.dumps(value, ensure_ascii=False)
+            if orjson is not None:
+                json_value = orjson.dumps(
+                    value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                json_value = json.dumps(value, ensure_ascii=False)
             return self._client.set(key, json_value, ex=ex)
         except Exception as e:
             logger.error(f"❌ Redis SET JSON 失败: {e}")
@@ -4,17 +4,50 @@ Tushare 数据源连接管理
 
 from typing import Dict, Any
 from datetime import datetime
+import importlib.util
 import logging
 
 try:
-    import tushare as ts
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
-    ts = None
+    requests = None
+    HTTPAdapter = None
+    Retry = None
 
 from .base import DataSourceConnection
 
 logger = logging.getLogger(__name__)
 
+# Tushare HTTP 连接池大小，与服务层的并发线程数相匹配
+TUSHARE_POOL_MAXSIZE = 16
+
+
+def _install_pooled_session(ts_client) -> None:
+    """
+    让 Tushare 客户端复用持久 HTTP 会话
+
+    tushare.pro.client.DataApi 每次查询都调用模块级 requests.post，
+    每个请求都要重新进行 TCP+TLS 握手。这里将该模块引用的 requests
+    替换为带连接池的 Session（其 post 签名兼容），使后续查询复用连接。
+    """
+    if requests is None or HTTPAdapter is None:
+        return
+    if isinstance(getattr(ts_client, "requests", None), requests.Session):
+        return
+
+    adapter = HTTPAdapter(
+        pool_connections=TUSHARE_POOL_MAXSIZE,
+        pool_maxsize=TUSHARE_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    ts_client.requests = session
+    logger.info(f"🔧 Tushare HTTP 连接池已启用: maxsize={TUSHARE_POOL_MAXSIZE}")
+
 
 class TushareConnection(DataSourceConnection):
     """Tushare 数据源连接"""
@@ -36,7 +69,8 @@ class TushareConnection(DataSourceConnection):
             logger.error("❌ Tushare token 未配置")
             raise ValueError("Tushare token 未配置")
 
-        if ts is None:
+        # 只检查是否安装，tushare（连带 pandas）延迟到 connect 时才导入
+        if importlib.util.find_spec("tushare") is None:
             logger.error("❌ tushare 库未安装")
             raise ImportError("tushare 库未安装，请执行: pip install tushare")
 
@@ -45,9 +79,15 @@ class TushareConnection(DataSourceConnection):
         try:
             logger.info("🔄 正在连接 Tushare API...")
 
+            import tushare as ts
+            from tushare.pro import client as ts_client
+
             # 设置 token
             ts.set_token(self.token)
 
+            # 复用 HTTP 连接，避免每次查询重新握手
+            _install_pooled_session(ts_client)
+
             # 创建 pro_api 实例
             self._client = ts.pro_api()
 
@@ -8,6 +8,7 @@ import logging
 import sys
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 # 导入本地服务
@@ -16,7 +17,7 @@ from .services.fundamentals_service import FundamentalsService
 from .services.market_service import MarketDataService
 from .services.new_service import get_news_service
 from .services.tavily_service import TavilyService
-from .services.quote_service import QuoteService
+from .services.quote_service import get_quote_service
 from .services.calendar_service import CalendarService
 from .services.macro.macro_service import get_macro_service
 from .utils.redis_cache import get_redis_cache
@@ -30,6 +31,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 深度研究时并发获取多只股票基本面的最大线程数
+RESEARCH_FUNDAMENTALS_WORKERS = 4
+
+# 需要移除的控制字符（保留换行、回车、制表符），模块加载时编译一次
+CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+
 # 重定向print到stderr，避免污染MCP的stdout
 _original_print = builtins.print
 builtins.print = partial(_original_print, file=sys.stderr)
@@ -47,7 +54,7 @@ def sanitize_string(text):
         return text
     
     # 移除控制字符（除了换行、回车、制表符）
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+    text = CONTROL_CHARS_RE.sub('', text)
     
     # 确保字符串是有效的 UTF-8
     try:
@@ -115,34 +122,19 @@ def safe_json_response(data, max_length=100000):
 
 def clean_dataframe_for_json(df):
     """清理DataFrame中的无效浮点数值，使其符合JSON标准"""
-    import pandas as pd
     import numpy as np
     
     if df.empty:
         return []
 
     try:
-        df_cleaned = df.copy()
-        df_cleaned = df_cleaned.replace([np.inf, -np.inf], None)
-        df_cleaned = df_cleaned.where(pd.notna(df_cleaned), None)
-        records = df_cleaned.to_dict("records")
-
-        cleaned_records = []
-        for record in records:
-            cleaned_record = {}
-            for key, value in record.items():
-                if value is None:
-                    cleaned_record[key] = None
-                elif isinstance(value, (int, float)):
-                    if np.isnan(value) or np.isinf(value):
-                        cleaned_record[key] = None
-                    else:
-                        cleaned_record[key] = value
-                else:
-                    cleaned_record[key] = value
-            cleaned_records.append(cleaned_record)
+        # 整表向量化处理：无穷大先视为缺失值，再转为object列统一替换为None；
+        # 浮点列中的None不会被还原成NaN，因此无需再逐个单元格做isnan/isinf检查，
+        # Python层只剩下构造记录字典
+        df_cleaned = df.replace([np.inf, -np.inf], np.nan)
+        df_cleaned = df_cleaned.astype(object).where(df_cleaned.notna(), None)
 
-        return cleaned_records
+        return df_cleaned.to_dict("records")
 
     except Exception as e:
         logger.error(f"❌ 清理DataFrame失败: {e}")
@@ -194,7 +186,7 @@ class StockMCPServer:
             self.tavily_service = None
 
         try:
-            self.quote_service = QuoteService()
+            self.quote_service = get_quote_service()
             logger.info("✅ 行情服务初始化成功")
         except Exception as e:
             logger.error(f"❌ 行情服务初始化失败: {e}")
@@ -1060,21 +1052,13 @@ class StockMCPServer:
         ]:
             return topic
 
-        # 获取内部基本面数据以丰富查询
+        # 获取内部基本面数据以丰富查询（多只股票并发获取，结果保持输入顺序）
         internal_data_summary = []
         if self.fundamentals_service:
-            for symbol in symbols:
-                try:
-                    data = self.fundamentals_service.get_fundamental_data(symbol)
-                    summary = (
-                        f"{data.company_name}({symbol}): "
-                        f"市值 {self.fundamentals_service._format_number(data.market_cap)}元, "
-                        f"P/E {data.pe_ratio:.2f}, "
-                        f"ROE {data.roe:.2f}%"
-                    )
-                    internal_data_summary.append(summary)
-                except Exception as e:
-                    logger.warning(f"获取 {symbol} 内部数据失败: {e}")
+            workers = min(len(symbols), RESEARCH_FUNDAMENTALS_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                summaries = executor.map(self._summarize_fundamentals, symbols)
+                internal_data_summary = [s for s in summaries if s]
 
         internal_summary_str = "; ".join(internal_data_summary)
 
@@ -1092,6 +1076,20 @@ class StockMCPServer:
 
         return topic
 
+    def _summarize_fundamentals(self, symbol: str):
+        """获取单只股票的基本面摘要，失败时返回 None"""
+        try:
+            data = self.fundamentals_service.get_fundamental_data(symbol)
+            return (
+                f"{data.company_name}({symbol}): "
+                f"市值 {self.fundamentals_service._format_number(data.market_cap)}元, "
+                f"P/E {data.pe_ratio:.2f}, "
+                f"ROE {data.roe:.2f}%"
+            )
+        except Exception as e:
+            logger.warning(f"获取 {symbol} 内部数据失败: {e}")
+            return None
+
     def _format_research_report(self, topic: str, search_result: dict) -> str:
         """格式化深度研究报告"""
         report = f"# 深度研究报告: {topic}\n\n"
@@ -12,7 +12,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 # 导入服务
-from ..services.quote_service import QuoteService, StockMarketDataDTO
+from ..services.quote_service import get_quote_service, StockMarketDataDTO
 from ..services.calendar_service import CalendarService
 from ..services.macro.macro_service import get_macro_service
 
@@ -41,36 +41,12 @@ def clean_dataframe_for_json(df: pd.DataFrame) -> list:
         return []
 
     try:
-        # 清理无效的浮点数值
-        df_cleaned = df.copy()
-
-        # 处理无穷大值
-        df_cleaned = df_cleaned.replace([np.inf, -np.inf], None)
-
-        # 将NaN替换为None
-        df_cleaned = df_cleaned.where(pd.notna(df_cleaned), None)
-
-        # 转换为dict列表
-        records = df_cleaned.to_dict("records")
-
-        # 进一步清理每个记录中的数值
-        cleaned_records = []
-        for record in records:
-            cleaned_record = {}
-            for key, value in record.items():
-                if value is None:
-                    cleaned_record[key] = None
-                elif isinstance(value, (int, float)):
-                    # 检查是否是有效的JSON数值
-                    if np.isnan(value) or np.isinf(value):
-                        cleaned_record[key] = None
-                    else:
-                        cleaned_record[key] = value
-                else:
-                    cleaned_record[key] = value
-            cleaned_records.append(cleaned_record)
-
-        return cleaned_records
+        # 整表处理：无穷大视为缺失值，再转为object列统一替换为None，
+        # 避免浮点列中的None被重新转换回NaN，也无需逐个单元格检查
+        df_cleaned = df.replace([np.inf, -np.inf], np.nan)
+        df_cleaned = df_cleaned.astype(object).where(df_cleaned.notna(), None)
+
+        return df_cleaned.to_dict("records")
 
     except Exception as e:
         logger.error(f"❌ 清理DataFrame失败: {e}")
@@ -224,8 +200,8 @@ async def get_stock_quote(symbol: str):
         if not symbol:
             raise HTTPException(status_code=400, detail="缺少股票代码")
 
-        # 使用新创建的行情服务
-        quote_service = QuoteService()
+        # 复用进程内的行情服务单例
+        quote_service = get_quote_service()
 
         # 调用服务获取标准化的行情数据DTO
         quote_dto = quote_service.get_stock_quote(symbol)
@@ -257,7 +233,7 @@ async def get_stock_quotes(request: QuoteListRequest):
             raise HTTPException(status_code=400, detail="股票代码列表不能为空")
 
         # 使用行情服务
-        quote_service = QuoteService()
+        quote_service = get_quote_service()
 
         # 调用新的批量获取方法
         quote_dtos = quote_service.get_stock_quotes_batch(request.symbols)
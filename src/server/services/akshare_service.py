@@ -3,14 +3,18 @@ AKShare 数据服务 - 使用统一连接管理
 基于参考文件 cankao/akshare_utils.py 的经过验证的API实现
 """
 
+import functools
 import pandas as pd
 from typing import Dict, Optional, Any
 from datetime import datetime
 import logging
+import random
 import warnings
 import threading
+import time
 import requests
 import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from requests.adapters import HTTPAdapter
@@ -24,13 +28,112 @@ try:
 except ImportError:
     ak = None
 
-from ..utils.symbol_processor import get_symbol_processor
+from ..utils.symbol_processor import get_symbol_processor, get_china_exchange
+from ..utils.concurrency import SingleFlight, call_with_timeout
+from ..utils.redis_cache import (
+    get_redis_cache,
+    AKShareMarketCache,
+    serialize_pickle,
+    deserialize_pickle,
+)
 from ..exception.exception import DataNotFoundError
 
 logger = logging.getLogger("akshare_service")
 logging.basicConfig(level=logging.INFO)
 warnings.filterwarnings("ignore")
 
+# A股代码名称列表与财务数据的缓存键
+ALL_STOCKS_CACHE_KEY = "stock_srv:akshare:all_stocks"
+# 后台刷新间隔略短于缓存最短过期时间，保证查询始终命中热缓存
+ALL_STOCKS_REFRESH_INTERVAL = 3000
+FINANCIAL_CACHE_KEY = "stock_srv:akshare:financial:{symbol}"
+XQ_INFO_CACHE_KEY = "stock_srv:akshare:xq_info:{market}:{symbol}"
+
+# 各类缓存的过期时间区间（秒，最小值, 最大值）：写入时在区间内随机取值，
+# 避免同一批写入的键同时过期、集中回源
+CACHE_TTL_POLICY = {
+    "all_stocks": (3300, 3900),
+    "financial": (79200, 93600),
+    "xq_info": (79200, 93600),
+    "negative": (240, 360),
+}
+
+# 空结果（无效代码、空数据、请求异常）的短期缓存标记，避免反复请求上游
+NEGATIVE_CACHE_MARKER = {"__none__": True}
+
+# AKShare K线中文列名 -> 标准列名
+KLINE_COLUMN_RENAME = {
+    "日期": "date",
+    "开盘": "open",
+    "收盘": "close",
+    "最高": "high",
+    "最低": "low",
+    "成交量": "volume",
+    "成交额": "amount",
+}
+
+# 常见美股代码 -> 中文名称（AKShare 美股信息接口缺少名称时使用）
+COMMON_US_STOCK_NAMES = {
+    "AAPL": "苹果公司",
+    "MSFT": "微软公司",
+    "GOOGL": "谷歌A类股",
+    "GOOG": "谷歌C类股",
+    "AMZN": "亚马逊公司",
+    "TSLA": "特斯拉公司",
+    "META": "Meta平台",
+    "NVDA": "英伟达公司",
+    "NFLX": "奈飞公司",
+    "AMD": "超威半导体",
+    "INTC": "英特尔公司",
+    "CRM": "Salesforce",
+    "ORCL": "甲骨文公司",
+    "ADBE": "Adobe公司",
+    "PYPL": "PayPal公司",
+    "DIS": "迪士尼公司",
+    "BA": "波音公司",
+    "JPM": "摩根大通",
+    "V": "Visa公司",
+    "MA": "万事达卡",
+}
+
+# A股财务报表接口: (结果键, AKShare函数名, 说明)
+FINANCIAL_REPORT_APIS = (
+    ("main_indicators", "stock_financial_abstract", "主要财务指标"),
+    ("balance_sheet", "stock_balance_sheet_by_report_em", "资产负债表"),
+    ("income_statement", "stock_profit_sheet_by_report_em", "利润表"),
+    ("cash_flow", "stock_cash_flow_sheet_by_report_em", "现金流量表"),
+)
+
+# 全市场实时行情接口: 市场类型 -> (AKShare函数名, 市场名称)
+MARKET_SPOT_APIS = {
+    "china": ("stock_zh_a_spot_em", "A股"),
+    "hk": ("stock_hk_spot_em", "港股"),
+    "us": ("stock_us_spot_em", "美股"),
+}
+
+# 雪球个股基本信息接口: 市场类型 -> AKShare函数名
+XQ_INFO_APIS = {
+    "cn": "stock_individual_basic_info_xq",
+    "us": "stock_individual_basic_info_us_xq",
+    "hk": "stock_individual_basic_info_hk_xq",
+}
+
+# A股代码列表刷新锁及后台刷新线程（进程内只启动一个）
+_all_stocks_lock = threading.Lock()
+_all_stocks_refresher: Optional[threading.Thread] = None
+
+# 进程内的A股代码索引 (加载时间, {代码: 信息})：在刷新间隔内直接复用，
+# 省去每次查询时从Redis读取并反序列化约5000条记录
+_all_stocks_local: Optional[tuple] = None
+
+# 缓存未命中时正在进行中的上游请求（按缓存键合并并发的重复请求）
+_single_flight = SingleFlight()
+
+# 所有财务数据请求共享的线程池，避免每次调用重复创建线程
+_financial_executor = ThreadPoolExecutor(
+    max_workers=len(FINANCIAL_REPORT_APIS), thread_name_prefix="akshare_fin"
+)
+
 
 class AkshareService:
     """封装 AKShare 的数据服务（经过验证优化的版本）"""
@@ -43,14 +146,17 @@ class AkshareService:
             raise ImportError("akshare 未安装")
 
         try:
-            # 测试连接
-            _ = ak.stock_info_a_code_name()
+            # 测试连接，同时用返回的代码列表预热缓存
+            self._store_all_stocks(ak.stock_info_a_code_name())
             self.connected = True
+            _start_all_stocks_refresher(self)
 
             # 设置更长的超时时间
             self._configure_timeout()
 
             self.symbol_processor = get_symbol_processor()
+            # 全市场行情的代码索引与行情缓存共用同一套按快照缓存的索引
+            self.market_cache = AKShareMarketCache()
             logger.info("✅ AKShare初始化成功")
         except Exception as e:
             self.connected = False
@@ -108,19 +214,8 @@ class AkshareService:
                     f"未获取到 {symbol} 在 {start_date}~{end_date} 的日线数据"
                 )
 
-            # 标准化列名
-            mapping = {
-                "日期": "date",
-                "开盘": "open",
-                "收盘": "close",
-                "最高": "high",
-                "最低": "low",
-                "成交量": "volume",
-                "成交额": "amount",
-            }
-            for k, v in mapping.items():
-                if k in df.columns:
-                    df = df.rename(columns={k: v})
+            # 标准化列名（一次 rename 完成，缺失的列会被忽略）
+            df = df.rename(columns=KLINE_COLUMN_RENAME)
 
             if "date" in df.columns:
                 df["date"] = pd.to_datetime(df["date"])
@@ -141,80 +236,162 @@ class AkshareService:
         try:
             ak_symbol = self.symbol_processor.get_akshare_format(symbol)
 
-            info_df = ak.stock_info_a_code_name()
-            row = info_df[info_df["code"] == ak_symbol]
+            stock = self._get_all_stocks_cached().get(ak_symbol)
 
-            if row.empty:
+            if stock is None:
                 raise DataNotFoundError(f"未找到 {symbol} 的基本信息")
 
             return {
                 "symbol": ak_symbol,
-                "name": row.iloc[0]["name"],
+                "name": stock["name"],
+                "exchange": stock.get("exchange"),
                 "source": "akshare",
             }
         except Exception as e:
             logger.error(f"❌ 获取A股信息失败: {symbol}, 错误: {e}")
             raise
 
+    def _get_cached(self, cache_key: str) -> Any:
+        """读取pickle缓存（兼容未压缩的旧数据），未命中或反序列化失败时返回None"""
+        raw = get_redis_cache().get_raw(cache_key)
+        if raw:
+            try:
+                return deserialize_pickle(raw)
+            except Exception as e:
+                logger.warning(f"⚠️ 缓存反序列化失败 {cache_key}: {e}")
+        return None
+
+    def _set_cached(self, cache_key: str, value: Any, ttl_policy: str) -> bool:
+        """
+        以压缩的pickle字节写入缓存，过期时间按 CACHE_TTL_POLICY 区间随机抖动
+
+        财务报表DataFrame列多且空值多，压缩后体积通常只有原来的几分之一
+        """
+        return get_redis_cache().set_raw(
+            cache_key,
+            serialize_pickle(value),
+            random.randint(*CACHE_TTL_POLICY[ttl_policy]),
+        )
+
+    def _fetch_and_cache(self, cache_key: str, ttl_policy: str, fetch) -> Any:
+        """
+        缓存未命中时请求上游并写入缓存（空结果写入短期标记）
+
+        同一缓存键的并发未命中只会请求一次上游，其余调用共享该结果
+        """
+
+        def load():
+            result = fetch()
+            if result:
+                self._set_cached(cache_key, result, ttl_policy)
+            else:
+                self._set_cached(cache_key, NEGATIVE_CACHE_MARKER, "negative")
+            return result
+
+        return _single_flight.do(cache_key, load)
+
+    @staticmethod
+    def _is_negative(cached: Any) -> bool:
+        """判断缓存值是否为空结果标记"""
+        return isinstance(cached, dict) and cached.get("__none__") is True
+
+    def _get_all_stocks_cached(self) -> Dict[str, Dict[str, str]]:
+        """
+        获取A股代码名称列表（按代码索引）
+
+        列表约5000条且变化很少，以pickle字节缓存到Redis，
+        避免每次查询都请求AKShare并重复做JSON编解码；
+        进程内再保留一份已反序列化的索引，刷新间隔内直接返回。
+        """
+        global _all_stocks_local
+        local = _all_stocks_local
+        if local is not None:
+            loaded_at, stocks = local
+            if time.monotonic() - loaded_at < ALL_STOCKS_REFRESH_INTERVAL:
+                return stocks
+
+        stocks = self._get_cached(ALL_STOCKS_CACHE_KEY)
+        if stocks is not None:
+            _all_stocks_local = (time.monotonic(), stocks)
+            return stocks
+
+        # 加锁防止并发的冷启动请求同时下载全量列表
+        with _all_stocks_lock:
+            stocks = self._get_cached(ALL_STOCKS_CACHE_KEY)
+            if stocks is not None:
+                _all_stocks_local = (time.monotonic(), stocks)
+                return stocks
+            return self._store_all_stocks(ak.stock_info_a_code_name())
+
+    def _store_all_stocks(self, info_df: pd.DataFrame) -> Dict[str, Dict[str, str]]:
+        """将AKShare返回的代码名称表转换为索引并写入缓存"""
+        stocks = {
+            code: {"code": code, "name": name, "exchange": get_china_exchange(code)}
+            for code, name in zip(info_df["code"], info_df["name"])
+        }
+
+        global _all_stocks_local
+        _all_stocks_local = (time.monotonic(), stocks)
+        self._set_cached(ALL_STOCKS_CACHE_KEY, stocks, "all_stocks")
+        logger.info(f"✅ A股代码列表已缓存: {len(stocks)}只股票")
+        return stocks
+
+    def refresh_all_stocks(self) -> None:
+        """强制从AKShare刷新A股代码列表缓存"""
+        with _all_stocks_lock:
+            self._store_all_stocks(ak.stock_info_a_code_name())
+
     def get_financial_data(self, symbol: str) -> Dict[str, Optional[pd.DataFrame]]:
-        """获取股票财务数据"""
+        """获取股票财务数据（优先从缓存）"""
         if not self.connected:
             logger.error(f"❌ AKShare未连接，无法获取{symbol}财务数据")
             return {}
 
+        cache_key = FINANCIAL_CACHE_KEY.format(
+            symbol=self.symbol_processor.get_akshare_format(symbol)
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            if self._is_negative(cached):
+                logger.info(f"📖 {symbol} 近期无财务数据（空结果缓存）")
+                return {}
+            logger.info(f"📖 从缓存获取 {symbol} 财务数据")
+            return cached
+
+        return self._fetch_and_cache(
+            cache_key,
+            "financial",
+            functools.partial(self._fetch_financial_data, symbol),
+        )
+
+    def _fetch_financial_data(self, symbol: str) -> Dict[str, Optional[pd.DataFrame]]:
+        """从AKShare获取股票财务数据（各报表通过共享线程池并发获取）"""
         try:
             ak_symbol = self.symbol_processor.get_akshare_format(symbol)
 
             logger.info(f"🔍 开始获取 {symbol} -> {ak_symbol} 的AKShare财务数据")
             financial_data: Dict[str, Optional[pd.DataFrame]] = {}
 
-            # 1. 主要财务指标
-            try:
-                logger.debug(f"📊 获取 {ak_symbol} 主要财务指标...")
-                main_indicators = ak.stock_financial_abstract(symbol=ak_symbol)
-                if main_indicators is not None and not main_indicators.empty:
-                    financial_data["main_indicators"] = main_indicators
-                    logger.info(
-                        f"✅ 获取主要财务指标成功: {len(main_indicators)}条记录"
-                    )
-                else:
-                    logger.warning(f"⚠️ {symbol}主要财务指标为空")
-            except Exception as e:
-                logger.warning(f"❌ 获取主要财务指标失败: {e}")
-
-            # 2. 资产负债表
-            try:
-                if hasattr(ak, "stock_balance_sheet_by_report_em"):
-                    balance_sheet = ak.stock_balance_sheet_by_report_em(
-                        symbol=ak_symbol
-                    )
-                    if balance_sheet is not None and not balance_sheet.empty:
-                        financial_data["balance_sheet"] = balance_sheet
-                        logger.debug(f"✅ 获取资产负债表: {len(balance_sheet)}条")
-            except Exception as e:
-                logger.debug(f"获取资产负债表失败: {e}")
-
-            # 3. 利润表
-            try:
-                if hasattr(ak, "stock_profit_sheet_by_report_em"):
-                    income_statement = ak.stock_profit_sheet_by_report_em(
-                        symbol=ak_symbol
-                    )
-                    if income_statement is not None and not income_statement.empty:
-                        financial_data["income_statement"] = income_statement
-                        logger.debug(f"✅ 获取利润表: {len(income_statement)}条")
-            except Exception as e:
-                logger.debug(f"获取利润表失败: {e}")
+            future_to_key = {
+                _financial_executor.submit(getattr(ak, func_name), symbol=ak_symbol): (
+                    key,
+                    label,
+                )
+                for key, func_name, label in FINANCIAL_REPORT_APIS
+                if hasattr(ak, func_name)
+            }
 
-            # 4. 现金流量表
-            try:
-                if hasattr(ak, "stock_cash_flow_sheet_by_report_em"):
-                    cash_flow = ak.stock_cash_flow_sheet_by_report_em(symbol=ak_symbol)
-                    if cash_flow is not None and not cash_flow.empty:
-                        financial_data["cash_flow"] = cash_flow
-                        logger.debug(f"✅ 获取现金流量表: {len(cash_flow)}条")
-            except Exception as e:
-                logger.debug(f"获取现金流量表失败: {e}")
+            for future in as_completed(future_to_key):
+                key, label = future_to_key[future]
+                try:
+                    df = future.result()
+                    if df is not None and not df.empty:
+                        financial_data[key] = df
+                        logger.debug(f"✅ 获取{label}: {len(df)}条")
+                    else:
+                        logger.warning(f"⚠️ {symbol}{label}为空")
+                except Exception as e:
+                    logger.warning(f"❌ 获取{label}失败: {e}")
 
             if financial_data:
                 logger.info(
@@ -392,32 +569,41 @@ class AkshareService:
         if not self.connected:
             return None
 
+        cache_key = XQ_INFO_CACHE_KEY.format(market=market, symbol=symbol)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return None if self._is_negative(cached) else cached
+
+        return self._fetch_and_cache(
+            cache_key,
+            "xq_info",
+            functools.partial(self._fetch_stock_basic_info_xq, symbol, market),
+        )
+
+    def _fetch_stock_basic_info_xq(
+        self, symbol: str, market: str
+    ) -> Optional[Dict[str, Any]]:
+        """从雪球获取股票基本信息"""
         try:
             logger.info(f"📊 从雪球获取{market}股票基本信息: {symbol}")
 
+            if market not in XQ_INFO_APIS:
+                logger.error(f"❌ 不支持的市场类型: {market}")
+                return None
+
             if market == "cn":
                 # A股：需要带市场前缀，如 SH600519
-                if not symbol.startswith(("SH", "SZ")):
-                    if symbol.startswith("6"):
-                        symbol = f"SH{symbol}"
-                    else:
-                        symbol = f"SZ{symbol}"
-                df = ak.stock_individual_basic_info_xq(symbol=symbol)
-
-            elif market == "us":
-                df = ak.stock_individual_basic_info_us_xq(symbol=symbol)
-
+                if not symbol.startswith(("SH", "SZ", "BJ")):
+                    symbol = f"{get_china_exchange(symbol) or 'SZ'}{symbol}"
             elif market == "hk":
                 # 港股：确保5位数字格式
                 symbol = symbol.lstrip("0").zfill(5)
-                df = ak.stock_individual_basic_info_hk_xq(symbol=symbol)
-            else:
-                logger.error(f"❌ 不支持的市场类型: {market}")
-                return None
+
+            df = getattr(ak, XQ_INFO_APIS[market])(symbol=symbol)
 
             if df is not None and not df.empty:
                 # 转换为字典
-                result = dict(zip(df["item"], df["value"]))
+                result = dict(zip(df["item"].astype(str), df["value"]))
                 logger.info(f"✅ 获取雪球基本信息成功: {len(result)}个字段")
                 return result
             else:
@@ -440,52 +626,27 @@ class AkshareService:
             f"🇭🇰 AKShare获取港股数据: {symbol} -> {ak_symbol} ({start_date} ~ {end_date})"
         )
 
-        result = [None]
-        exception = [None]
-
-        def fetch_data():
-            try:
-                # symbol_processor 已经处理了代码格式
-                # hk_symbol = self._normalize_hk_symbol(symbol)
-
-                result[0] = ak.stock_hk_hist(
-                    symbol=ak_symbol,
-                    period="daily",
-                    start_date=start_date.replace("-", ""),
-                    end_date=end_date.replace("-", ""),
-                    adjust="",
-                )
-            except Exception as e:
-                exception[0] = e
-
-        thread = threading.Thread(target=fetch_data, daemon=True)
-        thread.start()
-        thread.join(timeout=60)
-
-        if thread.is_alive():
+        try:
+            # symbol_processor 已经处理了代码格式
+            df = call_with_timeout(
+                60,
+                ak.stock_hk_hist,
+                symbol=ak_symbol,
+                period="daily",
+                start_date=start_date.replace("-", ""),
+                end_date=end_date.replace("-", ""),
+                adjust="",
+            )
+        except TimeoutError:
             raise TimeoutError(f"获取港股 {symbol} 日线超时（60秒）")
-        if exception[0]:
-            raise exception[0]
 
-        df = result[0]
         if df is None or df.empty:
             raise DataNotFoundError(
                 f"未获取到港股 {symbol} 在 {start_date}~{end_date} 的数据"
             )
 
-        # 标准化列名
-        mapping = {
-            "日期": "date",
-            "开盘": "open",
-            "收盘": "close",
-            "最高": "high",
-            "最低": "low",
-            "成交量": "volume",
-            "成交额": "amount",
-        }
-        for k, v in mapping.items():
-            if k in df.columns:
-                df = df.rename(columns={k: v})
+        # 标准化列名（一次 rename 完成，缺失的列会被忽略）
+        df = df.rename(columns=KLINE_COLUMN_RENAME)
 
         if "date" in df.columns:
             df["date"] = pd.to_datetime(df["date"])
@@ -550,56 +711,44 @@ class AkshareService:
             f"🇺🇸 AKShare获取美股数据: {symbol} -> {ak_symbol} ({start_date} ~ {end_date})"
         )
 
-        result = [None]
-        exception = [None]
+        def fetch_data() -> pd.DataFrame:
+            # 使用AKShare的新浪美股历史数据接口
+            full_data = ak.stock_us_daily(symbol=ak_symbol, adjust="")
 
-        def fetch_data():
-            try:
-                # 使用AKShare的新浪美股历史数据接口
-                full_data = ak.stock_us_daily(symbol=ak_symbol, adjust="")
-
-                if full_data is None or full_data.empty:
-                    logger.warning(f"⚠️ 美股历史数据为空: {symbol}")
-                    result[0] = pd.DataFrame()
-                    return
-
-                # 过滤日期范围
-                if "date" in full_data.columns:
-                    full_data["date"] = pd.to_datetime(full_data["date"])
-                    start_dt = pd.to_datetime(start_date)
-                    end_dt = pd.to_datetime(end_date)
-
-                    filtered_data = full_data[
-                        (full_data["date"] >= start_dt) & (full_data["date"] <= end_dt)
-                    ].copy()
-
-                    if filtered_data.empty:
-                        logger.warning(
-                            f"⚠️ 指定日期范围内无美股数据: {symbol} ({start_date} ~ {end_date})"
-                        )
-                    else:
-                        logger.debug(
-                            f"✅ 获取美股数据成功: {symbol}, {len(filtered_data)}条"
-                        )
+            if full_data is None or full_data.empty:
+                logger.warning(f"⚠️ 美股历史数据为空: {symbol}")
+                return pd.DataFrame()
 
-                    result[0] = filtered_data
-                else:
-                    result[0] = full_data
+            # 过滤日期范围
+            if "date" not in full_data.columns:
+                return full_data
 
-            except Exception as e:
-                logger.error(f"❌ 获取美股数据失败: {symbol}, 错误: {e}")
-                exception[0] = e
+            full_data["date"] = pd.to_datetime(full_data["date"])
+            start_dt = pd.to_datetime(start_date)
+            end_dt = pd.to_datetime(end_date)
+
+            filtered_data = full_data[
+                (full_data["date"] >= start_dt) & (full_data["date"] <= end_dt)
+            ].copy()
+
+            if filtered_data.empty:
+                logger.warning(
+                    f"⚠️ 指定日期范围内无美股数据: {symbol} ({start_date} ~ {end_date})"
+                )
+            else:
+                logger.debug(f"✅ 获取美股数据成功: {symbol}, {len(filtered_data)}条")
 
-        thread = threading.Thread(target=fetch_data, daemon=True)
-        thread.start()
-        thread.join(timeout=120)  # 美股数据较大，增加超时时间
+            return filtered_data
 
-        if thread.is_alive():
+        try:
+            # 美股数据较大，增加超时时间
+            df = call_with_timeout(120, fetch_data)
+        except TimeoutError:
             raise TimeoutError(f"获取美股 {symbol} 日线超时（120秒）")
-        if exception[0]:
-            raise exception[0]
+        except Exception as e:
+            logger.error(f"❌ 获取美股数据失败: {symbol}, 错误: {e}")
+            raise
 
-        df = result[0]
         if df is None or df.empty:
             raise DataNotFoundError(
                 f"未获取到美股 {symbol} 在 {start_date}~{end_date} 的数据"
@@ -666,40 +815,35 @@ class AkshareService:
 
     def _get_us_stock_name(self, symbol: str) -> str:
         """获取美股名称（使用常见映射）"""
-        common_us_stocks = {
-            "AAPL": "苹果公司",
-            "MSFT": "微软公司",
-            "GOOGL": "谷歌A类股",
-            "GOOG": "谷歌C类股",
-            "AMZN": "亚马逊公司",
-            "TSLA": "特斯拉公司",
-            "META": "Meta平台",
-            "NVDA": "英伟达公司",
-            "NFLX": "奈飞公司",
-            "AMD": "超威半导体",
-            "INTC": "英特尔公司",
-            "CRM": "Salesforce",
-            "ORCL": "甲骨文公司",
-            "ADBE": "Adobe公司",
-            "PYPL": "PayPal公司",
-            "DIS": "迪士尼公司",
-            "BA": "波音公司",
-            "JPM": "摩根大通",
-            "V": "Visa公司",
-            "MA": "万事达卡",
-        }
-
-        if symbol in common_us_stocks:
-            logger.info(f"✅ 使用预设名称: {symbol} -> {common_us_stocks[symbol]}")
-            return common_us_stocks[symbol]
+        name = COMMON_US_STOCK_NAMES.get(symbol)
+        if name is not None:
+            logger.info(f"✅ 使用预设名称: {symbol} -> {name}")
+            return name
         else:
             logger.info(f"⚠️ 使用默认名称: {symbol}")
             return f"美股{symbol}"
 
     # ==================== 新闻数据接口 ====================
 
-    def get_stock_news_em(self, symbol: str, max_news: int = 20) -> pd.DataFrame:
-        """获取东方财富个股新闻"""
+    def get_stock_news_em(
+        self,
+        symbol: str,
+        max_news: int = 20,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        获取东方财富个股新闻
+
+        Args:
+            symbol: 股票代码
+            max_news: 最多返回的新闻条数
+            start_date: 发布时间下限（可选），在截断条数之前过滤
+            end_date: 发布时间上限（可选），在截断条数之前过滤
+
+        Returns:
+            pd.DataFrame: 新闻数据，指定时间范围时"发布时间"列为datetime类型
+        """
         if not self.connected:
             logger.error("[东方财富新闻] ❌ AKShare未连接")
             return pd.DataFrame()
@@ -709,35 +853,26 @@ class AkshareService:
         logger.info(f"[东方财富新闻] 获取股票 {symbol} -> {ak_symbol} 的新闻数据")
 
         try:
-            result = [None]
-            exception = [None]
-
-            def fetch_news():
-                try:
-                    result[0] = ak.stock_news_em(symbol=ak_symbol)
-                except Exception as e:
-                    exception[0] = e
-
-            thread = threading.Thread(target=fetch_news)
-            thread.daemon = True
-            thread.start()
-            thread.join(timeout=30)
-
-            if thread.is_alive():
+            try:
+                news_df = call_with_timeout(30, ak.stock_news_em, symbol=ak_symbol)
+            except TimeoutError:
                 elapsed = (datetime.now() - start_time).total_seconds()
                 logger.warning(
                     f"[东方财富新闻] ⚠️ 获取超时（30秒）: {symbol}, 耗时: {elapsed:.2f}秒"
                 )
                 raise TimeoutError(f"东方财富新闻获取超时（30秒）: {symbol}")
-            if exception[0]:
-                raise exception[0]
-
-            news_df = result[0]
 
             if news_df is not None and not news_df.empty:
+                # 先按时间范围过滤再截断，避免范围内的新闻被截掉
+                if (start_date or end_date) and "发布时间" in news_df.columns:
+                    news_df = filter_by_publish_time(
+                        news_df, "发布时间", start_date, end_date
+                    )
+
                 if len(news_df) > max_news:
                     news_df = news_df.head(max_news)
 
+            if news_df is not None and not news_df.empty:
                 elapsed = (datetime.now() - start_time).total_seconds()
                 logger.info(
                     f"[东方财富新闻] ✅ 获取成功: {ak_symbol}, 共{len(news_df)}条, 耗时: {elapsed:.2f}秒"
@@ -759,56 +894,45 @@ class AkshareService:
 
     # ==================== 全市场数据接口 ====================
 
-    def get_china_market_spot(self) -> pd.DataFrame:
-        """
-        获取A股全市场实时行情数据
-        包含市盈率、市净率等估值指标
-
-        Returns:
-            pd.DataFrame: 全市场数据
-        """
+    def _get_market_spot(self, market: str) -> pd.DataFrame:
+        """按市场类型分派到对应的AKShare全市场行情接口"""
         if not self.connected:
             raise ConnectionError("AKShare未连接")
 
+        func_name, market_name = MARKET_SPOT_APIS[market]
         try:
-            logger.info("📊 获取A股全市场实时数据...")
-            df = ak.stock_zh_a_spot_em()
+            logger.info(f"📊 获取{market_name}全市场实时数据...")
+            df = getattr(ak, func_name)()
 
             if df is not None and not df.empty:
-                logger.info(f"✅ 获取A股全市场数据成功: {len(df)} 只股票")
+                logger.info(f"✅ 获取{market_name}全市场数据成功: {len(df)} 只股票")
                 return df
             else:
-                logger.warning("⚠️ A股全市场数据为空")
+                logger.warning(f"⚠️ {market_name}全市场数据为空")
                 return pd.DataFrame()
 
         except Exception as e:
-            logger.error(f"❌ 获取A股全市场数据失败: {e}")
+            logger.error(f"❌ 获取{market_name}全市场数据失败: {e}")
             raise
 
-    def get_hk_market_spot(self) -> pd.DataFrame:
+    def get_china_market_spot(self) -> pd.DataFrame:
         """
-        获取港股全市场实时行情数据
+        获取A股全市场实时行情数据
+        包含市盈率、市净率等估值指标
 
         Returns:
             pd.DataFrame: 全市场数据
         """
-        if not self.connected:
-            raise ConnectionError("AKShare未连接")
+        return self._get_market_spot("china")
 
-        try:
-            logger.info("📊 获取港股全市场实时数据...")
-            df = ak.stock_hk_spot_em()
-
-            if df is not None and not df.empty:
-                logger.info(f"✅ 获取港股全市场数据成功: {len(df)} 只股票")
-                return df
-            else:
-                logger.warning("⚠️ 港股全市场数据为空")
-                return pd.DataFrame()
+    def get_hk_market_spot(self) -> pd.DataFrame:
+        """
+        获取港股全市场实时行情数据
 
-        except Exception as e:
-            logger.error(f"❌ 获取港股全市场数据失败: {e}")
-            raise
+        Returns:
+            pd.DataFrame: 全市场数据
+        """
+        return self._get_market_spot("hk")
 
     def get_us_market_spot(self) -> pd.DataFrame:
         """
@@ -817,23 +941,7 @@ class AkshareService:
         Returns:
             pd.DataFrame: 全市场数据
         """
-        if not self.connected:
-            raise ConnectionError("AKShare未连接")
-
-        try:
-            logger.info("📊 获取美股全市场实时数据...")
-            df = ak.stock_us_spot_em()
-
-            if df is not None and not df.empty:
-                logger.info(f"✅ 获取美股全市场数据成功: {len(df)} 只股票")
-                return df
-            else:
-                logger.warning("⚠️ 美股全市场数据为空")
-                return pd.DataFrame()
-
-        except Exception as e:
-            logger.error(f"❌ 获取美股全市场数据失败: {e}")
-            raise
+        return self._get_market_spot("us")
 
     def get_stock_spot_info(
         self, symbol: str, market: str = "china"
@@ -884,15 +992,10 @@ class AkshareService:
                 # 缓存未命中，获取新数据
                 logger.info(f"📊 缓存未命中，获取{market}全市场数据...")
 
-                if market == "china":
-                    market_data = self.get_china_market_spot()
-                elif market == "hk":
-                    market_data = self.get_hk_market_spot()
-                elif market == "us":
-                    market_data = self.get_us_market_spot()
-                else:
+                if market not in MARKET_SPOT_APIS:
                     logger.error(f"❌ 不支持的市场类型: {market}")
                     return None
+                market_data = self._get_market_spot(market)
 
                 # 写入缓存
                 if market_data is not None and not market_data.empty:
@@ -905,28 +1008,28 @@ class AkshareService:
             # 查找指定股票
             ak_symbol = self.symbol_processor.get_akshare_format(symbol)
 
-            # 不同市场的代码列名不同
-            code_column = "代码"
             if market == "china":
                 # A股: 去掉前缀的纯数字代码
                 clean_code = ak_symbol
-                stock_row = market_data[market_data[code_column] == clean_code]
             elif market == "hk":
                 # 港股: 5位数字代码
                 clean_code = ak_symbol.zfill(5)
-                stock_row = market_data[market_data[code_column] == clean_code]
             elif market == "us":
-                # 美股: 股票代码
-                stock_row = market_data[market_data[code_column] == symbol.upper()]
+                # 美股: 股票代码（行情表中为 105.AAPL 格式，索引同时支持去前缀匹配）
+                clean_code = symbol.upper()
             else:
                 return None
 
-            if stock_row.empty:
+            code_index = self.market_cache._get_code_index(
+                market, market_data, strip_market_prefix=market == "us"
+            )
+            position = code_index.get(clean_code)
+            if position is None:
                 logger.warning(f"⚠️ 在{market}全市场数据中未找到 {symbol} ({ak_symbol})")
                 return None
 
             # 转换为字典
-            info = stock_row.iloc[0].to_dict()
+            info = market_data.iloc[position].to_dict()
             logger.info(f"✅ 从全市场数据获取 {symbol} 信息成功")
             return info
 
@@ -935,11 +1038,58 @@ class AkshareService:
             return None
 
 
+def filter_by_publish_time(
+    df: pd.DataFrame,
+    time_column: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> pd.DataFrame:
+    """按发布时间列整体解析并过滤时间范围（无法解析的行被丢弃）"""
+    times = pd.to_datetime(df[time_column], errors="coerce")
+    if times.dt.tz is not None:
+        times = times.dt.tz_localize(None)
+
+    mask = times.notna()
+    if start_date is not None:
+        mask &= times >= start_date
+    if end_date is not None:
+        mask &= times <= end_date
+
+    df = df.loc[mask].copy()
+    df[time_column] = times[mask]
+    return df
+
+
 # ==================== 便捷函数 ====================
 
 _global_service = None
 
 
+def _start_all_stocks_refresher(service: "AkshareService") -> None:
+    """启动后台线程定期刷新A股代码列表缓存（仅启动一次）"""
+    global _all_stocks_refresher
+    if _all_stocks_refresher is not None:
+        return
+
+    def refresh_loop():
+        while True:
+            time.sleep(ALL_STOCKS_REFRESH_INTERVAL)
+            try:
+                service.refresh_all_stocks()
+            except Exception as e:
+                logger.warning(f"⚠️ 后台刷新A股代码列表失败: {e}")
+
+    with _all_stocks_lock:
+        if _all_stocks_refresher is None:
+            _all_stocks_refresher = threading.Thread(
+                target=refresh_loop, name="akshare_all_stocks", daemon=True
+            )
+            _all_stocks_refresher.start()
+            logger.info(
+                f"🔄 A股代码列表后台刷新已启动，间隔{ALL_STOCKS_REFRESH_INTERVAL}秒"
+            )
+
+
 def get_akshare_service() -> AkshareService:
     """获取AKShare服务单例"""
     global _global_service
@@ -1019,9 +1169,11 @@ def _format_hk_stock_data(
 
 最近5个交易日:
 """
-        for _, row in data.tail(5).iterrows():
-            date_str = row["date"].strftime("%Y-%m-%d")
-            report += f"- {date_str}: 开盘HK${row['open']:.2f}, 收盘HK${row['close']:.2f}, 成交量{row['volume']:,.0f}\n"
+        recent = data.tail(5)
+        for date, open_, close, volume in zip(
+            recent["date"], recent["open"], recent["close"], recent["volume"]
+        ):
+            report += f"- {date:%Y-%m-%d}: 开盘HK${open_:.2f}, 收盘HK${close:.2f}, 成交量{volume:,.0f}\n"
 
         report += "\n数据来源: AKShare (港股)\n"
         return report
@@ -1068,9 +1220,11 @@ def _format_us_stock_data(
 
 最近5个交易日:
 """
-        for _, row in data.tail(5).iterrows():
-            date_str = row["date"].strftime("%Y-%m-%d")
-            report += f"- {date_str}: 开盘${row['open']:.2f}, 收盘${row['close']:.2f}, 成交量{row['volume']:,.0f}\n"
+        recent = data.tail(5)
+        for date, open_, close, volume in zip(
+            recent["date"], recent["open"], recent["close"], recent["volume"]
+        ):
+            report += f"- {date:%Y-%m-%d}: 开盘${open_:.2f}, 收盘${close:.2f}, 成交量{volume:,.0f}\n"
 
         report += "\n数据来源: AKShare (美股)\n"
         return report
@@ -25,6 +25,33 @@ except ImportError:
 
 logger = logging.getLogger("calendar_service")
 
+# 交易所 -> pandas_market_calendars 的交易所代码
+CALENDAR_EXCHANGE_CODES = {
+    ExchangeType.SSE.value: "SSE",  # 上交所
+    ExchangeType.SZSE.value: "XSHG",  # 深交所 (使用上交所的日历，因为基本一致)
+    ExchangeType.BSE.value: "SSE",  # 北交所 (使用上交所的日历)
+    ExchangeType.HKEX.value: "HKEX",  # 港交所
+    ExchangeType.NYSE.value: "NYSE",  # 纽交所
+    ExchangeType.NASDAQ.value: "NASDAQ",  # 纳斯达克
+}
+
+# 交易所日历按地区分类（"其他"收集所有未列出的日历）
+CALENDAR_REGIONS = {
+    "美国": ("NYSE", "NASDAQ", "AMEX", "BATS", "IEX"),
+    "中国": ("SSE", "HKEX", "XSHG"),
+    "欧洲": ("LSE", "EUREX", "XETR", "XPAR", "XAMS", "XBRU", "XMIL"),
+    "亚太": ("JPX", "ASX", "BSE", "NSE"),
+    "加拿大": ("TSX",),
+    "其他": (),
+}
+
+# 交易所 -> 地区 的反向索引，分类时 O(1) 查找
+CALENDAR_REGION_BY_EXCHANGE = {
+    exchange: region
+    for region, exchanges in CALENDAR_REGIONS.items()
+    for exchange in exchanges
+}
+
 
 class CalendarService:
     """基于 pandas_market_calendars 的日历服务"""
@@ -65,17 +92,9 @@ class CalendarService:
             exchange = classification["exchange"]
 
             # 映射到 pandas_market_calendars 的交易所代码
-            exchange_mapping = {
-                ExchangeType.SSE.value: "SSE",  # 上交所
-                ExchangeType.SZSE.value: "XSHG",  # 深交所 (使用上交所的日历，因为基本一致)
-                ExchangeType.BSE.value: "SSE",  # 北交所 (使用上交所的日历)
-                ExchangeType.HKEX.value: "HKEX",  # 港交所
-                ExchangeType.NYSE.value: "NYSE",  # 纽交所
-                ExchangeType.NASDAQ.value: "NASDAQ",  # 纳斯达克
-            }
-
-            if exchange in exchange_mapping:
-                return exchange_mapping[exchange]
+            exchange_code = CALENDAR_EXCHANGE_CODES.get(exchange)
+            if exchange_code is not None:
+                return exchange_code
             else:
                 # 对于未映射的交易所，根据市场类型选择默认值
                 market = classification["market"]
@@ -192,7 +211,7 @@ class CalendarService:
 
             # 获取交易日
             valid_days = calendar.valid_days(start_date=start_str, end_date=end_str)
-            trading_days = [day.strftime("%Y-%m-%d") for day in valid_days]
+            trading_days = valid_days.strftime("%Y-%m-%d").tolist()
 
             # 计算总天数
             start_dt = pd.to_datetime(start_str)
@@ -361,9 +380,9 @@ class CalendarService:
                 }
 
             # 提取交易时间信息
-            row = schedule.iloc[0]
-            market_open = row["market_open"]
-            market_close = row["market_close"]
+            # 按列取标量，不构造整行 Series
+            market_open = schedule["market_open"].iat[0]
+            market_close = schedule["market_close"].iat[0]
 
             trading_hours = {
                 "market_open": market_open.strftime("%H:%M:%S %Z"),
@@ -373,8 +392,8 @@ class CalendarService:
 
             # 检查是否有午间休市
             if "break_start" in schedule.columns and "break_end" in schedule.columns:
-                break_start = row["break_start"]
-                break_end = row["break_end"]
+                break_start = schedule["break_start"].iat[0]
+                break_end = schedule["break_end"].iat[0]
                 if pd.notna(break_start) and pd.notna(break_end):
                     trading_hours["break_start"] = break_start.strftime("%H:%M:%S %Z")
                     trading_hours["break_end"] = break_end.strftime("%H:%M:%S %Z")
@@ -408,34 +427,16 @@ class CalendarService:
             available_calendars = mcal.get_calendar_names()
 
             # 按地区分类
-            regions = {
-                "美国": ["NYSE", "NASDAQ", "AMEX", "BATS", "IEX"],
-                "中国": ["SSE", "HKEX", "XSHG"],
-                "欧洲": ["LSE", "EUREX", "XETR", "XPAR", "XAMS", "XBRU", "XMIL"],
-                "亚太": ["JPX", "ASX", "BSE", "NSE"],
-                "加拿大": ["TSX"],
-                "其他": [],
-            }
-
-            classified = {region: [] for region in regions.keys()}
-            unclassified = []
-
-            for name in sorted(available_calendars):
-                found = False
-                for region, exchanges in regions.items():
-                    if region != "其他" and name in exchanges:
-                        classified[region].append(name)
-                        found = True
-                        break
-                if not found:
-                    unclassified.append(name)
-
-            classified["其他"] = unclassified
+            all_exchanges = sorted(available_calendars)
+            classified = {region: [] for region in CALENDAR_REGIONS}
+            for name in all_exchanges:
+                region = CALENDAR_REGION_BY_EXCHANGE.get(name, "其他")
+                classified[region].append(name)
 
             return {
                 "total_count": len(available_calendars),
                 "regions": classified,
-                "all_exchanges": sorted(available_calendars),
+                "all_exchanges": all_exchanges,
             }
 
         except Exception as e:
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import pandas as pd
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..utils.symbol_processor import get_symbol_processor
 from ..utils.data_source_strategy import get_data_source_strategy
@@ -17,6 +18,37 @@ from ..exception.exception import DataNotFoundError
 logger = logging.getLogger("fundamentals_service")
 warnings.filterwarnings("ignore")
 
+# 港股/美股 AKShare 基本面接口配置
+OVERSEAS_FUNDAMENTAL_APIS = {
+    "hk": {
+        "label": "港股",
+        "period": "年度",
+        "report_fn": "get_hk_financial_report",
+        "indicator_fn": "get_hk_financial_indicator",
+        "reports": (
+            ("balance_sheet", "资产负债表"),
+            ("income_statement", "利润表"),
+            ("cash_flow", "现金流量表"),
+        ),
+    },
+    "us": {
+        "label": "美股",
+        "period": "年报",
+        "report_fn": "get_us_financial_report",
+        "indicator_fn": "get_us_financial_indicator",
+        "reports": (
+            ("balance_sheet", "资产负债表"),
+            ("income_statement", "综合损益表"),
+            ("cash_flow", "现金流量表"),
+        ),
+    },
+}
+
+# 基本面请求共享的线程池（每次请求最多6个并发接口）
+_fundamentals_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="fundamentals"
+)
+
 
 class FundamentalsService:
     """基本面数据服务 - 支持多数据源降级和报告生成"""
@@ -164,10 +196,15 @@ class FundamentalsService:
     def _get_akshare_china_fundamentals(
         self, service, symbol: str
     ) -> Optional[Dict[str, Any]]:
-        """获取AKShare A股基本面数据"""
+        """获取AKShare A股基本面数据（基本信息与财务数据互不依赖，并发获取）"""
         try:
-            # 1. 获取基本信息
-            info = service.get_stock_info(symbol)
+            info_future = _fundamentals_executor.submit(service.get_stock_info, symbol)
+            financial_future = _fundamentals_executor.submit(
+                service.get_financial_data, symbol
+            )
+
+            # 1. 基本信息
+            info = info_future.result()
             if not info:
                 logger.warning(f"⚠️ 未获取到{symbol}基本信息")
                 info = {}
@@ -175,8 +212,8 @@ class FundamentalsService:
             # 性能优化：移除了全市场数据调用
             # 如需PE、PB等指标，请使用Tushare的财务指标接口
 
-            # 2. 获取财务数据
-            financial_data = service.get_financial_data(symbol)
+            # 2. 财务数据
+            financial_data = financial_future.result()
 
             result = {
                 "basic_info": info,
@@ -194,158 +231,75 @@ class FundamentalsService:
         self, service, symbol: str
     ) -> Optional[Dict[str, Any]]:
         """获取AKShare 港股基本面数据（增强版）"""
-        try:
-            # 1. 获取基本信息（雪球数据源）
-            info = {}
-            try:
-                xq_info = service.get_stock_basic_info_xq(symbol, market="hk")
-                if xq_info:
-                    info.update(xq_info)
-                    logger.info(f"✅ 从雪球获取港股{symbol}基本信息成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 从雪球获取港股基本信息失败: {e}")
-
-            # 2. 获取全市场实时数据
-            try:
-                spot_info = service.get_stock_spot_info(symbol, market="hk")
-                if spot_info:
-                    info.update(spot_info)
-                    logger.info(f"✅ 从全市场数据获取港股{symbol}实时信息")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取港股全市场数据失败: {e}")
-
-            # 3. 获取财务报表（年度数据）
-            financial_data = {}
-
-            # 资产负债表
-            try:
-                balance_sheet = service.get_hk_financial_report(
-                    symbol, report_type="资产负债表", indicator="年度"
-                )
-                if balance_sheet is not None and not balance_sheet.empty:
-                    financial_data["balance_sheet"] = balance_sheet
-                    logger.info(f"✅ 获取港股{symbol}资产负债表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取港股资产负债表失败: {e}")
-
-            # 利润表
-            try:
-                income_statement = service.get_hk_financial_report(
-                    symbol, report_type="利润表", indicator="年度"
-                )
-                if income_statement is not None and not income_statement.empty:
-                    financial_data["income_statement"] = income_statement
-                    logger.info(f"✅ 获取港股{symbol}利润表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取港股利润表失败: {e}")
-
-            # 现金流量表
-            try:
-                cash_flow = service.get_hk_financial_report(
-                    symbol, report_type="现金流量表", indicator="年度"
-                )
-                if cash_flow is not None and not cash_flow.empty:
-                    financial_data["cash_flow"] = cash_flow
-                    logger.info(f"✅ 获取港股{symbol}现金流量表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取港股现金流量表失败: {e}")
-
-            # 4. 获取主要财务指标
-            fina_indicator_df = None
-            try:
-                fina_indicator_df = service.get_hk_financial_indicator(
-                    symbol, indicator="年度"
-                )
-                if fina_indicator_df is not None and not fina_indicator_df.empty:
-                    financial_data["fina_indicator"] = fina_indicator_df
-                    logger.info(f"✅ 获取港股{symbol}财务指标成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取港股财务指标失败: {e}")
-
-            result = {
-                "basic_info": info,
-                "financial_data": financial_data,
-                "fina_indicator": fina_indicator_df,  # 提取到顶层
-                "data_type": "complete" if financial_data else "basic",
-            }
-
-            return result
-
-        except Exception as e:
-            logger.error(f"❌ AKShare 港股基本面数据获取失败: {e}")
-            return None
+        return self._get_akshare_overseas_fundamentals(service, symbol, "hk")
 
     def _get_akshare_us_fundamentals(
         self, service, symbol: str
     ) -> Optional[Dict[str, Any]]:
         """获取AKShare 美股基本面数据（增强版）"""
-        try:
-            # 1. 获取基本信息（雪球数据源）
-            info = {}
-            try:
-                xq_info = service.get_stock_basic_info_xq(symbol, market="us")
-                if xq_info:
-                    info.update(xq_info)
-                    logger.info(f"✅ 从雪球获取美股{symbol}基本信息成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 从雪球获取美股基本信息失败: {e}")
+        return self._get_akshare_overseas_fundamentals(service, symbol, "us")
 
-            # 2. 获取全市场实时数据
-            try:
-                spot_info = service.get_stock_spot_info(symbol, market="us")
-                if spot_info:
-                    info.update(spot_info)
-                    logger.info(f"✅ 从全市场数据获取美股{symbol}实时信息")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取美股全市场数据失败: {e}")
+    def _get_akshare_overseas_fundamentals(
+        self, service, symbol: str, market: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        获取AKShare 港股/美股基本面数据
 
-            # 3. 获取财务报表（年报数据）
-            financial_data = {}
+        雪球信息、全市场行情、三张报表和财务指标互不依赖，
+        通过共享线程池并发请求，总耗时取决于最慢的一个接口。
+        """
+        config = OVERSEAS_FUNDAMENTAL_APIS[market]
+        label = config["label"]
+        period = config["period"]
 
-            # 资产负债表
-            try:
-                balance_sheet = service.get_us_financial_report(
-                    symbol, report_type="资产负债表", indicator="年报"
+        try:
+            report_fn = getattr(service, config["report_fn"])
+            indicator_fn = getattr(service, config["indicator_fn"])
+
+            future_to_task = {
+                _fundamentals_executor.submit(
+                    service.get_stock_basic_info_xq, symbol, market=market
+                ): ("xq_info", "雪球基本信息"),
+                _fundamentals_executor.submit(
+                    service.get_stock_spot_info, symbol, market=market
+                ): ("spot_info", "全市场实时信息"),
+                _fundamentals_executor.submit(
+                    indicator_fn, symbol, indicator=period
+                ): ("fina_indicator", "财务指标"),
+            }
+            for key, report_type in config["reports"]:
+                future = _fundamentals_executor.submit(
+                    report_fn, symbol, report_type=report_type, indicator=period
                 )
-                if balance_sheet is not None and not balance_sheet.empty:
-                    financial_data["balance_sheet"] = balance_sheet
-                    logger.info(f"✅ 获取美股{symbol}资产负债表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取美股资产负债表失败: {e}")
+                future_to_task[future] = (key, report_type)
 
-            # 综合损益表
-            try:
-                income_statement = service.get_us_financial_report(
-                    symbol, report_type="综合损益表", indicator="年报"
-                )
-                if income_statement is not None and not income_statement.empty:
-                    financial_data["income_statement"] = income_statement
-                    logger.info(f"✅ 获取美股{symbol}综合损益表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取美股综合损益表失败: {e}")
+            results = {}
+            for future in as_completed(future_to_task):
+                key, name = future_to_task[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ 获取{label}{name}失败: {e}")
 
-            # 现金流量表
-            try:
-                cash_flow = service.get_us_financial_report(
-                    symbol, report_type="现金流量表", indicator="年报"
-                )
-                if cash_flow is not None and not cash_flow.empty:
-                    financial_data["cash_flow"] = cash_flow
-                    logger.info(f"✅ 获取美股{symbol}现金流量表成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取美股现金流量表失败: {e}")
+            # 1. 基本信息：雪球数据在前，全市场实时数据覆盖在后
+            info = {}
+            for key, name in (("xq_info", "雪球基本信息"), ("spot_info", "实时信息")):
+                if results.get(key):
+                    info.update(results[key])
+                    logger.info(f"✅ 获取{label}{symbol}{name}成功")
 
-            # 4. 获取主要财务指标
-            fina_indicator_df = None
-            try:
-                fina_indicator_df = service.get_us_financial_indicator(
-                    symbol, indicator="年报"
-                )
-                if fina_indicator_df is not None and not fina_indicator_df.empty:
-                    financial_data["fina_indicator"] = fina_indicator_df
-                    logger.info(f"✅ 获取美股{symbol}财务指标成功")
-            except Exception as e:
-                logger.warning(f"⚠️ 获取美股财务指标失败: {e}")
+            # 2. 财务报表与主要财务指标
+            financial_data = {}
+            for key, report_type in config["reports"]:
+                df = results.get(key)
+                if df is not None and not df.empty:
+                    financial_data[key] = df
+                    logger.info(f"✅ 获取{label}{symbol}{report_type}成功")
+
+            fina_indicator_df = results.get("fina_indicator")
+            if fina_indicator_df is not None and not fina_indicator_df.empty:
+                financial_data["fina_indicator"] = fina_indicator_df
+                logger.info(f"✅ 获取{label}{symbol}财务指标成功")
 
             result = {
                 "basic_info": info,
@@ -357,7 +311,7 @@ class FundamentalsService:
             return result
 
         except Exception as e:
-            logger.error(f"❌ AKShare 美股基本面数据获取失败: {e}")
+            logger.error(f"❌ AKShare {label}基本面数据获取失败: {e}")
             return None
 
     def _get_yfinance_fundamentals(
@@ -2,30 +2,71 @@
 Redis 缓存层，用于缓存热点宏观数据
 """
 
+import calendar
 import json
 import pickle
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Callable, Optional, Dict, Any, List
+from datetime import date, datetime, timedelta
 import logging
 import pandas as pd
 
 from ....core.connection_registry import get_connection_registry
+from ....utils.redis_cache import serialize_dataframe, deserialize_dataframe
+
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 宏观数据的发布滞后（天）：区间结束超过该天数后，区间内的数据才视为已全部发布
+MACRO_PUBLICATION_LAG_DAYS = 60
+
+
+def _period_end(time_value: str) -> Optional[date]:
+    """
+    时间参数所在周期的最后一天
+
+    支持 YYYY、YYYYMM、YYYY-MM、YYYYMMDD、YYYY-MM-DD 等格式（按数字部分的长度判断），
+    无法识别时返回 None。
+    """
+    digits = "".join(ch for ch in str(time_value) if ch.isdigit())
+    try:
+        if len(digits) == 4:
+            return date(int(digits), 12, 31)
+        if len(digits) == 6:
+            year, month = int(digits[:4]), int(digits[4:])
+            return date(year, month, calendar.monthrange(year, month)[1])
+        if len(digits) == 8:
+            return datetime.strptime(digits, "%Y%m%d").date()
+    except ValueError:
+        return None
+    return None
+
 
 class MacroDataCache:
     """宏观数据Redis缓存"""
 
-    def __init__(self):
-        """初始化缓存"""
+    def __init__(self, sync_active: Optional[Callable[[], bool]] = None):
+        """
+        初始化缓存
+
+        Args:
+            sync_active: 返回本进程同步调度器是否在运行的回调；调度器运行时
+                同步完成会主动失效缓存，已结束的区间可直接使用长TTL
+        """
         self.connection_registry = get_connection_registry()
+        self.sync_active = sync_active
         self.cache_prefix = "macro_data:"
 
-        # 缓存过期时间设置（秒）
+        # 缓存过期时间设置（秒），按数据变化的可能性分层
         self.cache_ttl = {
             "latest_data": 3600,  # 最新数据缓存1小时
-            "range_data": 1800,  # 范围数据缓存30分钟
+            "range_data": 1800,  # 覆盖当前周期的范围数据缓存30分钟
+            # 已结束且数据已发布完毕的范围数据不再变化，缓存7天
+            "settled_range_data": 604800,
             "indicator_list": 86400,  # 指标列表缓存24小时
             "sync_status": 300,  # 同步状态缓存5分钟
         }
@@ -43,21 +84,40 @@ class MacroDataCache:
         key_parts = [self.cache_prefix, category] + [str(arg) for arg in args]
         return ":".join(key_parts)
 
+    def _range_ttl(self, end_time: str) -> int:
+        """
+        范围数据的缓存时间：区间数据已不再变化时使用长TTL
+
+        区间结束后数据仍会按发布滞后陆续补齐，因此只有结束超过
+        MACRO_PUBLICATION_LAG_DAYS 天，或本进程调度器在运行（同步完成会主动失效缓存）
+        时，已结束的区间才视为稳定。
+        """
+        period_end = _period_end(end_time)
+        if period_end is None:
+            return self.cache_ttl["range_data"]
+
+        today = date.today()
+        if period_end < today and self.sync_active is not None and self.sync_active():
+            return self.cache_ttl["settled_range_data"]
+        if (today - period_end).days > MACRO_PUBLICATION_LAG_DAYS:
+            return self.cache_ttl["settled_range_data"]
+        return self.cache_ttl["range_data"]
+
     def _serialize_dataframe(self, df: pd.DataFrame) -> bytes:
-        """序列化DataFrame"""
+        """序列化DataFrame（与行情缓存共用 pickle + zlib 压缩格式）"""
         if df.empty:
             return b""
-        return pickle.dumps(df)
+        return serialize_dataframe(df)
 
     def _deserialize_dataframe(self, data: bytes) -> pd.DataFrame:
-        """反序列化DataFrame"""
+        """反序列化DataFrame（兼容未压缩的旧格式数据）"""
         if not data:
             return pd.DataFrame()
         try:
             # 确保数据是bytes类型
             if isinstance(data, str):
                 data = data.encode("utf-8")
-            return pickle.loads(data)
+            return deserialize_dataframe(data)
         except (pickle.UnpicklingError, UnicodeDecodeError, TypeError) as e:
             logger.error(f"❌ 反序列化DataFrame失败: {e}")
             return pd.DataFrame()
@@ -172,7 +232,7 @@ class MacroDataCache:
             key = self._make_key("range", indicator, start_time, end_time)
             serialized_data = self._serialize_dataframe(data)
 
-            self.redis_client.setex(key, self.cache_ttl["range_data"], serialized_data)
+            self.redis_client.setex(key, self._range_ttl(end_time), serialized_data)
 
             logger.debug(f"💾 缓存已保存: {indicator} {start_time}~{end_time} 范围数据")
 
@@ -200,7 +260,7 @@ class MacroDataCache:
                 else:
                     data_str = str(data)
 
-                status = json.loads(data_str)
+                status = orjson.loads(data_str) if orjson else json.loads(data_str)
                 logger.debug("🎯 缓存命中: 同步状态")
                 return status
 
@@ -217,7 +277,10 @@ class MacroDataCache:
 
         try:
             key = self._make_key("sync_status")
-            data = json.dumps(status, ensure_ascii=False, default=str)
+            if orjson is not None:
+                data = orjson.dumps(status, default=str)
+            else:
+                data = json.dumps(status, ensure_ascii=False, default=str)
 
             self.redis_client.setex(key, self.cache_ttl["sync_status"], data)
 
@@ -279,7 +342,7 @@ class MacroDataCache:
             for key in keys:
                 try:
                     key_str = key.decode("utf-8") if isinstance(key, bytes) else key
-                    parts = key_str.split(":")
+                    parts = key_str.split(":", 3)
                     if len(parts) >= 3:
                         category = parts[2]  # macro_data:category:...
                         stats["categories"][category] = (
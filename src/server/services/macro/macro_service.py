@@ -31,7 +31,11 @@ class MacroDataService:
         self.connection_registry = get_connection_registry()
 
         # 初始化缓存
-        self.cache = MacroDataCache() if enable_cache else None
+        self.cache = (
+            MacroDataCache(sync_active=self._scheduler_running)
+            if enable_cache
+            else None
+        )
         self.cache_enabled = enable_cache and self.cache is not None
 
         # 初始化同步引擎和调度器
@@ -51,6 +55,11 @@ class MacroDataService:
             f"调度器: {'开启' if self.scheduler else '关闭'})"
         )
 
+    def _scheduler_running(self) -> bool:
+        """本进程的同步调度器是否在运行"""
+        scheduler = getattr(self, "scheduler", None)
+        return scheduler is not None and scheduler.is_running
+
     def _on_sync_complete(self, result: Dict[str, Any]):
         """同步完成回调 - 清除相关缓存"""
         if not self.cache_enabled:
@@ -11,7 +11,7 @@ import time
 
 from .tushare_fetcher import TushareMacroFetcher
 from ..storage.manager import StorageManager
-from ..storage.base import INDICATOR_TIME_FIELD, INDICATOR_FREQUENCY
+from ..storage.base import INDICATOR_FREQUENCY
 
 logger = logging.getLogger(__name__)
 
@@ -149,21 +149,14 @@ class IncrementalSyncEngine:
         """获取数据库中最新的时间点"""
         try:
             storage = self.storage_manager.get_storage()
-            latest_data = storage.get_latest_data(indicator, periods=1)
 
-            if latest_data.empty:
-                return None
-
-            # 获取时间字段名
-            time_field = INDICATOR_TIME_FIELD.get(indicator)
-            if not time_field or time_field not in latest_data.columns:
-                logger.error(f"❌ {indicator} 缺少时间字段: {time_field}")
+            # 直接查询 MAX(时间字段)，无需为取一个值构造DataFrame
+            latest_period = storage.get_latest_period(indicator)
+            if latest_period is None:
                 return None
 
-            # 获取最新的时间点
-            latest_period = latest_data[time_field].iloc[0]
             logger.info(f"📊 {indicator} 数据库最新时间点: {latest_period}")
-            return str(latest_period)
+            return latest_period
 
         except Exception as e:
             logger.error(f"❌ 获取 {indicator} 最新时间点失败: {e}")
@@ -272,8 +265,8 @@ class IncrementalSyncEngine:
         elif frequency == "irregular":
             # 日期比较
             try:
-                date1 = datetime.strptime(period1, "%Y%m%d")
-                date2 = datetime.strptime(period2, "%Y%m%d")
+                date1 = datetime.fromisoformat(period1)
+                date2 = datetime.fromisoformat(period2)
                 return date1 > date2
             except ValueError:
                 return period1 > period2
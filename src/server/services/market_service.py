@@ -5,19 +5,47 @@
 实现智能降级机制，并能够生成完整的市场技术分析报告
 """
 import logging
+import random
+import threading
+import time
 import warnings
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
 from ..utils.symbol_processor import get_symbol_processor
+from ..utils.concurrency import SingleFlight
 from ..utils.data_source_strategy import get_data_source_strategy
 from ..exception.exception import DataNotFoundError
 
 logger = logging.getLogger("market_service")
 warnings.filterwarnings("ignore")
 
+# 报告中计算的移动平均线周期
+MA_WINDOWS = (5, 10, 20, 60)
+
+# 各数据源列名 -> 标准列名
+STANDARD_COLUMN_RENAME = {
+    "trade_date": "date",
+    "datetime": "date",
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+    "vol": "volume",
+    "amount": "turnover",
+    "turnover": "turnover",
+}
+
+# 日线数据进程内缓存：条目上限，以及过期时间区间（秒，最小值, 最大值）。
+# 区间包含今天的数据当天仍会变化，只短期缓存；已收盘的历史区间数据不再变化，可长期缓存。
+# 写入时在区间内随机取值，避免同时过期、集中回源
+DAILY_CACHE_MAX_ENTRIES = 1024
+DAILY_CACHE_TTL_OPEN = (240, 360)
+DAILY_CACHE_TTL_CLOSED = (79200, 93600)
+
 
 class MarketDataService:
     """市场数据服务 - 支持多数据源降级和报告生成"""
@@ -29,6 +57,13 @@ class MarketDataService:
         self.services = {}
         self._init_services()
 
+        # (代码, 开始日期, 结束日期) -> (过期时间, 标准化后的日线数据)
+        self._daily_cache: Dict[Tuple[str, str, str], Tuple[float, pd.DataFrame]] = {}
+        self._daily_cache_lock = threading.Lock()
+
+        # 正在进行中的日线请求（按缓存键合并并发的重复请求）
+        self._daily_single_flight = SingleFlight()
+
     def _init_services(self):
         """初始化各数据源服务"""
         # 1. Tushare优化服务
@@ -67,7 +102,7 @@ class MarketDataService:
         except Exception as e:
             logger.warning(f"⚠️ YFinance服务初始化失败: {e}")
 
-    def get_data_source_priority(self, symbol: str) -> List[str]:
+    def get_data_source_priority(self, symbol: str) -> Tuple[str, ...]:
         """
         根据股票代码获取数据源优先级列表
 
@@ -75,7 +110,7 @@ class MarketDataService:
             symbol: 股票代码
 
         Returns:
-            List[str]: 数据源优先级列表
+            Tuple[str, ...]: 数据源优先级列表
         """
         return self.strategy.get_market_data_sources(symbol)
 
@@ -93,12 +128,74 @@ class MarketDataService:
         Returns:
             pd.DataFrame: 标准化的日线数据
         """
+        # 返回副本，避免调用方修改缓存内容
+        return self._get_daily_frame(symbol, start_date, end_date).copy()
+
+    def _get_daily_frame(
+        self, symbol: str, start_date: Optional[str], end_date: Optional[str]
+    ) -> pd.DataFrame:
+        """获取日线数据（优先内存缓存）；返回缓存中的对象本身，调用方不得修改"""
         # 设置默认日期
         if end_date is None:
             end_date = datetime.now().strftime("%Y-%m-%d")
         if start_date is None:
             start_date = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
 
+        cache_key = (symbol, start_date, end_date)
+        cached = self._get_cached_daily(cache_key)
+        if cached is not None:
+            logger.info(
+                f"📖 从内存缓存获取 {symbol} 的市场数据 ({start_date} 到 {end_date})"
+            )
+            return cached
+
+        def fetch() -> pd.DataFrame:
+            data = self._fetch_stock_daily_data(symbol, start_date, end_date)
+            self._set_cached_daily(cache_key, data)
+            return data
+
+        def log_wait() -> None:
+            logger.info(
+                f"⏳ {symbol} ({start_date} 到 {end_date}) 已有请求进行中，等待其结果"
+            )
+
+        # 同一区间已有请求在进行中时直接等待其结果，避免并发未命中重复回源
+        return self._daily_single_flight.do(cache_key, fetch, on_wait=log_wait)
+
+    def _get_cached_daily(
+        self, cache_key: Tuple[str, str, str]
+    ) -> Optional[pd.DataFrame]:
+        """读取日线数据缓存（未命中或已过期时返回None）"""
+        with self._daily_cache_lock:
+            entry = self._daily_cache.get(cache_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._daily_cache[cache_key]
+                return None
+            return entry[1]
+
+    def _set_cached_daily(
+        self, cache_key: Tuple[str, str, str], data: pd.DataFrame
+    ) -> None:
+        """写入日线数据缓存，按结束日期是否包含今天选择过期时间"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        ttl_range = (
+            DAILY_CACHE_TTL_OPEN if cache_key[2] >= today else DAILY_CACHE_TTL_CLOSED
+        )
+        expires_at = time.monotonic() + random.randint(*ttl_range)
+
+        with self._daily_cache_lock:
+            self._daily_cache.pop(cache_key, None)
+            # 超出上限时淘汰最早写入的条目
+            while len(self._daily_cache) >= DAILY_CACHE_MAX_ENTRIES:
+                del self._daily_cache[next(iter(self._daily_cache))]
+            self._daily_cache[cache_key] = (expires_at, data)
+
+    def _fetch_stock_daily_data(
+        self, symbol: str, start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """按数据源优先级依次尝试获取日线数据（缓存未命中时的实际执行体）"""
         # 获取数据源优先级
         data_sources = self.get_data_source_priority(symbol)
 
@@ -171,29 +268,15 @@ class MarketDataService:
         # 确保必要的列存在
         required_columns = ["date", "open", "high", "low", "close", "volume"]
 
-        # 列名映射
-        column_mapping = {
-            "trade_date": "date",
-            "datetime": "date",
-            "Open": "open",
-            "High": "high",
-            "Low": "low",
-            "Close": "close",
-            "Volume": "volume",
-            "vol": "volume",
-            "amount": "turnover",
-            "turnover": "turnover",
-        }
-
         # 重命名列
-        data = data.rename(columns=column_mapping)
+        data = data.rename(columns=STANDARD_COLUMN_RENAME)
 
         # 确保日期列是datetime类型
         if "date" in data.columns:
             data["date"] = pd.to_datetime(data["date"])
 
-        # 排序
-        if "date" in data.columns:
+        # 排序：各数据源大多已返回升序数据，先做 O(n) 的有序检查，避免重复排序复制
+        if "date" in data.columns and not data["date"].is_monotonic_increasing:
             data = data.sort_values("date")
 
         # 添加数据源标识
@@ -217,35 +300,29 @@ class MarketDataService:
         indicators = {}
 
         try:
+            # 一次性取出 numpy 数组；只需要最新值的指标直接在数组尾部窗口上计算，
+            # 无需生成整列 rolling 序列
+            close = data["close"].to_numpy(dtype=float)
+            size = len(close)
+
             # 移动平均线
-            indicators["MA5"] = (
-                float(data["close"].rolling(5).mean().iloc[-1])
-                if len(data) >= 5
-                else None
-            )
-            indicators["MA10"] = (
-                float(data["close"].rolling(10).mean().iloc[-1])
-                if len(data) >= 10
-                else None
-            )
-            indicators["MA20"] = (
-                float(data["close"].rolling(20).mean().iloc[-1])
-                if len(data) >= 20
-                else None
-            )
-            indicators["MA60"] = (
-                float(data["close"].rolling(60).mean().iloc[-1])
-                if len(data) >= 60
-                else None
-            )
+            for window in MA_WINDOWS:
+                indicators[f"MA{window}"] = (
+                    float(close[-window:].mean()) if size >= window else None
+                )
 
             # RSI
-            if len(data) >= 14:
-                delta = data["close"].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-                rs = gain / loss
-                indicators["RSI"] = float((100 - (100 / (1 + rs))).iloc[-1])
+            if size >= 14:
+                # 只有14根K线时首个涨跌按0计（与 diff 后 NaN 经 where 置0 的结果一致）
+                if size > 14:
+                    delta = np.diff(close[-15:])
+                else:
+                    delta = np.diff(close, prepend=close[0])
+                gain = np.where(delta > 0, delta, 0).mean()
+                loss = np.where(delta < 0, -delta, 0).mean()
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    rs = gain / loss
+                indicators["RSI"] = float(100 - (100 / (1 + rs)))
 
             # MACD
             if len(data) >= 26:
@@ -260,12 +337,13 @@ class MarketDataService:
                 indicators["MACD_Histogram"] = float(histogram.iloc[-1])
 
             # 布林带
-            if len(data) >= 20:
-                sma = data["close"].rolling(20).mean()
-                std = data["close"].rolling(20).std()
-                indicators["BOLL_Upper"] = float((sma + 2 * std).iloc[-1])
-                indicators["BOLL_Middle"] = float(sma.iloc[-1])
-                indicators["BOLL_Lower"] = float((sma - 2 * std).iloc[-1])
+            if size >= 20:
+                window = close[-20:]
+                sma = window.mean()
+                std = window.std(ddof=1)
+                indicators["BOLL_Upper"] = float(sma + 2 * std)
+                indicators["BOLL_Middle"] = float(sma)
+                indicators["BOLL_Lower"] = float(sma - 2 * std)
 
             # KDJ
             if len(data) >= 9:
@@ -281,12 +359,20 @@ class MarketDataService:
                 indicators["KDJ_J"] = float(j.iloc[-1])
 
             # ATR (平均真实波幅)
-            if len(data) >= 14:
-                high_low = data["high"] - data["low"]
-                high_close = np.abs(data["high"] - data["close"].shift())
-                low_close = np.abs(data["low"] - data["close"].shift())
-                tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-                indicators["ATR"] = float(tr.rolling(14).mean().iloc[-1])
+            if size >= 14:
+                recent_high = data["high"].to_numpy(dtype=float)[-14:]
+                recent_low = data["low"].to_numpy(dtype=float)[-14:]
+                # 首根K线没有前收盘价，用 NaN 占位，其真实波幅即为 high-low
+                if size > 14:
+                    prev_close = close[-15:-1]
+                else:
+                    prev_close = np.concatenate(([np.nan], close[:-1]))
+                # fmax 忽略 NaN，与 DataFrame.max(axis=1) 的行为一致
+                tr = np.fmax(
+                    np.fmax(recent_high - recent_low, np.abs(recent_high - prev_close)),
+                    np.abs(recent_low - prev_close),
+                )
+                indicators["ATR"] = float(tr.mean())
 
         except Exception as e:
             logger.error(f"❌ 计算技术指标失败: {e}")
@@ -308,8 +394,8 @@ class MarketDataService:
             str: Markdown格式的分析报告
         """
         try:
-            # 获取股票数据
-            data = self.get_stock_daily_data(symbol, start_date, end_date)
+            # 获取股票数据（报告只读取数据，直接使用缓存中的DataFrame，无需复制）
+            data = self._get_daily_frame(symbol, start_date, end_date)
 
             if data.empty:
                 return f"❌ 无法获取 {symbol} 的市场数据"
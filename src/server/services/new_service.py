@@ -18,15 +18,24 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import sys
+import threading
+import time
 from pathlib import Path
 
+# orjson 为可选依赖，未安装时回退到 requests 自带的 JSON 解析
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 添加项目根目录到路径
 project_root = Path(__file__).resolve().parents[3]
 if str(project_root) not in sys.path:
@@ -36,7 +45,10 @@ if str(project_root) not in sys.path:
 from src.config.settings import get_settings
 
 # 导入服务
-from src.server.services.akshare_service import AkshareService
+from src.server.services.akshare_service import (
+    AkshareService,
+    filter_by_publish_time,
+)
 
 # 导入工具
 from src.server.utils.symbol_processor import get_symbol_processor
@@ -45,10 +57,106 @@ from src.server.utils.symbol_processor import get_symbol_processor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("new_service")
 
+# 新闻数据源共享的HTTP连接池大小（各数据源并行请求时复用keep-alive连接）
+HTTP_POOL_SIZE = 16
+
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """获取新闻数据源共享的 requests.Session（单例），避免每次请求重新建立TCP/TLS连接"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def _parse_json(response: requests.Response):
+    """解析响应JSON，优先使用orjson直接解析原始字节"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# 新闻数据源接口地址（查询参数统一通过 params 传递，由 requests 负责编码）
+FINNHUB_NEWS_URL = "https://finnhub.io/api/v1/company-news"
+ALPHAVANTAGE_QUERY_URL = "https://www.alphavantage.co/query"
+NEWSAPI_EVERYTHING_URL = "https://newsapi.org/v2/everything"
+
+# 新闻数据源 -> 使用的股票代码格式（symbol_processor 生成的 formats 键）
+NEWS_SOURCE_SYMBOL_FORMATS = {
+    "finnhub": "yfinance",  # FinnHub使用类似yfinance格式
+    "alphavantage": "yfinance",
+    "newsapi": "news_api",
+    "eastmoney": "akshare",
+}
+
+# 各数据源相邻两次请求的最小间隔（秒），按官方免费额度设置
+# FinnHub 60次/分钟，Alpha Vantage 5次/分钟，NewsAPI 无分钟级限制但仍做轻度限流
+NEWS_SOURCE_MIN_INTERVAL = {
+    "FinnHub": 1.0,
+    "AlphaVantage": 12.0,
+    "NewsAPI": 1.0,
+}
+
+# 被限流（HTTP 429）时的指数退避重试：最多尝试次数与单次等待上限（秒）
+RATE_LIMIT_MAX_ATTEMPTS = 3
+RATE_LIMIT_MAX_BACKOFF = 30
+
+# 错误响应只读取响应体的前若干字节用于日志
+ERROR_BODY_PREVIEW_BYTES = 256
+
+# 东方财富新闻字段 -> 候选列名（按优先级，实际列名因接口版本而异）
+EASTMONEY_NEWS_COLUMNS = {
+    "title": ("新闻标题", "标题", "title"),
+    "content": ("新闻内容", "内容", "content"),
+    "url": ("新闻链接", "链接", "url"),
+}
+
+# 排队等待限流的最长时间（秒）：需要等待更久时本次跳过该数据源，
+# 避免并发调用在 Alpha Vantage 等低频数据源上逐个排队
+RATE_LIMIT_MAX_WAIT = 15.0
+
+# 按数据源名称共享的限流状态（不同代理配置的服务实例共用，状态放在模块级）
+_rate_limit_lock = threading.Lock()
+_next_request_at: Dict[str, float] = {}
+
+
+def _wait_for_rate_limit(source_name: str) -> bool:
+    """
+    预约数据源的下一个请求时间槽，并在锁外等待到该时刻
+
+    相邻时间槽间隔不小于 NEWS_SOURCE_MIN_INTERVAL；锁内只做预约，
+    并发调用各自在锁外等待。需要等待超过 RATE_LIMIT_MAX_WAIT 秒时
+    不预约并返回 False。
+    """
+    min_interval = NEWS_SOURCE_MIN_INTERVAL.get(source_name)
+    if not min_interval:
+        return True
 
-@dataclass
+    with _rate_limit_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at.get(source_name, 0.0))
+        wait = slot - now
+        if wait > RATE_LIMIT_MAX_WAIT:
+            return False
+        _next_request_at[source_name] = slot + min_interval
+
+    if wait > 0:
+        logger.info(f"[{source_name}] 触发限流，等待 {wait:.1f} 秒")
+        time.sleep(wait)
+    return True
+
+
+@dataclass(slots=True)
 class NewsArticle:
-    """统一的新闻文章数据结构"""
+    """统一的新闻文章数据结构（使用 __slots__，每条新闻不再分配实例 __dict__）"""
 
     title: str
     content: str
@@ -60,8 +168,8 @@ class NewsArticle:
     sentiment: str = "neutral"  # positive, negative, neutral
 
     def to_dict(self) -> Dict:
-        """转换为字典格式"""
-        return asdict(self)
+        """转换为字典格式（字段均为标量，按槽位逐个取值，无需 asdict 的递归深拷贝）"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class NewsDataSource:
@@ -71,11 +179,43 @@ class NewsDataSource:
         self.name = name
         self.enabled = enabled
         self.settings = get_settings()
+        self.session = get_http_session()
 
     def is_available(self) -> bool:
         """检查数据源是否可用"""
         return self.enabled
 
+    def _get(self, url: str, **kwargs) -> Optional[requests.Response]:
+        """
+        经过按数据源限流后发起 GET 请求，遇到 HTTP 429 时指数退避重试
+
+        以流式方式请求：成功响应由调用方读取完整响应体；错误响应只读取前
+        ERROR_BODY_PREVIEW_BYTES 字节记录日志后立即关闭，调用方只使用其状态码。
+        限流排队超过 RATE_LIMIT_MAX_WAIT 秒时不发请求，返回 None
+        """
+        for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+            if not _wait_for_rate_limit(self.name):
+                logger.warning(
+                    f"[{self.name}] 限流排队超过 {RATE_LIMIT_MAX_WAIT:.0f} 秒，本次跳过"
+                )
+                return None
+            response = self.session.get(url, stream=True, **kwargs)
+            if response.status_code == 200:
+                return response
+
+            preview = response.raw.read(ERROR_BODY_PREVIEW_BYTES, decode_content=True)
+            response.close()
+            logger.debug(
+                f"[{self.name}] HTTP {response.status_code} 响应片段: {preview!r}"
+            )
+            if response.status_code != 429 or attempt == RATE_LIMIT_MAX_ATTEMPTS - 1:
+                return response
+
+            delay = min(RATE_LIMIT_MAX_BACKOFF, 2**attempt)
+            logger.warning(f"[{self.name}] 请求被限流(429)，{delay} 秒后重试")
+            time.sleep(delay)
+        return response
+
     def fetch_news(
         self, symbol: str, start_date: datetime, end_date: datetime
     ) -> List[NewsArticle]:
@@ -90,6 +230,8 @@ class FinnHubNewsSource(NewsDataSource):
         super().__init__("FinnHub")
         self.api_key = os.getenv("FINNHUB_API_KEY", "")
         self.enabled = bool(self.api_key)
+        # 固定的查询参数（API密钥）只构造一次，每次请求与变化的参数合并
+        self._fixed_params = {"token": self.api_key}
 
     def is_available(self) -> bool:
         return self.enabled and bool(self.api_key)
@@ -106,19 +248,20 @@ class FinnHubNewsSource(NewsDataSource):
             f"[{self.name}] 获取 {symbol} 的新闻: {start_date.date()} 到 {end_date.date()}"
         )
 
-        url = "https://finnhub.io/api/v1/company-news"
         params = {
+            **self._fixed_params,
             "symbol": symbol,
             "from": start_date.strftime("%Y-%m-%d"),
             "to": end_date.strftime("%Y-%m-%d"),
-            "token": self.api_key,
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get(FINNHUB_NEWS_URL, params=params, timeout=10)
+            if response is None:
+                return []
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if not data:
                     logger.info(f"[{self.name}] 未找到 {symbol} 的新闻数据")
                     return []
@@ -164,6 +307,12 @@ class AlphaVantageNewsSource(NewsDataSource):
         super().__init__("AlphaVantage")
         self.api_key = os.getenv("ALPHA_VANTAGE_API_KEY", "")
         self.enabled = bool(self.api_key)
+        # 固定的查询参数只构造一次，每次请求与变化的参数合并
+        self._fixed_params = {
+            "function": "NEWS_SENTIMENT",
+            "apikey": self.api_key,
+            "limit": 100,
+        }
 
     def is_available(self) -> bool:
         return self.enabled and bool(self.api_key)
@@ -180,33 +329,31 @@ class AlphaVantageNewsSource(NewsDataSource):
             f"[{self.name}] 获取 {symbol} 的新闻: {start_date.date()} 到 {end_date.date()}"
         )
 
-        url = "https://www.alphavantage.co/query"
-        params = {
-            "function": "NEWS_SENTIMENT",
-            "tickers": symbol,
-            "apikey": self.api_key,
-            "limit": 100,
-        }
+        params = {**self._fixed_params, "tickers": symbol}
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get(ALPHAVANTAGE_QUERY_URL, params=params, timeout=10)
+            if response is None:
+                return []
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
 
                 if "feed" not in data:
                     logger.info(f"[{self.name}] 未找到 {symbol} 的新闻数据")
                     return []
 
                 news_list = []
+                # 缺少发布时间的条目统一使用本次请求的时间
+                now = datetime.now()
                 for item in data.get("feed", []):
                     try:
                         # 解析时间
                         time_str = item.get("time_published", "")
                         if time_str:
-                            pub_time = datetime.strptime(time_str, "%Y%m%dT%H%M%S")
+                            pub_time = datetime.fromisoformat(time_str)
                         else:
-                            pub_time = datetime.now()
+                            pub_time = now
 
                         # 过滤时间范围
                         if not (start_date <= pub_time <= end_date):
@@ -256,6 +403,12 @@ class NewsAPISource(NewsDataSource):
         self.api_key = os.getenv("NEWSAPI_KEY", "")
         self.enabled = bool(self.api_key)
         self.proxies = None
+        # 固定的查询参数只构造一次，每次请求与变化的参数合并
+        self._fixed_params = {
+            "language": "en",
+            "sortBy": "publishedAt",
+            "apiKey": self.api_key,
+        }
 
         if use_proxy:
             self.proxies = {
@@ -287,29 +440,33 @@ class NewsAPISource(NewsDataSource):
         # 构建查询关键词
         query = f"{symbol}"
 
-        url = "https://newsapi.org/v2/everything"
         params = {
+            **self._fixed_params,
             "q": query,
-            "language": "en",
-            "sortBy": "publishedAt",
             "from": start_date.strftime("%Y-%m-%d"),
             "to": end_date.strftime("%Y-%m-%d"),
-            "apiKey": self.api_key,
         }
 
         try:
-            response = requests.get(
-                url, params=params, proxies=self.proxies, timeout=10
+            response = self._get(
+                NEWSAPI_EVERYTHING_URL,
+                params=params,
+                proxies=self.proxies,
+                timeout=10,
             )
+            if response is None:
+                return []
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
 
                 if data.get("status") != "ok" or not data.get("articles"):
                     logger.info(f"[{self.name}] 未找到 {symbol} 的新闻数据")
                     return []
 
                 news_list = []
+                # 缺少发布时间的条目统一使用本次请求的时间
+                now = datetime.now()
                 for item in data.get("articles", []):
                     try:
                         pub_time_str = item.get("publishedAt", "")
@@ -318,7 +475,7 @@ class NewsAPISource(NewsDataSource):
                                 pub_time_str.replace("Z", "+00:00")
                             )
                         else:
-                            pub_time = datetime.now()
+                            pub_time = now
 
                         news = NewsArticle(
                             title=item.get("title", ""),
@@ -371,8 +528,10 @@ class EastMoneyNewsSource(NewsDataSource):
         )
 
         try:
-            # 获取新闻数据
-            df = self.akshare_service.get_stock_news_em(symbol, max_news=100)
+            # 获取新闻数据（时间范围在截断条数之前过滤）
+            df = self.akshare_service.get_stock_news_em(
+                symbol, max_news=100, start_date=start_date, end_date=end_date
+            )
 
             if df is None or df.empty:
                 logger.info(f"[{self.name}] 未找到 {symbol} 的新闻数据")
@@ -391,43 +550,30 @@ class EastMoneyNewsSource(NewsDataSource):
                 )
                 return []
 
-            # 过滤时间范围
-            news_list = []
-            for _, row in df.iterrows():
-                try:
-                    # 解析时间
-                    time_str = str(row[time_column])
-                    try:
-                        pub_time = pd.to_datetime(time_str)
-                    except Exception:
-                        # 尝试其他格式
-                        pub_time = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-
-                    # 时区处理
-                    if pub_time.tzinfo is None:
-                        pub_time = pub_time.replace(tzinfo=None)
-                    else:
-                        pub_time = pub_time.replace(tzinfo=None)
-
-                    # 过滤时间范围
-                    if not (start_date <= pub_time <= end_date):
-                        continue
+            # "发布时间"列已在 get_stock_news_em 中解析并过滤，其他时间列才在此过滤
+            if time_column != "发布时间":
+                df = filter_by_publish_time(df, time_column, start_date, end_date)
 
-                    # 提取标题和内容 (使用东方财富的实际列名)
-                    title = str(
-                        row.get("新闻标题", row.get("标题", row.get("title", "")))
-                    )
-                    content = str(
-                        row.get("新闻内容", row.get("内容", row.get("content", "")))
-                    )
-                    url = str(row.get("新闻链接", row.get("链接", row.get("url", ""))))
+            # 发布时间整列格式化一次，循环内只构造新闻对象
+            publish_times = df[time_column].dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+            # 标题、内容、链接各自使用哪一列只需判断一次，循环内直接按列取值
+            titles, contents, urls = (
+                self._column_values(df, EASTMONEY_NEWS_COLUMNS[field])
+                for field in ("title", "content", "url")
+            )
 
+            news_list = []
+            for title, content, url, publish_time in zip(
+                titles, contents, urls, publish_times
+            ):
+                try:
                     news = NewsArticle(
-                        title=title,
-                        content=content,
+                        title=str(title),
+                        content=str(content),
                         source=self.name,
-                        publish_time=pub_time.isoformat(),
-                        url=url,
+                        publish_time=publish_time,
+                        url=str(url),
                         symbol=symbol,
                         relevance_score=0.9,  # 东方财富针对性强
                     )
@@ -444,6 +590,14 @@ class EastMoneyNewsSource(NewsDataSource):
             logger.error(f"[{self.name}] 请求异常: {e}")
             return []
 
+    @staticmethod
+    def _column_values(df: pd.DataFrame, candidates: Tuple[str, ...]) -> List:
+        """取候选列中第一个存在的列的值；都不存在时返回等长的空字符串列表"""
+        for column in candidates:
+            if column in df.columns:
+                return df[column].tolist()
+        return [""] * len(df)
+
 
 class MultiSourceNewsService:
     """多数据源新闻服务"""
@@ -604,18 +758,10 @@ class MultiSourceNewsService:
         formats = symbol_info["formats"]
 
         for source_name in source_priority:
-            if source_name == "finnhub":
-                formatted[source_name] = formats[
-                    "yfinance"
-                ]  # FinnHub使用类似yfinance格式
-            elif source_name == "alphavantage":
-                formatted[source_name] = formats["yfinance"]
-            elif source_name == "newsapi":
-                formatted[source_name] = formats["news_api"]
-            elif source_name == "eastmoney":
-                formatted[source_name] = formats["akshare"]
-            else:
-                formatted[source_name] = original_symbol
+            format_name = NEWS_SOURCE_SYMBOL_FORMATS.get(source_name)
+            formatted[source_name] = (
+                formats[format_name] if format_name else original_symbol
+            )
 
         logger.info(f"📝 代码格式化: {formatted}")
         return formatted
@@ -692,13 +838,15 @@ class MultiSourceNewsService:
                     continue
                 seen_urls.add(url_key)
 
-            # 策略2: 标题+时间组合去重
+            # 策略2: 标题+时间组合去重（空标题直接跳过，不再构造组合键）
             title_key = news.title.lower().strip()
-            time_key = news.publish_time[:10] if news.publish_time else ""
-            combination_key = f"{title_key}|{time_key}"
+            if not title_key:
+                continue
 
-            # 跳过空标题或已见过的组合
-            if not title_key or combination_key in seen_combinations:
+            # 元组作为组合键，免去每条新闻的字符串拼接
+            time_key = news.publish_time[:10] if news.publish_time else ""
+            combination_key = (title_key, time_key)
+            if combination_key in seen_combinations:
                 continue
 
             seen_combinations.add(combination_key)
@@ -711,6 +859,10 @@ class MultiSourceNewsService:
 # ============ 便捷函数 ============
 
 
+# 新闻服务实例: 是否使用代理 -> 服务实例
+_news_services: Dict[bool, MultiSourceNewsService] = {}
+
+
 def get_news_service(use_proxy: bool = False) -> MultiSourceNewsService:
     """
     获取新闻服务实例
@@ -719,9 +871,13 @@ def get_news_service(use_proxy: bool = False) -> MultiSourceNewsService:
         use_proxy: NewsAPI是否使用代理
 
     Returns:
-        MultiSourceNewsService: 新闻服务实例
+        MultiSourceNewsService: 新闻服务实例（按代理配置复用，API密钥只在创建时读取）
     """
-    return MultiSourceNewsService(use_proxy_for_newsapi=use_proxy)
+    service = _news_services.get(use_proxy)
+    if service is None:
+        service = MultiSourceNewsService(use_proxy_for_newsapi=use_proxy)
+        _news_services[use_proxy] = service
+    return service
 
 
 def get_stock_news(
@@ -8,17 +8,75 @@
 - 利用 Redis 缓存（特别是 AKShareMarketCache）来提高性能。
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Dict, List
+from numbers import Integral
+from typing import Annotated, Any, Optional, Dict, List
+import threading
+import time
 import pandas as pd
 
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator
 
 # 导入统一的股票代码处理器
 from ..utils.symbol_processor import get_symbol_processor
 
 # 导入AKShare市场数据缓存管理器
 from ..utils.redis_cache import AKShareMarketCache
+from ..utils.concurrency import SingleFlight
+
+# 批量行情的最大并发数，避免同时向数据源发起过多请求
+QUOTE_BATCH_MAX_WORKERS = 8
+
+_quote_executor = ThreadPoolExecutor(
+    max_workers=QUOTE_BATCH_MAX_WORKERS, thread_name_prefix="quote_batch"
+)
+
+# 各市场实时行情的数据源优先级（对于A股实时行情，AKShare的缓存通常是最高效的）
+QUOTE_DATA_SOURCES = {
+    "china": ("akshare", "tushare"),
+    "hk": ("yfinance", "akshare", "tushare"),
+    "us": ("yfinance", "akshare"),
+}
+
+# Tushare 每日指标在收盘后才发布当天数据：已确认不是当天数据的代码在此时间内
+# 不再向 Tushare 请求（秒）
+TUSHARE_STALE_TTL = 300
+
+# float 的最短往返表示（对 numpy.float64 等子类同样返回纯数字字符串）；
+# 不用 Decimal.from_float，它会展开为完整的二进制精确值（如 0.1 的 55 位小数）
+_float_repr = float.__repr__
+
+
+def _to_decimal(value: Any, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    """安全地将值转换为Decimal，处理无效操作和None；已是Decimal时直接返回"""
+    if value is None:
+        return default
+    if isinstance(value, Decimal):
+        return value
+    try:
+        # 行情数值绝大多数是浮点数（numpy.float64 也是 float 的子类），
+        # 优先走快速路径：NaN 自身不相等，无需 pd.isna；
+        # 直接取 float 的最短精确表示，不经过 numpy 的 repr，也不另建 float 对象
+        if isinstance(value, float):
+            return Decimal(_float_repr(value)) if value == value else default
+        if isinstance(value, str):
+            # AKShare返回的可能是字符串'--'
+            if not value.replace(".", "", 1).isdigit():
+                return default
+            return Decimal(value)
+        if isinstance(value, Integral):
+            return Decimal(int(value))
+        if pd.isna(value):
+            return default
+        return Decimal(_float_repr(float(value)))
+    except (InvalidOperation, TypeError, ValueError):
+        return default
+
+
+# 数值字段在模型层统一转换：外部经校验构造时可直接传入 float/str/Decimal
+DecimalField = Annotated[Optional[Decimal], BeforeValidator(_to_decimal)]
 
 
 class StockMarketDataDTO(BaseModel):
@@ -26,13 +84,15 @@ class StockMarketDataDTO(BaseModel):
     用于封装从市场获取的原始、通用股票行情数据的DTO。
     这个DTO不包含任何特定于用户的业务逻辑（如持仓市值），
     确保了此数据接口的通用性和可重用性。
+
+    服务内部构造时字段均已是 str / Decimal / None，使用 model_construct 跳过校验。
     """
 
     ticker: str
-    currentPrice: Optional[Decimal] = None
-    dailyChangePercent: Optional[Decimal] = None
-    peRatio: Optional[Decimal] = None
-    marketCap: Optional[Decimal] = None
+    currentPrice: DecimalField = None
+    dailyChangePercent: DecimalField = None
+    peRatio: DecimalField = None
+    marketCap: DecimalField = None
     source: Optional[str] = None
 
 
@@ -46,6 +106,16 @@ class QuoteService:
 
         # 初始化AKShare市场数据缓存管理器，这是获取实时数据的主要来源
         self.market_cache = AKShareMarketCache(cache_duration=3600)  # 1小时缓存
+        # A股行情由后台线程定期刷新快照，请求路径只做缓存查找
+        if "akshare" in self.services:
+            self.market_cache.start_background_refresh("china")
+
+        # 正在进行中的行情请求（按代码合并并发的重复请求）
+        self._single_flight = SingleFlight()
+
+        # Tushare 代码 -> 过期时间：这些代码的每日指标已确认不是当天数据
+        self._tushare_stale: Dict[str, float] = {}
+        self._tushare_stale_lock = threading.Lock()
 
     def _init_data_sources(self):
         """初始化底层数据源服务"""
@@ -87,14 +157,25 @@ class QuoteService:
         symbol_info = processor.process_symbol(symbol)
         ticker_symbol = symbol_info["formats"]["cache_key"]
 
+        def log_wait() -> None:
+            print(f"⏳ [QuoteService] {ticker_symbol} 已有请求进行中，等待其结果")
+
+        # 同一代码已有请求在进行中时直接等待其结果，避免并发重复请求数据源
+        return self._single_flight.do(
+            ticker_symbol, partial(self._fetch_quote, symbol_info), on_wait=log_wait
+        )
+
+    def _fetch_quote(self, symbol_info: Dict) -> StockMarketDataDTO:
+        """按数据源优先级依次尝试获取行情（单次请求的实际执行体）"""
+        ticker_symbol = symbol_info["formats"]["cache_key"]
+
         # 根据市场决定数据源的优先级
-        # 对于实时行情，AKShare的缓存通常是最高效的
         if symbol_info["is_china"]:
-            data_sources = ["akshare", "tushare"]
+            data_sources = QUOTE_DATA_SOURCES["china"]
         elif symbol_info["is_hk"]:
-            data_sources = ["yfinance", "akshare", "tushare"]
+            data_sources = QUOTE_DATA_SOURCES["hk"]
         else:  # 美股
-            data_sources = ["yfinance", "akshare"]
+            data_sources = QUOTE_DATA_SOURCES["us"]
 
         print(f"🔍 [QuoteService] 开始获取 {ticker_symbol} 的行情数据")
         print(f"📊 [QuoteService] 数据源策略: {' → '.join(data_sources)}")
@@ -125,7 +206,9 @@ class QuoteService:
         print(
             f"⚠️ [QuoteService] 所有数据源均无法获取 {ticker_symbol} 的行情，返回空数据。"
         )
-        return StockMarketDataDTO(ticker=ticker_symbol, source="fallback")
+        return StockMarketDataDTO.model_construct(
+            ticker=ticker_symbol, source="fallback"
+        )
 
     def get_stock_quotes_batch(self, symbols: List[str]) -> List[StockMarketDataDTO]:
         """
@@ -138,25 +221,112 @@ class QuoteService:
             List[StockMarketDataDTO]: 包含多个行情数据的DTO对象列表
         """
         print(f"📦 [QuoteService] 开始批量获取 {len(symbols)} 个股票的行情数据")
-        quotes = []
-        for symbol in symbols:
-            # 依次调用单次获取方法
-            quotes.append(self.get_stock_quote(symbol))
+        quotes: List[Optional[StockMarketDataDTO]] = [None] * len(symbols)
+
+        # A股的首选数据源是AKShare全市场缓存，一次批量查找即可覆盖所有A股代码
+        if "akshare" in self.services:
+            self._fill_china_quotes_from_cache(symbols, quotes)
+
+        # 缓存未命中的A股用一次Tushare批量请求补齐，而不是逐个请求
+        if "tushare" in self.services:
+            self._fill_china_quotes_from_tushare(symbols, quotes)
+
+        # 其余代码（非A股或缓存未命中）并发走单次获取的降级流程
+        pending = [i for i, quote in enumerate(quotes) if quote is None]
+        if len(pending) == 1:
+            quotes[pending[0]] = self.get_stock_quote(symbols[pending[0]])
+        elif pending:
+            pending_symbols = [symbols[i] for i in pending]
+            # map 保持与输入相同的顺序
+            for i, quote in zip(
+                pending, _quote_executor.map(self.get_stock_quote, pending_symbols)
+            ):
+                quotes[i] = quote
+
         return quotes
 
-    def _safe_decimal(
-        self, value: any, default: Optional[Decimal] = None
-    ) -> Optional[Decimal]:
-        """安全地将值转换为Decimal，处理无效操作和None"""
-        if value is None or value == "" or pd.isna(value):
-            return default
+    def _fill_china_quotes_from_cache(
+        self, symbols: List[str], quotes: List[Optional[StockMarketDataDTO]]
+    ) -> None:
+        """用AKShare A股全市场缓存批量填充 quotes 中的A股行情"""
+        processor = get_symbol_processor()
+        china_positions: Dict[str, List] = {}
+        for i, symbol in enumerate(symbols):
+            symbol_info = processor.process_symbol(symbol)
+            if symbol_info["is_china"]:
+                cache_key = symbol_info["formats"]["cache_key"]
+                china_positions.setdefault(cache_key, []).append((i, symbol_info))
+
+        if not china_positions:
+            return
+
         try:
-            # AKShare返回的可能是字符串'--'
-            if isinstance(value, str) and not value.replace(".", "", 1).isdigit():
-                return default
-            return Decimal(str(value))
-        except (InvalidOperation, TypeError, ValueError):
-            return default
+            rows = self.market_cache.get_multiple_stocks_data(
+                "china", list(china_positions)
+            )
+        except Exception as e:
+            print(f"❌ [QuoteService] 批量读取A股缓存失败: {e}")
+            return
+
+        for cache_key, market_data in rows.items():
+            for i, symbol_info in china_positions[cache_key]:
+                quotes[i] = self._build_akshare_quote(symbol_info, market_data)
+
+    def _fill_china_quotes_from_tushare(
+        self, symbols: List[str], quotes: List[Optional[StockMarketDataDTO]]
+    ) -> None:
+        """用一次Tushare每日指标批量请求填充 quotes 中尚未获取到的A股行情"""
+        processor = get_symbol_processor()
+        china_positions: Dict[str, List] = {}
+        for i, symbol in enumerate(symbols):
+            if quotes[i] is not None:
+                continue
+            symbol_info = processor.process_symbol(symbol)
+            if symbol_info["is_china"]:
+                tushare_symbol = symbol_info["formats"]["tushare"]
+                if self._is_tushare_stale(tushare_symbol):
+                    continue
+                china_positions.setdefault(tushare_symbol, []).append((i, symbol_info))
+
+        if not china_positions:
+            return
+
+        try:
+            rows = self.services["tushare"].get_market_data_batch(list(china_positions))
+        except Exception as e:
+            print(f"❌ [QuoteService] Tushare批量获取A股行情失败: {e}")
+            return
+
+        stale = []
+        for tushare_symbol, positions in china_positions.items():
+            market_data = rows.get(tushare_symbol)
+            # 无数据或非当天数据：记录下来，单个获取的降级流程不再重复请求Tushare
+            if not market_data or not market_data.get("is_today", False):
+                stale.append(tushare_symbol)
+                continue
+            for i, symbol_info in positions:
+                quotes[i] = self._build_tushare_quote(symbol_info, market_data)
+        self._mark_tushare_stale(stale)
+
+    def _is_tushare_stale(self, tushare_symbol: str) -> bool:
+        """该代码的Tushare每日指标是否已确认不是当天数据（且记录未过期）"""
+        with self._tushare_stale_lock:
+            expires_at = self._tushare_stale.get(tushare_symbol)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._tushare_stale[tushare_symbol]
+                return False
+            return True
+
+    def _mark_tushare_stale(self, tushare_symbols: List[str]) -> None:
+        """记录每日指标不是当天数据的代码，TUSHARE_STALE_TTL 秒内跳过Tushare"""
+        if not tushare_symbols:
+            return
+        expires_at = time.monotonic() + TUSHARE_STALE_TTL
+        with self._tushare_stale_lock:
+            for tushare_symbol in tushare_symbols:
+                self._tushare_stale[tushare_symbol] = expires_at
 
     def _get_from_akshare_cache(
         self, symbol_info: Dict
@@ -176,15 +346,20 @@ class QuoteService:
         if not market_data:
             return None
 
-        # 将AKShare返回的字典映射到DTO
-        return StockMarketDataDTO(
+        return self._build_akshare_quote(symbol_info, market_data)
+
+    def _build_akshare_quote(
+        self, symbol_info: Dict, market_data: Dict
+    ) -> StockMarketDataDTO:
+        """将AKShare全市场数据中的单行记录映射到DTO"""
+        return StockMarketDataDTO.model_construct(
             ticker=symbol_info["formats"]["cache_key"],
-            currentPrice=self._safe_decimal(market_data.get("最新价")),
-            dailyChangePercent=self._safe_decimal(market_data.get("涨跌幅")),
-            peRatio=self._safe_decimal(
+            currentPrice=_to_decimal(market_data.get("最新价")),
+            dailyChangePercent=_to_decimal(market_data.get("涨跌幅")),
+            peRatio=_to_decimal(
                 market_data.get("市盈率-动态") or market_data.get("市盈率")
             ),
-            marketCap=self._safe_decimal(market_data.get("总市值")),
+            marketCap=_to_decimal(market_data.get("总市值")),
             source="akshare_cache",
         )
 
@@ -201,21 +376,21 @@ class QuoteService:
             return None
 
         # YFinance数据映射
-        return StockMarketDataDTO(
+        return StockMarketDataDTO.model_construct(
             ticker=symbol_info["formats"]["cache_key"],
-            currentPrice=self._safe_decimal(
+            currentPrice=_to_decimal(
                 info.get("currentPrice") or info.get("regularMarketPrice")
             ),
             dailyChangePercent=(
-                self._safe_decimal(
+                _to_decimal(
                     (info.get("currentPrice", 0) / info.get("previousClose", 1) - 1)
                     * 100
                 )
                 if info.get("previousClose")
                 else None
             ),
-            peRatio=self._safe_decimal(info.get("trailingPE") or info.get("forwardPE")),
-            marketCap=self._safe_decimal(info.get("marketCap")),
+            peRatio=_to_decimal(info.get("trailingPE") or info.get("forwardPE")),
+            marketCap=_to_decimal(info.get("marketCap")),
             source="yfinance",
         )
 
@@ -229,29 +404,54 @@ class QuoteService:
             return None
 
         tushare_symbol = symbol_info["formats"]["tushare"]
-        market_data = tushare_service.get_market_data(tushare_symbol)
-
-        if not market_data:
+        # 刚确认过没有当天数据的代码不再重复请求
+        if self._is_tushare_stale(tushare_symbol):
             return None
 
+        market_data = tushare_service.get_market_data(tushare_symbol)
+
         # 如果Tushare返回的不是当天的数据，则认为获取失败，触发降级
-        if not market_data.get("is_today", False):
+        if not market_data or not market_data.get("is_today", False):
+            self._mark_tushare_stale([tushare_symbol])
             print(f"ℹ️ [QuoteService] Tushare 未能获取到当天数据，将尝试下一个数据源。")
             return None
 
-        # Tushare数据映射
+        return self._build_tushare_quote(symbol_info, market_data)
+
+    def _build_tushare_quote(
+        self, symbol_info: Dict, market_data: Dict
+    ) -> StockMarketDataDTO:
+        """将Tushare每日指标记录映射到DTO"""
         market_cap_yuan = (market_data.get("total_mv", 0) or 0) * 10000
 
-        return StockMarketDataDTO(
+        return StockMarketDataDTO.model_construct(
             ticker=symbol_info["formats"]["cache_key"],
             # Tushare basic daily不直接提供当前价，这里可以留空或使用昨收
             currentPrice=None,
             dailyChangePercent=None,
-            peRatio=self._safe_decimal(
+            peRatio=_to_decimal(
                 market_data.get("pe_ttm") or market_data.get("pe")
             ),
             marketCap=(
-                self._safe_decimal(market_cap_yuan) if market_cap_yuan > 0 else None
+                _to_decimal(market_cap_yuan) if market_cap_yuan > 0 else None
             ),
             source="tushare",
         )
+
+
+# ==================== 便捷函数 ====================
+
+_global_service: Optional[QuoteService] = None
+
+
+def get_quote_service() -> QuoteService:
+    """
+    获取行情服务单例
+
+    QuoteService 初始化时会创建各数据源服务并启动A股快照的后台刷新，
+    按请求重复创建代价很高，且会丢失进行中请求的合并状态。
+    """
+    global _global_service
+    if _global_service is None:
+        _global_service = QuoteService()
+    return _global_service
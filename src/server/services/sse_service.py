@@ -97,14 +97,14 @@ class SSEManager:
     async def remove_connection(self, client_id: str) -> bool:
         """移除SSE连接"""
         async with self._lock:
-            if client_id in self.connections:
-                connection = self.connections[client_id]
+            connection = self.connections.pop(client_id, None)
+            if connection is not None:
                 connection.close()
-                del self.connections[client_id]
 
                 # 保留统计信息一段时间
-                if client_id in self.client_stats:
-                    self.client_stats[client_id]["disconnected_at"] = datetime.now()
+                stats = self.client_stats.get(client_id)
+                if stats is not None:
+                    stats["disconnected_at"] = datetime.now()
 
                 logger.info(
                     f"🔌 移除SSE连接: {client_id} (总连接数: {len(self.connections)})"
@@ -118,20 +118,21 @@ class SSEManager:
     ) -> bool:
         """向指定客户端发送消息"""
         async with self._lock:
-            if client_id not in self.connections:
+            connection = self.connections.get(client_id)
+            if connection is None:
                 logger.warning(f"⚠️ 客户端不存在: {client_id}")
                 return False
 
-            connection = self.connections[client_id]
             if connection.is_closed:
                 logger.warning(f"⚠️ 连接已关闭: {client_id}")
                 return False
 
             success = await connection.send_message(message)
 
-            if success and client_id in self.client_stats:
-                self.client_stats[client_id]["message_count"] += 1
-                self.client_stats[client_id]["last_activity"] = datetime.now()
+            stats = self.client_stats.get(client_id)
+            if success and stats is not None:
+                stats["message_count"] += 1
+                stats["last_activity"] = datetime.now()
 
             return success
 
@@ -183,6 +184,7 @@ class SSEManager:
     def get_active_connections(self) -> Dict[str, Dict[str, Any]]:
         """获取活跃连接信息"""
         result = {}
+        now = datetime.now()
         for client_id, connection in self.connections.items():
             if not connection.is_closed:
                 stats = self.client_stats.get(client_id, {})
@@ -190,9 +192,7 @@ class SSEManager:
                     "connected_at": connection.connected_at.isoformat(),
                     "last_ping": connection.last_ping.isoformat(),
                     "message_count": stats.get("message_count", 0),
-                    "last_activity": stats.get(
-                        "last_activity", datetime.now()
-                    ).isoformat(),
+                    "last_activity": stats.get("last_activity", now).isoformat(),
                 }
         return result
 
@@ -227,12 +227,12 @@ class SSEManager:
                             to_remove.append(client_id)
 
                     # 移除断开的连接
+                    now = datetime.now()
                     for client_id in to_remove:
                         del self.connections[client_id]
-                        if client_id in self.client_stats:
-                            self.client_stats[client_id][
-                                "disconnected_at"
-                            ] = datetime.now()
+                        stats = self.client_stats.get(client_id)
+                        if stats is not None:
+                            stats["disconnected_at"] = now
 
                     if to_remove:
                         logger.info(f"🧹 清理了 {len(to_remove)} 个断开的连接")
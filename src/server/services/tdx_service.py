@@ -21,6 +21,28 @@ from ..core.connection_registry import get_connection_registry
 logger = logging.getLogger("tdx_service")
 warnings.filterwarnings("ignore")
 
+# K线周期 -> 通达信 category
+TDX_KLINE_CATEGORIES = {"D": 9, "W": 5, "M": 6}
+# K线周期 -> 每根K线覆盖的自然日数（用于估算需要获取的条数）
+TDX_PERIOD_DAYS = {"D": 1, "W": 7, "M": 30}
+# 单次请求的最大K线条数
+TDX_MAX_BARS = 800
+# K线中实际使用的字段（pytdx 每根K线还附带 year/month/day 等冗余字段）
+TDX_BAR_FIELDS = ("datetime", "open", "high", "low", "close", "vol", "amount")
+# 通达信列名 -> 标准列名
+TDX_COLUMN_RENAME = {"vol": "volume", "amount": "turnover"}
+TDX_OUTPUT_COLUMNS = [
+    "date",
+    "code",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "turnover",
+    "source",
+]
+
 
 class DataNotFoundError(Exception):
     """当API调用成功但未返回任何数据时引发的自定义异常"""
@@ -55,12 +77,8 @@ class TdxService:
 
     @property
     def connected(self) -> bool:
-        """检查连接状态"""
-        try:
-            conn = self.connection_registry.get_connection("tdx")
-            return conn and conn.is_healthy()
-        except Exception:
-            return False
+        """检查连接状态（复用注册表的节流健康检查）"""
+        return self.api is not None
 
     def _get_market_code(self, symbol: str) -> int:
         """
@@ -76,6 +94,35 @@ class TdxService:
             # 默认深圳，可以根据更复杂的规则调整
             return 0
 
+    def _fetch_bars(
+        self, category: int, market_code: int, symbol: str, count: int, start_day: str
+    ) -> Dict[str, List[Any]]:
+        """
+        分页获取K线数据，按列返回 {字段: 值列表}
+
+        通达信单次最多返回 TDX_MAX_BARS 条，长区间需要按偏移量向前翻页，
+        否则会被静默截断。已翻到 start_day（YYYY-MM-DD）之前或数据耗尽时提前结束。
+        同一 TdxHq_API 连接是单条 socket，分页只能顺序请求。
+        结果只保留 TDX_BAR_FIELDS 中的字段并转为列式结构，
+        用列构造 DataFrame 比逐行解析字典列表快得多。
+        """
+        pages = []
+        for offset in range(0, count, TDX_MAX_BARS):
+            size = min(TDX_MAX_BARS, count - offset)
+            page = self.api.get_security_bars(
+                category, market_code, symbol, offset, size
+            )
+            if not page:
+                break
+            pages.append(page)
+            # 每页内按时间升序，首条即本页最早的K线
+            if len(page) < size or page[0]["datetime"][:10] < start_day:
+                break
+
+        # 后获取的页更早，倒序拼接后整体按时间升序
+        bars = [bar for page in reversed(pages) for bar in page]
+        return {field: [bar[field] for bar in bars] for field in TDX_BAR_FIELDS}
+
     # ==================== A股数据接口 ====================
 
     def get_stock_daily(
@@ -100,28 +147,25 @@ class TdxService:
             market_code = self._get_market_code(symbol)
             logger.info(f"🔄 通达信获取 {symbol} 数据 ({start_date} 到 {end_date})")
 
-            # 计算需要获取的数据量
+            # 计算需要获取的数据量：偏移量从最新一根K线起算，因此按距今天数估算
             start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            days_diff = (end_dt - start_dt).days
+            days_diff = (datetime.now() - start_dt).days
 
             # 根据周期调整数据量，并增加buffer
-            if period == "D":
-                count = min(days_diff + 10, 800)
-            elif period == "W":
-                count = min(days_diff // 7 + 10, 800)
-            elif period == "M":
-                count = min(days_diff // 30 + 10, 800)
+            period_days = TDX_PERIOD_DAYS.get(period)
+            if period_days:
+                count = max(days_diff // period_days + 10, 1)
             else:
-                count = 800
+                count = TDX_MAX_BARS
 
             # 获取K线数据
-            category_map = {"D": 9, "W": 5, "M": 6}
-            category = category_map.get(period.upper(), 9)
+            category = TDX_KLINE_CATEGORIES.get(period.upper(), 9)
 
-            data = self.api.get_security_bars(category, market_code, symbol, 0, count)
+            # 通达信K线时间为 YYYY-MM-DD 开头，翻页时按同一格式的字符串比较
+            start_day = start_dt.strftime("%Y-%m-%d")
+            data = self._fetch_bars(category, market_code, symbol, count, start_day)
 
-            if not data:
+            if not data["datetime"]:
                 logger.warning(f"⚠️ 通达信返回空数据: {symbol}")
                 raise DataNotFoundError(f"未获取到 {symbol} 的历史数据")
 
@@ -140,16 +184,7 @@ class TdxService:
                 )
 
             # 标准化列名
-            df = df.rename(
-                columns={
-                    "open": "open",
-                    "high": "high",
-                    "low": "low",
-                    "close": "close",
-                    "vol": "volume",
-                    "amount": "turnover",
-                }
-            )
+            df = df.rename(columns=TDX_COLUMN_RENAME)
             df.index.name = "date"
             df.reset_index(inplace=True)
 
@@ -158,19 +193,7 @@ class TdxService:
             df["source"] = "tdx"
 
             logger.info(f"✅ 获取 {symbol} 数据成功: {len(df)} 条")
-            return df[
-                [
-                    "date",
-                    "code",
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "turnover",
-                    "source",
-                ]
-            ]
+            return df[TDX_OUTPUT_COLUMNS]
 
         except Exception as e:
             logger.error(f"❌ 获取 {symbol} 数据失败: {e}")
@@ -5,16 +5,15 @@ Tushare 数据服务 - 优化版本
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any
+from pandas.api.types import is_datetime64_any_dtype
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
 import warnings
 
-try:
-    import tushare as ts
-except ImportError:
-    ts = None
-
 from ..utils.symbol_processor import get_symbol_processor
 from ..exception.exception import DataNotFoundError
 from ..core.connection_registry import get_connection_registry
@@ -22,6 +21,126 @@ from ..core.connection_registry import get_connection_registry
 logger = logging.getLogger("tushare_service")
 warnings.filterwarnings("ignore")
 
+# Tushare 行情列名到统一列名的映射
+TUSHARE_COLUMN_MAPPING = {
+    "trade_date": "date",
+    "ts_code": "code",
+    "vol": "volume",
+    "amount": "turnover",
+}
+
+# Tushare 的 trade_date 固定为 YYYYMMDD，显式指定格式可跳过逐个元素的格式推断
+TUSHARE_DATE_FORMAT = "%Y%m%d"
+
+# 每日指标（daily_basic）查询回看的自然日天数，覆盖长假后的最近交易日
+MARKET_DATA_LOOKBACK_DAYS = 15
+MARKET_DATA_FIELDS = "ts_code,trade_date,close,pe,pe_ttm,total_mv"
+# daily_basic 单次最多返回 6000 行：每批代码数 × 回看天数不超过该上限，避免结果被截断
+MARKET_DATA_MAX_ROWS = 6000
+MARKET_DATA_BATCH_SIZE = MARKET_DATA_MAX_ROWS // MARKET_DATA_LOOKBACK_DAYS
+
+# 财务报表并发获取的线程池（基本信息 + 四张报表）
+TUSHARE_FUNDAMENTALS_MAX_WORKERS = 5
+
+_tushare_executor = ThreadPoolExecutor(
+    max_workers=TUSHARE_FUNDAMENTALS_MAX_WORKERS, thread_name_prefix="tushare"
+)
+
+# 财务报表: fundamentals 中的键 -> (Tushare 接口名, 日志名称, 字段列表)
+TUSHARE_STATEMENTS = {
+    "balance_sheet": (
+        "balancesheet",
+        "资产负债表",
+        "ts_code,ann_date,f_ann_date,end_date,report_type,"
+        "total_assets,total_liab,total_hldr_eqy_exc_min_int,"
+        "money_cap,accounts_receiv,inventories,fix_assets,"
+        "lt_borr,st_borr,notes_payable,acct_payable,"
+        "cap_rese,surplus_rese,undistr_porfit",
+    ),
+    "income_statement": (
+        "income",
+        "利润表",
+        "ts_code,ann_date,f_ann_date,end_date,report_type,"
+        "total_revenue,revenue,operate_profit,total_profit,"
+        "n_income,n_income_attr_p,basic_eps,diluted_eps,"
+        "total_cogs,sell_exp,admin_exp,fin_exp,"
+        "oper_cost,rd_exp,ebit,ebitda",
+    ),
+    "cash_flow": (
+        "cashflow",
+        "现金流量表",
+        "ts_code,ann_date,f_ann_date,end_date,report_type,"
+        "n_cashflow_act,n_cashflow_inv_act,"
+        "n_cash_flows_fnc_act,c_fr_sale_sg,c_paid_goods_s,"
+        "c_paid_to_for_empl,c_paid_for_taxes,net_profit,"
+        "finan_exp,im_n_incr_cash_equ,free_cashflow",
+    ),
+    "fina_indicator": (
+        "fina_indicator",
+        "财务指标",
+        "ts_code,ann_date,f_ann_date,end_date,"
+        "eps,dt_eps,roe,roe_waa,roe_dt,roa,bps,ocfps,"
+        "gross_margin,current_ratio,quick_ratio,"
+        "debt_to_assets,assets_to_eqt,debt_to_eqt,"
+        "netprofit_margin,grossprofit_margin,"
+        "profit_to_gr,or_yoy,q_sales_yoy,netprofit_yoy",
+    ),
+}
+
+# 空结果（无效代码、区间内无数据）的进程内短期缓存：键 -> (过期时间, 错误信息)，
+# 同一查询在有效期内直接抛出 DataNotFoundError，不再重复请求限流严格的 Tushare；
+# 请求异常（网络、限流）不缓存，以免掩盖可恢复的故障
+NOT_FOUND_CACHE_TTL = 300
+NOT_FOUND_CACHE_MAX_ENTRIES = 1024
+
+_not_found: Dict[tuple, tuple] = {}
+_not_found_lock = threading.Lock()
+
+
+def latest_report_period(now: datetime) -> str:
+    """
+    推算当前日期下最近一个已发布的财报报告期（YYYYMMDD）
+
+    财报通常有延迟：年报、一季报4月底，半年报8月底，三季报10月底。
+    明确报告期后各报表接口只返回该期数据，而不是全部历史报告。
+    """
+    year, month = now.year, now.month
+    if month <= 4:
+        # 1-4月：上一年年报
+        return f"{year - 1}1231"
+    if month <= 8:
+        # 5-8月：当年一季报
+        return f"{year}0331"
+    if month <= 10:
+        # 9-10月：当年半年报
+        return f"{year}0630"
+    # 11-12月：当年三季报
+    return f"{year}0930"
+
+
+def _raise_if_not_found(key: tuple) -> None:
+    """该查询近期已确认无数据时直接抛出 DataNotFoundError"""
+    entry = _not_found.get(key)
+    if entry is not None:
+        expires_at, message = entry
+        if time.monotonic() < expires_at:
+            raise DataNotFoundError(message)
+
+
+def _remember_not_found(key: tuple, message: str) -> DataNotFoundError:
+    """记录空结果并返回对应的异常，供调用方抛出"""
+    now = time.monotonic()
+    with _not_found_lock:
+        if len(_not_found) >= NOT_FOUND_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, v in _not_found.items() if v[0] <= now]:
+                del _not_found[stale_key]
+        # 仍超出上限时按插入顺序淘汰最早的记录
+        while len(_not_found) >= NOT_FOUND_CACHE_MAX_ENTRIES:
+            del _not_found[next(iter(_not_found))]
+        _not_found.pop(key, None)
+        _not_found[key] = (now + NOT_FOUND_CACHE_TTL, message)
+    return DataNotFoundError(message)
+
 
 class TushareService:
     """封装Tushare API的数据服务（使用统一连接管理）"""
@@ -46,7 +165,12 @@ class TushareService:
 
     @property
     def pro(self):
-        """延迟获取 Tushare API 客户端"""
+        """
+        延迟获取 Tushare API 客户端
+
+        每次访问都会经过连接注册表（含节流的健康检查与重连），
+        不在实例上缓存，以便重连后拿到新的客户端；方法内应只取一次并复用。
+        """
         try:
             return self.connection_registry.get_tushare()
         except ConnectionError:
@@ -58,7 +182,8 @@ class TushareService:
         self, symbol: str, start_date: str, end_date: str
     ) -> pd.DataFrame:
         """获取A股日线行情（带前复权价格计算）"""
-        if not self.pro:
+        pro = self.pro
+        if not pro:
             raise ConnectionError("Tushare未连接")
 
         try:
@@ -76,20 +201,27 @@ class TushareService:
             else:
                 start_date = start_date.replace("-", "")
 
+            not_found_key = ("daily", ts_code, start_date, end_date)
+            _raise_if_not_found(not_found_key)
+
             logger.info(f"🔄 Tushare获取{ts_code}数据 ({start_date} 到 {end_date})")
 
             # 获取日线数据
-            data = self.pro.daily(
+            data = pro.daily(
                 ts_code=ts_code, start_date=start_date, end_date=end_date
             )
 
             if data is None or data.empty:
                 logger.warning(f"⚠️ Tushare返回空数据: {ts_code}")
-                raise DataNotFoundError(f"未获取到 {ts_code} 的日线数据")
+                raise _remember_not_found(
+                    not_found_key, f"未获取到 {ts_code} 的日线数据"
+                )
 
-            # 数据预处理
-            data = data.sort_values("trade_date")
-            data["trade_date"] = pd.to_datetime(data["trade_date"])
+            # 数据预处理：Tushare按日期倒序返回，在此统一升序排列一次，后续不再排序
+            data = data.sort_values("trade_date", ignore_index=True)
+            data["trade_date"] = pd.to_datetime(
+                data["trade_date"], format=TUSHARE_DATE_FORMAT
+            )
 
             # 计算前复权价格（基于pct_chg重新计算连续价格）
             data = self._calculate_forward_adjusted_prices(data)
@@ -110,17 +242,15 @@ class TushareService:
 
         Tushare的daily接口返回除权价格，在除权日会出现价格跳跃。
         使用pct_chg（涨跌幅）重新计算连续的前复权价格，确保价格序列的连续性。
+        调用方已保证 data 非空且按交易日期升序排列。
         """
-        if data.empty or "pct_chg" not in data.columns:
-            logger.warning("⚠️ 数据为空或缺少pct_chg列，无法计算前复权价格")
+        if "pct_chg" not in data.columns:
+            logger.warning("⚠️ 数据缺少pct_chg列，无法计算前复权价格")
             return data
 
         try:
-            # 复制数据避免修改原始数据
+            # 复制数据避免修改原始数据（调用方已按日期升序排列）
             adjusted_data = data.copy()
-            adjusted_data = adjusted_data.sort_values("trade_date").reset_index(
-                drop=True
-            )
 
             # 保存原始价格列
             adjusted_data["close_raw"] = adjusted_data["close"].copy()
@@ -128,42 +258,24 @@ class TushareService:
             adjusted_data["high_raw"] = adjusted_data["high"].copy()
             adjusted_data["low_raw"] = adjusted_data["low"].copy()
 
-            # 从最新的收盘价开始，向前计算前复权价格
-            latest_close = float(adjusted_data.iloc[-1]["close"])
-
-            # 计算前复权收盘价
-            adjusted_closes = [latest_close]
-
-            # 从倒数第二天开始向前计算
-            for i in range(len(adjusted_data) - 2, -1, -1):
-                pct_change = float(adjusted_data.iloc[i + 1]["pct_chg"]) / 100.0
-
-                # 前一天的前复权收盘价 = 今天的前复权收盘价 / (1 + 今天的涨跌幅)
-                prev_close = adjusted_closes[0] / (1 + pct_change)
-                adjusted_closes.insert(0, prev_close)
-
-            # 更新收盘价
-            adjusted_data["close"] = adjusted_closes
-
-            # 计算其他价格的调整比例
-            for i in range(len(adjusted_data)):
-                if adjusted_data.iloc[i]["close_raw"] != 0:
-                    # 计算调整比例
-                    adjustment_ratio = (
-                        adjusted_data.iloc[i]["close"]
-                        / adjusted_data.iloc[i]["close_raw"]
-                    )
-
-                    # 应用调整比例到其他价格
-                    adjusted_data.iloc[i, adjusted_data.columns.get_loc("open")] = (
-                        adjusted_data.iloc[i]["open_raw"] * adjustment_ratio
-                    )
-                    adjusted_data.iloc[i, adjusted_data.columns.get_loc("high")] = (
-                        adjusted_data.iloc[i]["high_raw"] * adjustment_ratio
-                    )
-                    adjusted_data.iloc[i, adjusted_data.columns.get_loc("low")] = (
-                        adjusted_data.iloc[i]["low_raw"] * adjustment_ratio
-                    )
+            # 从最新的收盘价开始，向前计算前复权价格：
+            # 前一天的前复权收盘价 = 今天的前复权收盘价 / (1 + 今天的涨跌幅)，
+            # 即第 i 天 = 最新收盘价 / ∏(1 + 涨跌幅[k]), k = i+1..n-1，
+            # 用反向累乘一次算出，不再逐行 iloc
+            latest_close = float(adjusted_data["close"].iloc[-1])
+            growth = 1 + adjusted_data["pct_chg"].to_numpy(dtype=float) / 100.0
+            later_growth = np.cumprod(growth[::-1])[::-1]
+            divisors = np.append(later_growth[1:], 1.0)
+            adjusted_data["close"] = latest_close / divisors
+
+            # 按调整比例同步调整开盘、最高、最低价（原始收盘价为0的行保持不变）
+            close_raw = adjusted_data["close_raw"]
+            adjustment_ratio = (adjusted_data["close"] / close_raw).where(
+                close_raw != 0, 1.0
+            )
+            for column in ("open", "high", "low"):
+                raw_prices = adjusted_data[f"{column}_raw"]
+                adjusted_data[column] = raw_prices * adjustment_ratio
 
             # 添加标记
             adjusted_data["price_type"] = "forward_adjusted"
@@ -176,26 +288,14 @@ class TushareService:
             return data
 
     def _standardize_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        """标准化A股数据格式"""
-        if data.empty:
-            return data
-
+        """标准化A股数据格式（调用方已保证 data 非空）"""
         try:
-            # 重命名列
-            column_mapping = {
-                "trade_date": "date",
-                "ts_code": "code",
-                "vol": "volume",
-                "amount": "turnover",
-            }
-
-            for old_col, new_col in column_mapping.items():
-                if old_col in data.columns:
-                    data = data.rename(columns={old_col: new_col})
+            # 一次性重命名所有列（不存在的列会被忽略），避免每列复制一次整表
+            data = data.rename(columns=TUSHARE_COLUMN_MAPPING)
 
-            # 确保日期格式
-            if "date" in data.columns:
-                data["date"] = pd.to_datetime(data["date"])
+            # 确保日期格式（上游已解析为日期类型时不再重复解析）
+            if "date" in data.columns and not is_datetime64_any_dtype(data["date"]):
+                data["date"] = pd.to_datetime(data["date"], format=TUSHARE_DATE_FORMAT)
 
             # 计算涨跌幅（如果没有）
             if "pct_chg" not in data.columns and "close" in data.columns:
@@ -210,21 +310,25 @@ class TushareService:
 
     def get_stock_info(self, symbol: str) -> Dict[str, Any]:
         """获取股票基本信息"""
-        if not self.pro:
+        pro = self.pro
+        if not pro:
             raise ConnectionError("Tushare未连接")
 
         try:
             ts_code = self.symbol_processor.get_tushare_format(symbol)
+            not_found_key = ("stock_basic", ts_code)
+            _raise_if_not_found(not_found_key)
 
-            basic_info = self.pro.stock_basic(
+            basic_info = pro.stock_basic(
                 ts_code=ts_code,
                 fields="ts_code,symbol,name,area,industry,market,list_date",
             )
 
             if basic_info is None or basic_info.empty:
-                raise DataNotFoundError(f"未找到 {ts_code} 的股票信息")
+                raise _remember_not_found(not_found_key, f"未找到 {ts_code} 的股票信息")
 
-            info = basic_info.iloc[0]
+            # 单行结果直接转为dict，不构造中间的行 Series
+            info = basic_info.to_dict("records")[0]
             return {
                 "symbol": symbol,
                 "ts_code": info["ts_code"],
@@ -240,11 +344,61 @@ class TushareService:
             logger.error(f"❌ 获取{symbol}股票信息失败: {e}")
             raise
 
+    def get_market_data(self, ts_code: str) -> Optional[Dict[str, Any]]:
+        """获取单只A股最近交易日的每日指标（市值、市盈率等）"""
+        return self.get_market_data_batch([ts_code]).get(ts_code)
+
+    def get_market_data_batch(self, ts_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        批量获取多只A股最近交易日的每日指标
+
+        daily_basic 的 ts_code 参数支持逗号分隔的多个代码，每批
+        MARKET_DATA_BATCH_SIZE 个代码只需一次请求，而不是每只股票各请求一次。
+
+        Returns:
+            dict: {ts_code: 指标字典}，额外包含 is_today 表示是否为当天数据
+        """
+        if not ts_codes:
+            return {}
+        pro = self.pro
+        if not pro:
+            raise ConnectionError("Tushare未连接")
+
+        now = datetime.now()
+        today = now.strftime(TUSHARE_DATE_FORMAT)
+        lookback = timedelta(days=MARKET_DATA_LOOKBACK_DAYS)
+        start_date = (now - lookback).strftime(TUSHARE_DATE_FORMAT)
+        frames = []
+        for offset in range(0, len(ts_codes), MARKET_DATA_BATCH_SIZE):
+            batch = ts_codes[offset : offset + MARKET_DATA_BATCH_SIZE]
+            frame = pro.daily_basic(
+                ts_code=",".join(batch),
+                start_date=start_date,
+                end_date=today,
+                fields=MARKET_DATA_FIELDS,
+            )
+            if frame is not None and not frame.empty:
+                frames.append(frame)
+        if not frames:
+            return {}
+        data = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+        # 每只股票只保留最近一个交易日的记录
+        latest = data.sort_values("trade_date").drop_duplicates("ts_code", keep="last")
+        results = {}
+        for record in latest.to_dict("records"):
+            record["is_today"] = record["trade_date"] == today
+            results[record["ts_code"]] = record
+
+        logger.info(f"✅ 批量获取每日指标: {len(results)}/{len(ts_codes)} 成功")
+        return results
+
     # ==================== 港股数据接口 ====================
 
     def get_hk_daily(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         """获取港股日线行情"""
-        if not self.pro:
+        pro = self.pro
+        if not pro:
             raise ConnectionError("Tushare未连接")
 
         try:
@@ -255,12 +409,17 @@ class TushareService:
             start_date_formatted = start_date.replace("-", "") if start_date else None
             end_date_formatted = end_date.replace("-", "") if end_date else None
 
+            not_found_key = (
+                "hk_daily", ts_code, start_date_formatted, end_date_formatted
+            )
+            _raise_if_not_found(not_found_key)
+
             logger.info(
                 f"🇭🇰 Tushare获取港股数据: {ts_code} ({start_date} ~ {end_date})"
             )
 
             # 获取港股日线数据
-            data = self.pro.hk_daily(
+            data = pro.hk_daily(
                 ts_code=ts_code,
                 start_date=start_date_formatted,
                 end_date=end_date_formatted,
@@ -268,7 +427,9 @@ class TushareService:
 
             if data is None or data.empty:
                 logger.warning(f"⚠️ Tushare返回空港股数据: {ts_code}")
-                raise DataNotFoundError(f"未获取到港股 {ts_code} 的日线数据")
+                raise _remember_not_found(
+                    not_found_key, f"未获取到港股 {ts_code} 的日线数据"
+                )
 
             # 标准化数据
             data = self._standardize_hk_data(data)
@@ -281,26 +442,14 @@ class TushareService:
             raise
 
     def _standardize_hk_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        """标准化港股数据格式"""
-        if data.empty:
-            return data
-
+        """标准化港股数据格式（调用方已保证 data 非空）"""
         try:
-            # 重命名列
-            column_mapping = {
-                "trade_date": "date",
-                "ts_code": "code",
-                "vol": "volume",
-                "amount": "turnover",
-            }
+            # 一次性重命名所有列（不存在的列会被忽略），避免每列复制一次整表
+            data = data.rename(columns=TUSHARE_COLUMN_MAPPING)
 
-            for old_col, new_col in column_mapping.items():
-                if old_col in data.columns:
-                    data = data.rename(columns={old_col: new_col})
-
-            # 确保日期格式
-            if "date" in data.columns:
-                data["date"] = pd.to_datetime(data["date"])
+            # 确保日期格式（上游已解析为日期类型时不再重复解析）
+            if "date" in data.columns and not is_datetime64_any_dtype(data["date"]):
+                data["date"] = pd.to_datetime(data["date"], format=TUSHARE_DATE_FORMAT)
 
             return data
 
@@ -327,31 +476,13 @@ class TushareService:
             - fina_indicator: 财务指标
             - financial_data: 整合后的核心财务数据
         """
-        if not self.pro:
+        pro = self.pro
+        if not pro:
             raise ConnectionError("Tushare未连接")
 
         if not period:
-            # 默认使用最近已发布的报告期
-            # 财报通常有延迟：年报4月底，一季报4月底，半年报8月底，三季报10月底
-            # 注意：这里使用2024年作为基准年
-            now = datetime.now()
-            year = 2024  # 当前基准年
-            month = now.month
-
-            # 根据当前月份判断最近可获取的报告期
-            if month <= 4:
-                # 1-4月：上一年年报
-                period = f"{year - 1}1231"
-            elif month <= 8:
-                # 5-8月：当年一季报
-                period = f"{year}0331"
-            elif month <= 10:
-                # 9-10月：当年半年报
-                period = f"{year}0630"
-            else:
-                # 11-12月：当年三季报
-                period = f"{year}0930"
-
+            # 默认使用最近已发布的报告期，按日期在本地推算，无需额外请求
+            period = latest_report_period(datetime.now())
             logger.info(f"📅 自动选择报告期: {period}")
 
         try:
@@ -365,100 +496,23 @@ class TushareService:
                 "source": "tushare",
             }
 
-            # 获取基本信息
-            try:
-                basic_info = self.get_stock_info(symbol)
-                fundamentals["basic_info"] = basic_info
-            except Exception as e:
-                logger.warning(f"⚠️ 获取股票基本信息失败: {e}")
-                fundamentals["basic_info"] = {}
-
-            # 获取资产负债表 (balancesheet)
-            try:
-                balance_sheet = self.pro.balancesheet(
-                    ts_code=ts_code,
-                    period=period,
-                    fields="ts_code,ann_date,f_ann_date,end_date,report_type,"
-                    "total_assets,total_liab,total_hldr_eqy_exc_min_int,"
-                    "money_cap,accounts_receiv,inventories,fix_assets,"
-                    "lt_borr,st_borr,notes_payable,acct_payable,"
-                    "cap_rese,surplus_rese,undistr_porfit",
+            # 基本信息与四张报表互不依赖，并发请求，总耗时取决于最慢的一个
+            basic_info_future = _tushare_executor.submit(self.get_stock_info, symbol)
+            statement_futures = {
+                key: _tushare_executor.submit(
+                    self._fetch_statement, pro, api_name, label, ts_code, period, fields
                 )
-                if balance_sheet is not None and not balance_sheet.empty:
-                    fundamentals["balance_sheet"] = balance_sheet.iloc[0].to_dict()
-                    logger.info(f"✅ 获取资产负债表成功")
-                else:
-                    logger.warning(f"⚠️ 资产负债表数据为空")
-                    fundamentals["balance_sheet"] = {}
-            except Exception as e:
-                logger.warning(f"⚠️ 获取资产负债表失败: {e}")
-                fundamentals["balance_sheet"] = {}
-
-            # 获取利润表 (income)
-            try:
-                income_statement = self.pro.income(
-                    ts_code=ts_code,
-                    period=period,
-                    fields="ts_code,ann_date,f_ann_date,end_date,report_type,"
-                    "total_revenue,revenue,operate_profit,total_profit,"
-                    "n_income,n_income_attr_p,basic_eps,diluted_eps,"
-                    "total_cogs,sell_exp,admin_exp,fin_exp,"
-                    "oper_cost,rd_exp,ebit,ebitda",
-                )
-                if income_statement is not None and not income_statement.empty:
-                    fundamentals["income_statement"] = income_statement.iloc[
-                        0
-                    ].to_dict()
-                    logger.info(f"✅ 获取利润表成功")
-                else:
-                    logger.warning(f"⚠️ 利润表数据为空")
-                    fundamentals["income_statement"] = {}
-            except Exception as e:
-                logger.warning(f"⚠️ 获取利润表失败: {e}")
-                fundamentals["income_statement"] = {}
+                for key, (api_name, label, fields) in TUSHARE_STATEMENTS.items()
+            }
 
-            # 获取现金流量表 (cashflow)
             try:
-                cash_flow = self.pro.cashflow(
-                    ts_code=ts_code,
-                    period=period,
-                    fields="ts_code,ann_date,f_ann_date,end_date,report_type,"
-                    "n_cashflow_act,n_cashflow_inv_act,"
-                    "n_cash_flows_fnc_act,c_fr_sale_sg,c_paid_goods_s,"
-                    "c_paid_to_for_empl,c_paid_for_taxes,net_profit,"
-                    "finan_exp,im_n_incr_cash_equ,free_cashflow",
-                )
-                if cash_flow is not None and not cash_flow.empty:
-                    fundamentals["cash_flow"] = cash_flow.iloc[0].to_dict()
-                    logger.info(f"✅ 获取现金流量表成功")
-                else:
-                    logger.warning(f"⚠️ 现金流量表数据为空")
-                    fundamentals["cash_flow"] = {}
+                fundamentals["basic_info"] = basic_info_future.result()
             except Exception as e:
-                logger.warning(f"⚠️ 获取现金流量表失败: {e}")
-                fundamentals["cash_flow"] = {}
+                logger.warning(f"⚠️ 获取股票基本信息失败: {e}")
+                fundamentals["basic_info"] = {}
 
-            # 获取财务指标 (fina_indicator)
-            try:
-                fina_indicator = self.pro.fina_indicator(
-                    ts_code=ts_code,
-                    period=period,
-                    fields="ts_code,ann_date,f_ann_date,end_date,"
-                    "eps,dt_eps,roe,roe_waa,roe_dt,roa,bps,ocfps,"
-                    "gross_margin,current_ratio,quick_ratio,"
-                    "debt_to_assets,assets_to_eqt,debt_to_eqt,"
-                    "netprofit_margin,grossprofit_margin,"
-                    "profit_to_gr,or_yoy,q_sales_yoy,netprofit_yoy",
-                )
-                if fina_indicator is not None and not fina_indicator.empty:
-                    fundamentals["fina_indicator"] = fina_indicator.iloc[0].to_dict()
-                    logger.info(f"✅ 获取财务指标成功")
-                else:
-                    logger.warning(f"⚠️ 财务指标数据为空")
-                    fundamentals["fina_indicator"] = {}
-            except Exception as e:
-                logger.warning(f"⚠️ 获取财务指标失败: {e}")
-                fundamentals["fina_indicator"] = {}
+            for key, future in statement_futures.items():
+                fundamentals[key] = future.result()
 
             # 整合核心财务数据到 financial_data 字段
             financial_data = {}
@@ -561,6 +615,22 @@ class TushareService:
             logger.error(f"❌ 获取{symbol}财务数据失败: {e}")
             raise
 
+    def _fetch_statement(
+        self, pro, api_name: str, label: str, ts_code: str, period: str, fields: str
+    ) -> Dict[str, Any]:
+        """获取单张财务报表的最新一条记录，失败或为空时返回空字典"""
+        try:
+            statement = getattr(pro, api_name)(
+                ts_code=ts_code, period=period, fields=fields
+            )
+            if statement is not None and not statement.empty:
+                logger.info(f"✅ 获取{label}成功")
+                return statement.iloc[0].to_dict()
+            logger.warning(f"⚠️ {label}数据为空")
+        except Exception as e:
+            logger.warning(f"⚠️ 获取{label}失败: {e}")
+        return {}
+
     # ==================== 报告生成函数 ====================
 
     def get_stock_data_report(self, symbol: str, start_date: str, end_date: str) -> str:
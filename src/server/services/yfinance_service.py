@@ -4,8 +4,10 @@ YFinance 数据服务 - 使用统一连接管理
 """
 
 import pandas as pd
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 import logging
+import threading
+import time
 
 try:
     import yfinance as yf
@@ -16,6 +18,10 @@ from ...config.settings import get_settings
 
 logger = logging.getLogger("yfinance_service")
 
+# Ticker 对象复用时长（秒）：yfinance 会在 Ticker 上缓存已解析的 info 与财务报表，
+# 同一代码在该时长内的多次调用共享一次请求与解析结果
+TICKER_REUSE_SECONDS = 300
+
 
 class YFinanceService:
     """封装 yfinance 的数据服务（简化连接管理）"""
@@ -35,6 +41,9 @@ class YFinanceService:
         else:
             logger.info("🔧 YFinanceService 未配置代理")
 
+        self._tickers: Dict[str, Tuple[float, Any]] = {}
+        self._tickers_lock = threading.Lock()
+
         logger.info("✅ YFinanceService 初始化成功")
 
     @property
@@ -43,10 +52,24 @@ class YFinanceService:
         return yf is not None
 
     def _get_ticker(self, symbol: str):
-        """获取 yfinance Ticker 对象"""
+        """获取 yfinance Ticker 对象（短期复用，共享已解析的响应数据）"""
         if not self.connected:
             raise ConnectionError("YFinanceService 未连接")
-        return yf.Ticker(symbol)
+
+        now = time.monotonic()
+        with self._tickers_lock:
+            cached = self._tickers.get(symbol)
+            if cached and now - cached[0] < TICKER_REUSE_SECONDS:
+                return cached[1]
+            # 顺带清理已过期的 Ticker，避免长期运行时无限增长
+            self._tickers = {
+                key: value
+                for key, value in self._tickers.items()
+                if now - value[0] < TICKER_REUSE_SECONDS
+            }
+            ticker = yf.Ticker(symbol)
+            self._tickers[symbol] = (now, ticker)
+            return ticker
 
     def get_stock_daily(
         self, symbol: str, start_date: str, end_date: str
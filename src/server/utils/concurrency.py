@@ -0,0 +1,83 @@
+"""
+并发工具
+为数据源调用提供带超时保护的执行方式，以及按键合并并发重复请求的 SingleFlight
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Optional
+
+
+def call_with_timeout(timeout: float, func, *args, **kwargs):
+    """
+    在独立的守护线程中执行 func 并等待结果
+
+    每次调用单独起线程而不共用线程池：上游卡住的调用只占用自己的线程，
+    不会让其他调用排队等待后直接超时。
+
+    Raises:
+        TimeoutError: 超过 timeout 秒仍未返回
+        Exception: func 自身抛出的异常原样抛出
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    name = f"call_{getattr(func, '__name__', 'func')}"
+    threading.Thread(target=run, name=name, daemon=True).start()
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+class SingleFlight:
+    """按键合并并发的重复调用：同一键同时只执行一次，其余调用共享其结果或异常"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable,
+        on_wait: Optional[Callable[[], None]] = None,
+    ):
+        """
+        执行 func 并返回结果；同一键已有调用在进行中时等待其结果
+
+        Args:
+            key: 合并请求的键
+            func: 无参调用，只由第一个调用方执行
+            on_wait: 需要等待进行中的调用时先执行的回调（如记录日志）
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            if on_wait is not None:
+                on_wait()
+            return future.result()
+
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
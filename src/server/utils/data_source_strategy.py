@@ -3,7 +3,7 @@
 根据股票类型智能选择和排序数据源优先级
 """
 
-from typing import List, Dict
+from typing import ClassVar, Dict, Tuple
 from .symbol_processor import get_symbol_processor
 import logging
 
@@ -13,10 +13,47 @@ logger = logging.getLogger("data_source_strategy")
 class DataSourceStrategy:
     """数据源策略管理器"""
 
+    # 各市场的数据源优先级为静态配置，类加载时构建一次，所有调用共享同一元组
+    _MARKET_SOURCES: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        # A股：Tushare > 通达信 > AKShare
+        "china": ("tushare", "tdx", "akshare"),
+        # 港股：AKShare > Tushare > YFinance
+        "hk": ("akshare", "tushare", "yfinance"),
+        # 美股：YFinance > AKShare
+        "us": ("yfinance", "akshare"),
+        # 未知市场：尝试所有数据源
+        "unknown": ("yfinance", "akshare", "tushare", "tdx"),
+    }
+
+    _FUNDAMENTAL_SOURCES: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        # A股：Tushare（最完整的财务数据） > AKShare
+        "china": ("tushare", "akshare"),
+        # 港股：AKShare > Tushare > YFinance
+        "hk": ("akshare", "tushare", "yfinance"),
+        # 美股：YFinance（最完整的财务数据） > AKShare
+        "us": ("yfinance", "akshare"),
+        # 未知市场
+        "unknown": ("yfinance", "akshare", "tushare"),
+    }
+
+    _NEWS_SOURCES: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        # A股新闻：AKShare > Tushare
+        "china": ("akshare", "tushare"),
+        # 港股新闻：AKShare > YFinance
+        "hk": ("akshare", "yfinance"),
+        # 美股新闻：YFinance > AKShare
+        "us": ("yfinance", "akshare"),
+        "unknown": ("akshare", "yfinance"),
+    }
+
     def __init__(self):
         self.symbol_processor = get_symbol_processor()
 
-    def get_market_data_sources(self, symbol: str) -> List[str]:
+    def _get_market_key(self, symbol: str) -> str:
+        """获取股票所属市场的简称 (china/hk/us/unknown)"""
+        return self.symbol_processor.get_market_simple_name(symbol)
+
+    def get_market_data_sources(self, symbol: str) -> Tuple[str, ...]:
         """
         获取市场数据(K线、行情)的数据源优先级列表
 
@@ -24,24 +61,11 @@ class DataSourceStrategy:
             symbol: 股票代码
 
         Returns:
-            List[str]: 数据源优先级列表
+            Tuple[str, ...]: 数据源优先级列表（共享的不可变元组）
         """
-        classification = self.symbol_processor.classifier.classify_stock(symbol)
+        return self._MARKET_SOURCES[self._get_market_key(symbol)]
 
-        if classification["is_china"]:
-            # A股：Tushare > 通达信 > AKShare
-            return ["tushare", "tdx", "akshare"]
-        elif classification["is_hk"]:
-            # 港股：AKShare > Tushare > YFinance
-            return ["akshare", "tushare", "yfinance"]
-        elif classification["is_us"]:
-            # 美股：YFinance > AKShare
-            return ["yfinance", "akshare"]
-        else:
-            # 未知市场：尝试所有数据源
-            return ["yfinance", "akshare", "tushare", "tdx"]
-
-    def get_fundamental_data_sources(self, symbol: str) -> List[str]:
+    def get_fundamental_data_sources(self, symbol: str) -> Tuple[str, ...]:
         """
         获取基本面数据(财务报表、指标)的数据源优先级列表
 
@@ -49,24 +73,11 @@ class DataSourceStrategy:
             symbol: 股票代码
 
         Returns:
-            List[str]: 数据源优先级列表
+            Tuple[str, ...]: 数据源优先级列表（共享的不可变元组）
         """
-        classification = self.symbol_processor.classifier.classify_stock(symbol)
+        return self._FUNDAMENTAL_SOURCES[self._get_market_key(symbol)]
 
-        if classification["is_china"]:
-            # A股：Tushare（最完整的财务数据） > AKShare
-            return ["tushare", "akshare"]
-        elif classification["is_hk"]:
-            # 港股：AKShare > Tushare > YFinance
-            return ["akshare", "tushare", "yfinance"]
-        elif classification["is_us"]:
-            # 美股：YFinance（最完整的财务数据） > AKShare
-            return ["yfinance", "akshare"]
-        else:
-            # 未知市场
-            return ["yfinance", "akshare", "tushare"]
-
-    def get_news_data_sources(self, symbol: str) -> List[str]:
+    def get_news_data_sources(self, symbol: str) -> Tuple[str, ...]:
         """
         获取新闻数据的数据源优先级列表
 
@@ -74,23 +85,11 @@ class DataSourceStrategy:
             symbol: 股票代码
 
         Returns:
-            List[str]: 数据源优先级列表
+            Tuple[str, ...]: 数据源优先级列表（共享的不可变元组）
         """
-        classification = self.symbol_processor.classifier.classify_stock(symbol)
+        return self._NEWS_SOURCES[self._get_market_key(symbol)]
 
-        if classification["is_china"]:
-            # A股新闻：AKShare > Tushare
-            return ["akshare", "tushare"]
-        elif classification["is_hk"]:
-            # 港股新闻：AKShare > YFinance
-            return ["akshare", "yfinance"]
-        elif classification["is_us"]:
-            # 美股新闻：YFinance > AKShare
-            return ["yfinance", "akshare"]
-        else:
-            return ["akshare", "yfinance"]
-
-    def get_all_data_sources(self, symbol: str) -> Dict[str, List[str]]:
+    def get_all_data_sources(self, symbol: str) -> Dict[str, Tuple[str, ...]]:
         """
         获取某个股票所有类型数据的数据源策略
 
@@ -98,7 +97,7 @@ class DataSourceStrategy:
             symbol: 股票代码
 
         Returns:
-            Dict[str, List[str]]: 包含market、fundamental、news的数据源列表
+            Dict[str, Tuple[str, ...]]: 包含market、fundamental、news的数据源列表
         """
         return {
             "market": self.get_market_data_sources(symbol),
@@ -137,22 +136,22 @@ def get_data_source_strategy() -> DataSourceStrategy:
 
 
 # 便捷函数
-def get_market_data_sources(symbol: str) -> List[str]:
+def get_market_data_sources(symbol: str) -> Tuple[str, ...]:
     """获取市场数据源列表的便捷函数"""
     return get_data_source_strategy().get_market_data_sources(symbol)
 
 
-def get_fundamental_data_sources(symbol: str) -> List[str]:
+def get_fundamental_data_sources(symbol: str) -> Tuple[str, ...]:
     """获取基本面数据源列表的便捷函数"""
     return get_data_source_strategy().get_fundamental_data_sources(symbol)
 
 
-def get_news_data_sources(symbol: str) -> List[str]:
+def get_news_data_sources(symbol: str) -> Tuple[str, ...]:
     """获取新闻数据源列表的便捷函数"""
     return get_data_source_strategy().get_news_data_sources(symbol)
 
 
-def get_all_data_sources(symbol: str) -> Dict[str, List[str]]:
+def get_all_data_sources(symbol: str) -> Dict[str, Tuple[str, ...]]:
     """获取所有数据源策略的便捷函数"""
     return get_data_source_strategy().get_all_data_sources(symbol)
 
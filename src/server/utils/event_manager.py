@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Callable, List, Optional
 from collections import defaultdict
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
@@ -123,12 +124,14 @@ class EventManager:
         Returns:
             事件历史列表
         """
-        if event_type:
-            filtered_events = [e for e in self.event_history if e["type"] == event_type]
-        else:
-            filtered_events = self.event_history
-
-        return filtered_events[-limit:]
+        if not event_type:
+            return self.event_history[-limit:]
+
+        # 从最新的事件向前查找，凑满 limit 条即停止，无需过滤全部历史
+        matched = (e for e in reversed(self.event_history) if e["type"] == event_type)
+        recent_events = list(islice(matched, limit))
+        recent_events.reverse()
+        return recent_events
 
     def get_listener_count(self, event_type: Optional[str] = None) -> Dict[str, int]:
         """获取监听器统计"""
@@ -5,13 +5,14 @@
 
 import json
 import logging
-import pickle
 import threading
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
 
+from .redis_cache import serialize_dataframe, deserialize_dataframe
+
 logger = logging.getLogger("market_data_cache")
 
 
@@ -189,8 +190,8 @@ class MarketDataCache:
         try:
             data = self.redis_client.get(key)
             if data:
-                # 反序列化
-                return pickle.loads(data)
+                # 反序列化（兼容未压缩的旧格式）
+                return deserialize_dataframe(data)
         except Exception as e:
             logger.warning(f"⚠️ Redis读取失败: {key}, {e}")
         return None
@@ -201,8 +202,8 @@ class MarketDataCache:
             return
 
         try:
-            # 序列化
-            serialized = pickle.dumps(data)
+            # 序列化（pickle + zlib 压缩，体积通常缩小数倍）
+            serialized = serialize_dataframe(data)
             self.redis_client.setex(key, self.ttl, serialized)
         except Exception as e:
             logger.warning(f"⚠️ Redis写入失败: {key}, {e}")
@@ -223,8 +224,7 @@ class MarketDataCache:
                 return None
 
             # 读取文件
-            with open(file_path, "rb") as f:
-                return pickle.load(f)
+            return deserialize_dataframe(file_path.read_bytes())
 
         except Exception as e:
             logger.warning(f"⚠️ 文件读取失败: {file_path}, {e}")
@@ -240,8 +240,7 @@ class MarketDataCache:
         file_path = self.cache_dir / f"{key.replace(':', '_')}.pkl"
 
         try:
-            with open(file_path, "wb") as f:
-                pickle.dump(data, f)
+            file_path.write_bytes(serialize_dataframe(data))
         except Exception as e:
             logger.warning(f"⚠️ 文件写入失败: {file_path}, {e}")
 
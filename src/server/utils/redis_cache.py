@@ -3,18 +3,23 @@ Redis缓存管理器
 专门为AKShare全市场数据和基本面数据提供高性能缓存
 """
 
-import functools
 import os
+import sys
 import redis
 import pickle
+import threading
 import time
 import pandas as pd
-import requests
 from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from decimal import Decimal
 import logging
 import json
 import hashlib
+import zlib
+
+from .concurrency import call_with_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,125 @@ try:
 except (ImportError, ModuleNotFoundError):
     get_symbol_processor = None
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 进程内市场快照的有效期（秒）：在此期间直接复用内存中的DataFrame，
+# 不再每次从Redis读取并反序列化整份全市场数据
+LOCAL_SNAPSHOT_TTL = 60
+
+# 市场类型 -> 中文名称（日志展示用）
+MARKET_DISPLAY_NAMES = {"china": "A股", "hk": "港股", "us": "美股"}
+
+# 全市场快照后台刷新间隔（秒）：刷新线程定期把最新快照写入内存与Redis，
+# 读路径直接命中缓存，不必在请求中同步下载全市场数据
+MARKET_REFRESH_INTERVAL = 300
+
+# 后台刷新只在各市场交易时段内进行（交易所时区, 开始, 结束），结束时间略晚于收盘，
+# 保证收盘价被刷新一次；非交易时段快照不再变化，由读路径按缓存过期按需下载
+MARKET_TRADING_SESSIONS = {
+    "china": ("Asia/Shanghai", "09:15", "15:05"),
+    "hk": ("Asia/Hong_Kong", "09:30", "16:15"),
+    "us": ("America/New_York", "09:30", "16:05"),
+}
+
+# 单次下载全市场快照的最长等待时间（秒）
+MARKET_FETCH_TIMEOUT = 300
+
+# 快照写入Redis的时间戳键后缀：多进程共享快照时据此判断是否需要刷新
+MARKET_FETCHED_AT_SUFFIX = ":fetched_at"
+
+# 每个市场在进程内只启动一个后台刷新线程
+_market_refreshers: Dict[str, threading.Thread] = {}
+_market_refreshers_lock = threading.Lock()
+
+# DataFrame 等对象缓存以 pickle + zlib 压缩存储；魔数头用于区分旧的未压缩数据
+DATAFRAME_MAGIC = b"ZPK1"
+DATAFRAME_COMPRESS_LEVEL = 3
+
+
+def _json_default(obj: Any):
+    """JSON 无法直接表示的类型：Decimal 转字符串，日期转ISO格式，numpy标量转原生数值"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps_json(obj: Any):
+    """序列化为JSON，优先使用orjson（支持numpy标量、非字符串键）"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
+
+def serialize_pickle(obj: Any) -> bytes:
+    """序列化任意对象（pickle 后 zlib 压缩，表格类数据通常可压缩数倍）"""
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return DATAFRAME_MAGIC + zlib.compress(payload, DATAFRAME_COMPRESS_LEVEL)
+
+
+def deserialize_pickle(data: bytes) -> Any:
+    """反序列化 serialize_pickle 的结果，兼容未压缩的旧格式 pickle 数据"""
+    if data.startswith(DATAFRAME_MAGIC):
+        data = zlib.decompress(data[len(DATAFRAME_MAGIC) :])
+    return pickle.loads(data)
+
+
+def serialize_dataframe(df: pd.DataFrame) -> bytes:
+    """序列化DataFrame（pickle 后 zlib 压缩，行情数据通常可压缩数倍）"""
+    return serialize_pickle(df)
+
+
+def deserialize_dataframe(data: bytes) -> pd.DataFrame:
+    """反序列化DataFrame，兼容未压缩的旧格式数据"""
+    return deserialize_pickle(data)
+
+
+def _loads_json(data):
+    """反序列化JSON，兼容bytes和str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def build_code_index(
+    market_data: pd.DataFrame, code_column: str = "代码", strip_market_prefix=False
+) -> Dict[str, int]:
+    """
+    为全市场行情表建立 代码 -> 行位置 的索引，重复代码保留第一行
+
+    Args:
+        market_data: 全市场行情DataFrame
+        code_column: 代码列名
+        strip_market_prefix: 是否额外以去掉市场前缀的代码建立索引
+            （东方财富美股代码格式为 105.AAPL），精确代码优先
+
+    Returns:
+        Dict[str, int]: 可直接用于 market_data.iloc 的行位置
+    """
+    # 驻留代码字符串：与同样驻留的查询代码比较时可走指针相等的快速路径
+    codes = [sys.intern(code) for code in market_data[code_column].astype(str)]
+    index: Dict[str, int] = {}
+    for position, code in enumerate(codes):
+        index.setdefault(code, position)
+    if strip_market_prefix:
+        for position, code in enumerate(codes):
+            _, dot, ticker = code.partition(".")
+            if dot:
+                index.setdefault(ticker, position)
+    return index
+
 
 class RedisCache:
     """Redis缓存管理器"""
@@ -76,11 +200,11 @@ class RedisCache:
 
     def _serialize_dataframe(self, df: pd.DataFrame) -> bytes:
         """序列化DataFrame"""
-        return pickle.dumps(df)
+        return serialize_dataframe(df)
 
     def _deserialize_dataframe(self, data: bytes) -> pd.DataFrame:
         """反序列化DataFrame"""
-        return pickle.loads(data)
+        return deserialize_dataframe(data)
 
     def set_market_data(self, data: pd.DataFrame, expire_seconds: int = 86400) -> bool:
         """
@@ -120,7 +244,7 @@ class RedisCache:
                 "expire_seconds": expire_seconds,
             }
             metadata_key = self._get_cache_key("market", "metadata")
-            pipe.set(metadata_key, json.dumps(metadata))
+            pipe.set(metadata_key, _dumps_json(metadata))
             pipe.expire(metadata_key, expire_seconds)
 
             pipe.execute()
@@ -228,7 +352,7 @@ class RedisCache:
             self.redis_client.setex(
                 cache_key,
                 expire_seconds,
-                json.dumps(data_with_meta, ensure_ascii=False),
+                _dumps_json(data_with_meta),
             )
 
             logger.info(f"✅ 基本面数据已缓存: {symbol}，过期时间{expire_seconds}秒")
@@ -256,7 +380,7 @@ class RedisCache:
             cached_data = self.redis_client.get(cache_key)
 
             if cached_data:
-                data_with_meta = json.loads(cached_data)
+                data_with_meta = _loads_json(cached_data)
                 logger.info(f"📖 从Redis获取基本面缓存: {symbol}")
                 return data_with_meta["data"]
             else:
@@ -277,7 +401,7 @@ class RedisCache:
 
             cache_key = self._get_cache_key("info", symbol)
             self.redis_client.setex(
-                cache_key, expire_seconds, json.dumps(info, ensure_ascii=False)
+                cache_key, expire_seconds, _dumps_json(info)
             )
             return True
         except Exception as e:
@@ -294,7 +418,7 @@ class RedisCache:
             cached_data = self.redis_client.get(cache_key)
 
             if cached_data:
-                return json.loads(cached_data)
+                return _loads_json(cached_data)
             return None
         except Exception as e:
             logger.error(f"❌ 获取股票信息缓存失败 {symbol}: {e}")
@@ -381,6 +505,57 @@ class RedisCache:
             logger.error(f"❌ 获取TTL失败: {e}")
             return -2
 
+    def set_raw(self, key: str, payload: bytes, expire_seconds: int = 3600) -> bool:
+        """
+        缓存已序列化的原始字节数据（由调用方负责序列化）
+
+        Args:
+            key: 缓存键
+            payload: 序列化后的字节数据
+            expire_seconds: 缓存过期时间（秒）
+
+        Returns:
+            bool: 是否缓存成功
+        """
+        try:
+            if not self.connected:
+                self._memory_cache[key] = {
+                    "data": payload,
+                    "timestamp": time.time(),
+                    "expire_seconds": expire_seconds,
+                }
+                return True
+
+            self.redis_client.setex(key, expire_seconds, payload)
+            return True
+        except Exception as e:
+            logger.error(f"❌ 缓存原始数据失败 {key}: {e}")
+            return False
+
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        获取缓存的原始字节数据（由调用方负责反序列化）
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[bytes]: 原始字节数据，如果缓存不存在或过期则返回None
+        """
+        try:
+            if not self.connected:
+                cached = self._memory_cache.get(key)
+                if cached:
+                    if time.time() - cached["timestamp"] < cached["expire_seconds"]:
+                        return cached["data"]
+                    del self._memory_cache[key]
+                return None
+
+            return self.redis_client.get(key)
+        except Exception as e:
+            logger.error(f"❌ 获取原始缓存失败 {key}: {e}")
+            return None
+
 
 # 全局缓存实例
 _redis_cache = None
@@ -394,6 +569,13 @@ def get_redis_cache() -> RedisCache:
     return _redis_cache
 
 
+def _in_trading_session(market_type: str) -> bool:
+    """当前是否处于该市场的交易时段（按交易所时区的工作日与时段判断）"""
+    tz_name, session_start, session_end = MARKET_TRADING_SESSIONS[market_type]
+    now = datetime.now(ZoneInfo(tz_name))
+    return now.weekday() < 5 and session_start <= now.strftime("%H:%M") <= session_end
+
+
 class AKShareMarketCache:
     """AKShare多市场数据缓存管理器（专门优化性能）"""
 
@@ -417,6 +599,55 @@ class AKShareMarketCache:
         # 不同市场的获取时间和内存备份
         self._last_fetch_time = {"china": 0, "hk": 0, "us": 0}
         self._memory_backup = {"china": None, "hk": None, "us": None}
+        # 内存备份最近一次与Redis/数据源同步的时间
+        self._backup_synced_at = {"china": 0, "hk": 0, "us": 0}
+        # 每个市场一把锁，缓存全部未命中时只允许一个线程下载全市场数据
+        self._fetch_locks = {market: threading.Lock() for market in self.cache_keys}
+
+        # 各市场"代码"列索引: market_type -> (建索引时的DataFrame, {代码: 行位置})
+        self._code_index: Dict[str, tuple] = {}
+
+    def start_background_refresh(
+        self, market_type: str, interval: int = MARKET_REFRESH_INTERVAL
+    ) -> None:
+        """
+        启动后台线程预热并定期刷新指定市场的全市场快照（每个进程每个市场只启动一次）
+
+        Args:
+            market_type: 市场类型 ("china", "hk", "us")
+            interval: 刷新间隔（秒）
+        """
+        market_name = MARKET_DISPLAY_NAMES[market_type]
+
+        def refresh_loop():
+            # 启动时先预热一次（Redis中已有快照则直接复用），首个请求无需同步下载
+            try:
+                self._get_market_data_by_type(market_type)
+            except Exception as e:
+                logger.warning(f"⚠️ 预热{market_name}快照失败: {e}")
+
+            while True:
+                time.sleep(interval)
+                # 非交易时段不刷新；其他进程刚写入的快照也无需重复下载
+                if not _in_trading_session(market_type):
+                    continue
+                if self._snapshot_age(market_type) < interval:
+                    continue
+                try:
+                    with self._fetch_locks[market_type]:
+                        self._fetch_fresh_data_by_type(market_type)
+                except Exception as e:
+                    logger.warning(f"⚠️ 后台刷新{market_name}快照失败: {e}")
+
+        with _market_refreshers_lock:
+            if market_type in _market_refreshers:
+                return
+            thread = threading.Thread(
+                target=refresh_loop, name=f"akshare_market_{market_type}", daemon=True
+            )
+            thread.start()
+            _market_refreshers[market_type] = thread
+            logger.info(f"🔄 {market_name}快照后台刷新已启动，间隔{interval}秒")
 
     def get_china_market_data(self) -> Optional[pd.DataFrame]:
         """
@@ -456,31 +687,43 @@ class AKShareMarketCache:
             DataFrame: 对应市场的股票数据
         """
         cache_key = self.cache_keys[market_type]
+        current_time = time.time()
+
+        # 内存快照刚同步过，直接复用，省去Redis往返和整表反序列化
+        if (
+            self._memory_backup[market_type] is not None
+            and current_time - self._backup_synced_at[market_type] < LOCAL_SNAPSHOT_TTL
+        ):
+            return self._memory_backup[market_type]
 
-        # 先尝试从Redis缓存获取
+        # 再尝试从Redis缓存获取
         cached_data = self._get_market_data_from_redis(cache_key)
         if cached_data is not None:
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.info(
                 f"📋 使用Redis缓存的{market_name}数据: {len(cached_data)}只股票"
             )
             self._memory_backup[market_type] = cached_data  # 更新内存备份
+            self._backup_synced_at[market_type] = current_time
             return cached_data
 
         # Redis缓存未命中，检查内存备份
-        current_time = time.time()
         if (
             self._memory_backup[market_type] is not None
             and current_time - self._last_fetch_time[market_type] < self.cache_duration
         ):
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.info(
                 f"📋 使用内存备份的{market_name}数据: {len(self._memory_backup[market_type])}只股票"
             )
             return self._memory_backup[market_type]
 
         # 所有缓存都未命中，从AKShare获取数据
-        return self._fetch_fresh_data_by_type(market_type)
+        with self._fetch_locks[market_type]:
+            # 等锁期间其他线程可能已完成下载，直接复用其结果
+            if self._backup_synced_at[market_type] > current_time:
+                return self._memory_backup[market_type]
+            return self._fetch_fresh_data_by_type(market_type)
 
     def _get_market_data_from_redis(self, cache_key: str) -> Optional[pd.DataFrame]:
         """从Redis获取市场数据"""
@@ -496,55 +739,49 @@ class AKShareMarketCache:
             logger.error(f"❌ 从Redis获取数据失败: {e}")
             return None
 
-    def _temporary_akshare_timeout(self, timeout: int):
-        """
-        一个上下文管理器，用于临时修改akshare（底层requests）的超时时间。
-        """
-        original_get = requests.get
-
-        @functools.wraps(original_get)
-        def new_get(*args, **kwargs):
-            # 如果调用方没有指定超时，则使用我们设置的超时
-            if "timeout" not in kwargs:
-                kwargs["timeout"] = timeout
-            return original_get(*args, **kwargs)
-
-        class TimeoutContext:
-            def __enter__(self):
-                logger.info(f"🔧 临时将AKShare网络请求超时设置为 {timeout} 秒...")
-                requests.get = new_get
-
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                logger.info("🔧 恢复AKShare原始网络请求设置...")
-                requests.get = original_get
-
-        return TimeoutContext()
+    def _snapshot_age(self, market_type: str) -> float:
+        """距最近一次下载快照的秒数（取本进程与Redis中记录的较新者）"""
+        now = time.time()
+        age = now - self._last_fetch_time[market_type]
+        try:
+            if self.redis_cache.connected:
+                fetched_at = self.redis_cache.redis_client.get(
+                    self.cache_keys[market_type] + MARKET_FETCHED_AT_SUFFIX
+                )
+                if fetched_at:
+                    age = min(age, now - float(fetched_at))
+        except Exception as e:
+            logger.debug(f"读取快照时间戳失败: {e}")
+        return age
 
     def _fetch_fresh_data_by_type(self, market_type: str) -> Optional[pd.DataFrame]:
         """根据市场类型从AKShare获取新数据"""
         try:
             import akshare as ak
 
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.info(f"🔄 从AKShare获取{market_name}全市场数据...")
-            with self._temporary_akshare_timeout(300):
-                start_time = time.time()
-
-                # 根据市场类型调用不同的AKShare接口
-                if market_type == "china":
-                    market_data = ak.stock_zh_a_spot_em()
-                elif market_type == "hk":
-                    market_data = ak.stock_hk_spot_em()
-                elif market_type == "us":
-                    market_data = ak.stock_us_spot_em()
-                else:
-                    logger.error(f"❌ 不支持的市场类型: {market_type}")
-                    return None
+            start_time = time.time()
+
+            # 根据市场类型调用不同的AKShare接口
+            if market_type == "china":
+                fetch = ak.stock_zh_a_spot_em
+            elif market_type == "hk":
+                fetch = ak.stock_hk_spot_em
+            elif market_type == "us":
+                fetch = ak.stock_us_spot_em
+            else:
+                logger.error(f"❌ 不支持的市场类型: {market_type}")
+                return None
+
+            # 显式限制整次下载的等待时间，而不是临时替换全局的 requests.get
+            market_data = call_with_timeout(MARKET_FETCH_TIMEOUT, fetch)
 
             if market_data is not None and not market_data.empty:
                 # 更新缓存时间
                 self._last_fetch_time[market_type] = time.time()
                 self._memory_backup[market_type] = market_data
+                self._backup_synced_at[market_type] = self._last_fetch_time[market_type]
 
                 # 缓存到Redis
                 if self.redis_cache.connected:
@@ -578,6 +815,9 @@ class AKShareMarketCache:
             pipe = self.redis_cache.redis_client.pipeline()
             pipe.set(cache_key, serialized_data)
             pipe.expire(cache_key, expire_seconds)
+            pipe.set(
+                cache_key + MARKET_FETCHED_AT_SUFFIX, time.time(), ex=expire_seconds
+            )
             pipe.execute()
 
             return True
@@ -661,27 +901,16 @@ class AKShareMarketCache:
             return None
 
         if market_data is None or market_data.empty:
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.warning(f"⚠️ 无法获取{market_name}全市场数据")
             return None
 
         # 查找指定股票
         try:
-            # 对于美股，需要特殊处理代码格式匹配
-            if market_type == "us":
-                # 美股代码格式：105.AAPL, 106.MSFT 等
-                # 尝试多种匹配方式
-                pattern = f".{symbol}"
-                stock_data = market_data[market_data["代码"].str.endswith(pattern)]
-                if stock_data.empty:
-                    # 尝试直接匹配（用户可能传入完整格式）
-                    stock_data = market_data[market_data["代码"] == symbol]
-            else:
-                # A股和港股使用精确匹配
-                stock_data = market_data[market_data["代码"] == symbol]
+            position = self._get_code_index(market_type, market_data).get(symbol)
 
-            if stock_data.empty:
-                market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            if position is None:
+                market_name = MARKET_DISPLAY_NAMES[market_type]
                 if market_type == "us":
                     logger.warning(
                         f"⚠️ 未找到{market_name}股票 {symbol} 的市场数据，"
@@ -692,8 +921,8 @@ class AKShareMarketCache:
                 return None
 
             # 转换为字典
-            stock_info = stock_data.iloc[0].to_dict()
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            stock_info = market_data.iloc[position].to_dict()
+            market_name = MARKET_DISPLAY_NAMES[market_type]
 
             # 根据不同市场显示不同的关键指标
             if market_type == "china":
@@ -712,10 +941,35 @@ class AKShareMarketCache:
             return stock_info
 
         except Exception as e:
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.error(f"❌ 提取{market_name}股票数据失败: {symbol}, 错误: {e}")
             return None
 
+    def _get_code_index(
+        self,
+        market_type: str,
+        market_data: pd.DataFrame,
+        strip_market_prefix: Optional[bool] = None,
+    ) -> Dict[str, int]:
+        """
+        获取"代码"列到行位置的索引，同一份市场数据只构建一次
+
+        Args:
+            market_type: 市场类型 ("china", "hk", "us")
+            market_data: 该市场的全市场行情数据
+            strip_market_prefix: 是否额外以去掉市场前缀的代码建立索引，默认仅美股
+                （代码格式为 105.AAPL），精确代码优先于去前缀代码
+        """
+        cached = self._code_index.get(market_type)
+        if cached is not None and cached[0] is market_data:
+            return cached[1]
+
+        if strip_market_prefix is None:
+            strip_market_prefix = market_type == "us"
+        index = build_code_index(market_data, strip_market_prefix=strip_market_prefix)
+        self._code_index[market_type] = (market_data, index)
+        return index
+
     def get_multiple_stocks_data(
         self, market_type: str, symbols: List[str]
     ) -> Dict[str, dict]:
@@ -745,19 +999,27 @@ class AKShareMarketCache:
 
         results = {}
         try:
+            code_index = self._get_code_index(market_type, market_data)
+            found = []
             for symbol in symbols:
-                stock_data = market_data[market_data["代码"] == symbol]
-                if not stock_data.empty:
-                    results[symbol] = stock_data.iloc[0].to_dict()
-
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+                position = code_index.get(symbol)
+                if position is not None:
+                    found.append((symbol, position))
+            if found:
+                # 一次取出所有命中的行再整体转换，避免逐行构造 Series
+                positions = [position for _, position in found]
+                records = market_data.iloc[positions].to_dict("records")
+                for (symbol, _), record in zip(found, records):
+                    results[symbol] = record
+
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.info(
                 f"✅ 批量获取{market_name}股票数据: {len(results)}/{len(symbols)} 成功"
             )
             return results
 
         except Exception as e:
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.error(f"❌ 批量获取{market_name}股票数据失败: {e}")
             return {}
 
@@ -791,8 +1053,9 @@ class AKShareMarketCache:
 
             self._memory_backup[market_type] = None
             self._last_fetch_time[market_type] = 0
+            self._backup_synced_at[market_type] = 0
 
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             if redis_result:
                 logger.info(f"🗑️ {market_name}缓存已清除（Redis + 内存）")
             return redis_result
@@ -868,14 +1131,14 @@ class AKShareMarketCache:
             # 刷新所有市场
             results = {}
             for mtype in ["china", "hk", "us"]:
-                market_name = {"china": "A股", "hk": "港股", "us": "美股"}[mtype]
+                market_name = MARKET_DISPLAY_NAMES[mtype]
                 logger.info(f"🔄 强制刷新{market_name}数据缓存...")
                 self._clear_single_market_cache(mtype)
                 results[mtype] = self._fetch_fresh_data_by_type(mtype)
             return results
         else:
             # 刷新指定市场
-            market_name = {"china": "A股", "hk": "港股", "us": "美股"}[market_type]
+            market_name = MARKET_DISPLAY_NAMES[market_type]
             logger.info(f"🔄 强制刷新{market_name}数据缓存...")
             self._clear_single_market_cache(market_type)
             result = self._fetch_fresh_data_by_type(market_type)
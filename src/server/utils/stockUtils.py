@@ -1,6 +1,4 @@
 # app/utils/stockUtils.py
-import pandas as pd
-import tushare as ts
 from typing import Dict, Optional
 from datetime import datetime
 from .stock_market_classifier import classify_stock
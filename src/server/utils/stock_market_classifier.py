@@ -4,7 +4,7 @@
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Pattern, Tuple
 from enum import Enum
 
 
@@ -56,6 +56,36 @@ class BoardType(Enum):
     UNKNOWN_BOARD = "未知板块"
 
 
+# 市场 -> 货币
+MARKET_CURRENCIES = {
+    MarketType.A_STOCK: "CNY",
+    MarketType.HK_STOCK: "HKD",
+    MarketType.US_STOCK: "USD",
+    MarketType.UNKNOWN: "UNKNOWN",
+}
+
+# 可识别的其他A股后缀与美股后缀
+OTHER_A_STOCK_SUFFIXES = (".SS", ".XSHE", ".XSHG")
+US_SYMBOL_SUFFIXES = (".NMS", ".NASDAQ", ".NYSE", ".US")
+
+# 代码后缀 -> (市场, 要求的交易所)：.SH/.SZ 需与代码规则判断的交易所一致
+SUFFIX_CLASSIFICATION = {
+    ".HK": ("hk", None),
+    ".SH": ("a_stock", ExchangeType.SSE.value),
+    ".SZ": ("a_stock", ExchangeType.SZSE.value),
+    **{suffix: ("a_stock", None) for suffix in OTHER_A_STOCK_SUFFIXES},
+    **{suffix: ("us", None) for suffix in US_SYMBOL_SUFFIXES},
+}
+
+# 市场 -> 中文名称
+MARKET_NAMES = {
+    MarketType.A_STOCK: "中国A股",
+    MarketType.HK_STOCK: "香港股市",
+    MarketType.US_STOCK: "美国股市",
+    MarketType.UNKNOWN: "未知市场",
+}
+
+
 class StockMarketClassifier:
     """股票市场分类器"""
 
@@ -179,6 +209,16 @@ class StockMarketClassifier:
             },
         }
 
+        # 预编译正则，避免每次分类都经过 re 模块的模式缓存查找
+        self._a_stock_rules = self._compile_rules(self.a_stock_patterns)
+        self._hk_stock_rules = self._compile_rules(self.hk_stock_patterns)
+        self._us_stock_rules = self._compile_rules(self.us_stock_patterns)
+
+    @staticmethod
+    def _compile_rules(patterns: Dict[str, Dict]) -> List[Tuple[Pattern, Dict]]:
+        """将 {正则字符串: 信息} 规则表编译为 [(已编译正则, 信息)]"""
+        return [(re.compile(pattern), info) for pattern, info in patterns.items()]
+
     def classify_stock(self, symbol: str) -> Dict:
         """
         对股票代码进行市场分类
@@ -197,12 +237,14 @@ class StockMarketClassifier:
                 symbol,
             )
 
-        # 清理和标准化输入
+        # 清理和标准化输入（只做一次大写转换，后续判断都基于 cleaned_symbol）
         original_symbol = symbol
         cleaned_symbol = self._clean_symbol(symbol)
 
         # 1. 检查是否已包含市场后缀
-        market_info = self._check_suffix_based_classification(symbol)
+        market_info = self._check_suffix_based_classification(
+            cleaned_symbol, original_symbol
+        )
         if market_info:
             return market_info
 
@@ -235,55 +277,49 @@ class StockMarketClassifier:
         """清理股票代码"""
         return symbol.strip().upper()
 
-    def _check_suffix_based_classification(self, symbol: str) -> Optional[Dict]:
-        """基于后缀进行分类"""
-        symbol_upper = symbol.upper()
-
-        # 港股后缀
-        if symbol_upper.endswith(".HK"):
-            clean_code = symbol_upper.replace(".HK", "")
-            hk_info = self._classify_hk_stock(clean_code)
-            if hk_info:
-                hk_info["original_symbol"] = symbol
-                return hk_info
-
-        # A股后缀
-        if symbol_upper.endswith(".SH"):
-            clean_code = symbol_upper.replace(".SH", "")
-            a_info = self._classify_a_stock(clean_code)
-            if a_info and a_info["exchange"] == ExchangeType.SSE.value:
-                a_info["original_symbol"] = symbol
-                return a_info
-
-        if symbol_upper.endswith(".SZ"):
-            clean_code = symbol_upper.replace(".SZ", "")
-            a_info = self._classify_a_stock(clean_code)
-            if a_info and a_info["exchange"] == ExchangeType.SZSE.value:
-                a_info["original_symbol"] = symbol
-                return a_info
-
-        # 其他A股后缀
-        for suffix in [".SS", ".XSHE", ".XSHG"]:
-            if symbol_upper.endswith(suffix):
-                clean_code = symbol_upper.replace(suffix, "")
-                return self._classify_a_stock(clean_code)
-
-        # 美股后缀处理
-        us_suffixes = [".NMS", ".NASDAQ", ".NYSE", ".US"]
-        for suffix in us_suffixes:
-            if symbol_upper.endswith(suffix):
-                clean_code = symbol_upper.replace(suffix, "")
-                us_info = self._classify_us_stock(clean_code)
-                if us_info:
-                    us_info["original_symbol"] = symbol
-                    return us_info
+    def _check_suffix_based_classification(
+        self, symbol_upper: str, symbol: str
+    ) -> Optional[Dict]:
+        """
+        基于后缀进行分类
 
-        return None
+        Args:
+            symbol_upper: 已清理并转为大写的股票代码
+            symbol: 原始股票代码（写入 original_symbol）
+        """
+        # 只取最后一个"."之后的后缀查表，不再逐个后缀 endswith 比较
+        dot = symbol_upper.rfind(".")
+        if dot < 0:
+            return None
+        rule = SUFFIX_CLASSIFICATION.get(symbol_upper[dot:])
+        if rule is None:
+            return None
+
+        market, required_exchange = rule
+        clean_code = symbol_upper[:dot]
+        if market == "hk":
+            info = self._classify_hk_stock(clean_code)
+        elif market == "us":
+            info = self._classify_us_stock(clean_code)
+        else:
+            info = self._classify_a_stock(clean_code)
+            if required_exchange is None:
+                # 其他A股后缀（.SS/.XSHE/.XSHG）不校验交易所
+                return info
+            if info and info["exchange"] != required_exchange:
+                return None
+
+        if info:
+            info["original_symbol"] = symbol
+        return info
 
     def _classify_a_stock(self, symbol: str) -> Optional[Dict]:
         """分类A股"""
-        for pattern, info in self.a_stock_patterns.items():
-            if re.match(pattern, symbol):
+        # A股规则均为6位纯数字，先做廉价预检
+        if len(symbol) != 6 or not symbol.isdigit():
+            return None
+        for pattern, info in self._a_stock_rules:
+            if pattern.match(symbol):
                 return self._create_result(
                     MarketType.A_STOCK,
                     info["exchange"],
@@ -299,8 +335,8 @@ class StockMarketClassifier:
         if symbol.isdigit():
             if len(symbol) <= 5:
                 padded_symbol = symbol.zfill(5)
-                for pattern, info in self.hk_stock_patterns.items():
-                    if re.match(pattern, padded_symbol):
+                for pattern, info in self._hk_stock_rules:
+                    if pattern.match(padded_symbol):
                         return self._create_result(
                             MarketType.HK_STOCK,
                             info["exchange"],
@@ -312,8 +348,8 @@ class StockMarketClassifier:
 
     def _classify_us_stock(self, symbol: str) -> Optional[Dict]:
         """分类美股"""
-        for pattern, info in self.us_stock_patterns.items():
-            if re.match(pattern, symbol):
+        for pattern, info in self._us_stock_rules:
+            if pattern.match(symbol):
                 # 根据字母数量判断交易所 (简化规则)
                 exchange = (
                     ExchangeType.NASDAQ if len(symbol) >= 4 else ExchangeType.NYSE
@@ -355,23 +391,11 @@ class StockMarketClassifier:
 
     def _get_currency(self, market: MarketType) -> str:
         """获取市场货币"""
-        currency_map = {
-            MarketType.A_STOCK: "CNY",
-            MarketType.HK_STOCK: "HKD",
-            MarketType.US_STOCK: "USD",
-            MarketType.UNKNOWN: "UNKNOWN",
-        }
-        return currency_map.get(market, "UNKNOWN")
+        return MARKET_CURRENCIES.get(market, "UNKNOWN")
 
     def _get_market_name(self, market: MarketType) -> str:
         """获取市场中文名称"""
-        name_map = {
-            MarketType.A_STOCK: "中国A股",
-            MarketType.HK_STOCK: "香港股市",
-            MarketType.US_STOCK: "美国股市",
-            MarketType.UNKNOWN: "未知市场",
-        }
-        return name_map.get(market, "未知市场")
+        return MARKET_NAMES.get(market, "未知市场")
 
     def is_china_stock(self, symbol: str) -> bool:
         """判断是否为中国股票(A股)"""
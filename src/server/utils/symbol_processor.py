@@ -4,8 +4,63 @@
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple
-from .stock_market_classifier import get_stock_classifier, MarketType, ExchangeType
+from .stock_market_classifier import (
+    get_stock_classifier,
+    MarketType,
+    ExchangeType,
+    US_SYMBOL_SUFFIXES,
+)
+
+# A股代码首位 -> 交易所简称（6=上交所, 0/3=深交所, 8=北交所）
+A_SHARE_EXCHANGE_BY_PREFIX = {"6": "SH", "0": "SZ", "3": "SZ", "8": "BJ"}
+
+
+def get_china_exchange(code: str) -> Optional[str]:
+    """根据6位A股代码的首位判断交易所，无法判断时返回None"""
+    if len(code) != 6:
+        return None
+    return A_SHARE_EXCHANGE_BY_PREFIX.get(code[0])
+
+
+# 可去除的交易所后缀（不含"."，大写）
+SYMBOL_SUFFIXES = frozenset(
+    {
+        "SH", "SZ", "BJ", "SS", "XSHE", "XSHG",  # A股后缀
+        "HK",  # 港股后缀
+        "US", "NASDAQ", "NYSE", "NMS",  # 美股后缀
+    }
+)
+
+# 代码分类/处理结果的缓存容量（活跃代码通常只有几百个）
+SYMBOL_CACHE_SIZE = 4096
+
+# 简化市场名称 -> 分类结果中的市场标记字段
+MARKET_FLAG_BY_NAME = {"china": "is_china", "hk": "is_hk", "us": "is_us"}
+
+# 各市场的数据源策略（数据源列表为不可变元组，可安全共享）
+DATA_SOURCE_STRATEGIES = {
+    "china": {
+        "fundamentals": ("tushare", "akshare"),
+        "market_data": ("tushare", "akshare"),
+        "news": ("akshare", "eastmoney", "sina"),
+        "priority": "tushare",
+    },
+    "hk": {
+        "fundamentals": ("tushare", "akshare", "yfinance"),
+        "market_data": ("tushare", "akshare", "yfinance"),
+        "news": ("akshare", "yfinance", "rss"),
+        "priority": "tushare",
+    },
+    "us": {
+        "fundamentals": ("yfinance", "akshare"),
+        "market_data": ("yfinance", "akshare"),
+        "news": ("yfinance", "finnhub", "alpha_vantage", "newsapi"),
+        "priority": "yfinance",
+    },
+}
 
 
 class StockSymbolProcessor:
@@ -13,6 +68,13 @@ class StockSymbolProcessor:
 
     def __init__(self):
         self.classifier = get_stock_classifier()
+        # 分类与格式转换都是纯函数，按代码缓存结果；分类结果仅供内部只读使用
+        self._classify = lru_cache(maxsize=SYMBOL_CACHE_SIZE)(
+            self.classifier.classify_stock
+        )
+        self._process_symbol_cached = lru_cache(maxsize=SYMBOL_CACHE_SIZE)(
+            self._process_symbol
+        )
 
     def process_symbol(self, symbol: str) -> Dict:
         """
@@ -24,8 +86,18 @@ class StockSymbolProcessor:
         Returns:
             Dict: 包含分类、标准化后的各种格式
         """
+        cached = self._process_symbol_cached(symbol)
+        # 返回副本，避免调用方修改缓存中的结果
+        return {
+            **cached,
+            "formats": dict(cached["formats"]),
+            "data_sources": dict(cached["data_sources"]),
+        }
+
+    def _process_symbol(self, symbol: str) -> Dict:
+        """处理股票代码（未缓存版本）"""
         # 基础分类
-        classification = self.classifier.classify_stock(symbol)
+        classification = self._classify(symbol)
 
         # 生成各种标准化格式
         formats = self._generate_all_formats(symbol, classification)
@@ -45,20 +117,21 @@ class StockSymbolProcessor:
         return result
 
     def _generate_all_formats(self, symbol: str, classification: Dict) -> Dict:
-        """生成所有需要的代码格式"""
+        """生成所有需要的代码格式（驻留字符串，作为缓存/索引键时比较更快）"""
         return {
-            "tushare": self.get_tushare_format(symbol, classification),
-            "akshare": self.get_akshare_format(symbol, classification),
-            "yfinance": self.get_yfinance_format(symbol, classification),
-            "news_api": self.get_news_api_format(symbol, classification),
-            "cache_key": self.get_cache_key(symbol, classification),
+            "tushare": sys.intern(self.get_tushare_format(symbol, classification)),
+            "akshare": sys.intern(self.get_akshare_format(symbol, classification)),
+            "yfinance": sys.intern(self.get_yfinance_format(symbol, classification)),
+            "news_api": sys.intern(self.get_news_api_format(symbol, classification)),
+            "cache_key": sys.intern(self.get_cache_key(symbol, classification)),
             "display": self.get_display_format(symbol, classification),
         }
 
     def get_tushare_format(self, symbol: str, classification: Dict = None) -> str:
         """获取Tushare API格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            # 未传入分类时直接取按代码缓存的转换结果
+            return self._process_symbol_cached(symbol)["formats"]["tushare"]
 
         if classification["is_china"]:
             # A股：确保有交易所后缀
@@ -66,13 +139,9 @@ class StockSymbolProcessor:
             if "." in symbol and symbol.count(".") == 1:
                 return symbol
 
-            if clean_code.isdigit() and len(clean_code) == 6:
-                if clean_code.startswith(("60", "68")):
-                    return f"{clean_code}.SH"
-                elif clean_code.startswith(("00", "30")):
-                    return f"{clean_code}.SZ"
-                elif clean_code.startswith("8"):
-                    return f"{clean_code}.BJ"
+            exchange = get_china_exchange(clean_code)
+            if exchange and clean_code.isdigit():
+                return f"{clean_code}.{exchange}"
             return symbol
 
         elif classification["is_hk"]:
@@ -89,7 +158,8 @@ class StockSymbolProcessor:
     def get_akshare_format(self, symbol: str, classification: Dict = None) -> str:
         """获取AKShare API格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            # 未传入分类时直接取按代码缓存的转换结果
+            return self._process_symbol_cached(symbol)["formats"]["akshare"]
 
         if classification["is_china"]:
             # A股：纯数字代码
@@ -109,12 +179,13 @@ class StockSymbolProcessor:
     def get_yfinance_format(self, symbol: str, classification: Dict = None) -> str:
         """获取YFinance API格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            # 未传入分类时直接取按代码缓存的转换结果
+            return self._process_symbol_cached(symbol)["formats"]["yfinance"]
 
         if classification["is_china"]:
             # A股：添加Yahoo Finance后缀
             clean_code = self._extract_base_code(symbol)
-            if clean_code.startswith(("60", "68")):
+            if get_china_exchange(clean_code) == "SH":
                 return f"{clean_code}.SS"  # 上交所
             else:
                 return f"{clean_code}.SZ"  # 深交所
@@ -145,7 +216,8 @@ class StockSymbolProcessor:
     def get_news_api_format(self, symbol: str, classification: Dict = None) -> str:
         """获取新闻API格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            # 未传入分类时直接取按代码缓存的转换结果
+            return self._process_symbol_cached(symbol)["formats"]["news_api"]
 
         if classification["is_china"]:
             # A股新闻：纯数字代码
@@ -165,8 +237,7 @@ class StockSymbolProcessor:
             # 美股新闻：纯代码，去除所有后缀
             clean_code = self._extract_base_code(symbol).upper()
             # 移除常见美股后缀
-            us_suffixes = [".US", ".NASDAQ", ".NYSE", ".NMS"]
-            for suffix in us_suffixes:
+            for suffix in US_SYMBOL_SUFFIXES:
                 if clean_code.endswith(suffix):
                     clean_code = clean_code.replace(suffix, "")
                     break
@@ -175,7 +246,7 @@ class StockSymbolProcessor:
     def get_cache_key(self, symbol: str, classification: Dict = None) -> str:
         """获取缓存键格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            classification = self._classify(symbol)
 
         clean_code = self._extract_base_code(symbol)
 
@@ -196,17 +267,14 @@ class StockSymbolProcessor:
     def get_display_format(self, symbol: str, classification: Dict = None) -> str:
         """获取显示格式的代码"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            classification = self._classify(symbol)
 
         if classification["is_china"]:
             # A股显示：代码 + 交易所
             clean_code = self._extract_base_code(symbol)
-            if clean_code.startswith(("60", "68")):
-                return f"{clean_code}(SH)"
-            elif clean_code.startswith(("00", "30")):
-                return f"{clean_code}(SZ)"
-            elif clean_code.startswith("8"):
-                return f"{clean_code}(BJ)"
+            exchange = get_china_exchange(clean_code)
+            if exchange:
+                return f"{clean_code}({exchange})"
             return clean_code
 
         elif classification["is_hk"]:
@@ -226,57 +294,28 @@ class StockSymbolProcessor:
             return ""
 
         # 去除常见后缀
-        suffixes = [
-            ".SH",
-            ".SZ",
-            ".BJ",
-            ".SS",
-            ".XSHE",
-            ".XSHG",  # A股后缀
-            ".HK",
-            ".hk",  # 港股后缀
-            ".US",
-            ".NASDAQ",
-            ".NYSE",
-            ".NMS",  # 美股后缀
-        ]
-
         clean_symbol = symbol.strip().upper()
-        for suffix in suffixes:
-            if clean_symbol.endswith(suffix.upper()):
-                clean_symbol = clean_symbol[: -len(suffix)]
-                break
+        base, dot, suffix = clean_symbol.rpartition(".")
+        if dot and suffix in SYMBOL_SUFFIXES:
+            clean_symbol = base
 
         return clean_symbol
 
     def _get_data_source_strategy(self, classification: Dict) -> Dict:
         """根据市场类型获取数据源策略"""
         if classification["is_china"]:
-            return {
-                "fundamentals": ["tushare", "akshare"],
-                "market_data": ["tushare", "akshare"],
-                "news": ["akshare", "eastmoney", "sina"],
-                "priority": "tushare",
-            }
+            strategy = DATA_SOURCE_STRATEGIES["china"]
         elif classification["is_hk"]:
-            return {
-                "fundamentals": ["tushare", "akshare", "yfinance"],
-                "market_data": ["tushare", "akshare", "yfinance"],
-                "news": ["akshare", "yfinance", "rss"],
-                "priority": "tushare",
-            }
+            strategy = DATA_SOURCE_STRATEGIES["hk"]
         else:  # US market
-            return {
-                "fundamentals": ["yfinance", "akshare"],
-                "market_data": ["yfinance", "akshare"],
-                "news": ["yfinance", "finnhub", "alpha_vantage", "newsapi"],
-                "priority": "yfinance",
-            }
+            strategy = DATA_SOURCE_STRATEGIES["us"]
+        # 浅拷贝，避免调用方修改共享的策略表
+        return dict(strategy)
 
     def get_market_simple_name(self, symbol: str, classification: Dict = None) -> str:
         """获取简化的市场名称"""
         if classification is None:
-            classification = self.classifier.classify_stock(symbol)
+            classification = self._classify(symbol)
 
         if classification["is_china"]:
             return "china"
@@ -310,7 +349,7 @@ class StockSymbolProcessor:
             result["errors"].append("股票代码不能为空")
             return result
 
-        classification = self.classifier.classify_stock(symbol)
+        classification = self._classify(symbol)
 
         if classification["market"] == "未知":
             result["errors"].append("无法识别的股票代码格式")
@@ -321,10 +360,8 @@ class StockSymbolProcessor:
 
         # 如果指定了期望市场，进行验证
         if expected_market:
-            expected_map = {"china": "is_china", "hk": "is_hk", "us": "is_us"}
-            if expected_market in expected_map and not classification.get(
-                expected_map[expected_market], False
-            ):
+            market_flag = MARKET_FLAG_BY_NAME.get(expected_market)
+            if market_flag and not classification.get(market_flag, False):
                 result["is_valid"] = False
                 result["errors"].append(f"股票代码不属于{expected_market}市场")
 